@@ -0,0 +1,170 @@
+"""
+Checks and benchmark for the loader Database bulk-insert methods.
+Run from the jupyter directory: python test_bulk_insert.py
+
+insert_athlete_results / insert_relay_results write a whole meet with one
+executemany per table inside a single transaction, instead of one INSERT
+(and, with the default commit=True, one commit) per row. The benchmark copies
+Track.db to a temp directory, adds two secondary indexes like a production
+DB might, and reloads the 2025 Boys state meet and the whole 2025 Boys
+sectional round under new meet ids four ways:
+
+  per-row commit   insert_*_result(..., commit=True)
+  per-row          existence check + insert_*_result(..., commit=False), one commit
+                   (the MileSplit loader before the port)
+  bulk             insert_*_results(rows)
+  bulk deferred    insert_*_results(rows, defer_indexes=True)
+
+Rebuilding a deferred index scans the whole table, so against a full Track.db
+"bulk deferred" is expected to trail plain "bulk" for a single meet.
+"""
+
+import itertools
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from util.db_util import Database
+
+SOURCE_DB = os.path.join("..", "web", "data", "Track.db")
+INDEXES = (
+    "CREATE INDEX ix_bench_athlete_result_event ON athlete_result (event, result2)",
+    "CREATE INDEX ix_bench_relay_result_event ON relay_result (event, result2)",
+)
+
+
+def meet_rows(db, meet_ids):
+    placeholders = ",".join("?" * len(meet_ids))
+    athletes = db.cursor.execute(
+        f"SELECT athlete_id, meet_id, event, result_type, grade, result, result2, place "
+        f"FROM athlete_result WHERE meet_id IN ({placeholders})",
+        meet_ids,
+    ).fetchall()
+    relays = db.cursor.execute(
+        f"SELECT school_id, meet_id, event, result, result2, place, athlete_names "
+        f"FROM relay_result WHERE meet_id IN ({placeholders})",
+        meet_ids,
+    ).fetchall()
+    return athletes, relays
+
+
+SCRATCH_YEARS = itertools.count(1900)
+
+
+def new_meets(db, source_ids, label):
+    """A fresh meet per source meet, in an unused year; returns {source meet_id: new meet_id}."""
+    year = next(SCRATCH_YEARS)
+    mapping = {}
+    for num, source_id in enumerate(source_ids, start=1):
+        db.insert_meet(f"{label} {source_id}", "Sectional", num, year, "Boys", commit=False)
+        mapping[source_id] = db.get_meet_id("Sectional", num, year, "Boys")
+    return mapping
+
+
+def remap(athletes, relays, mapping):
+    return (
+        [(r[0], mapping[r[1]]) + tuple(r[2:]) for r in athletes],
+        [(r[0], mapping[r[1]]) + tuple(r[2:]) for r in relays],
+    )
+
+
+def load_per_row(db, athletes, relays, commit):
+    for row in athletes:
+        if not commit and db.get_athlete_result(row[0], row[1], row[2], row[3]) is not None:
+            continue
+        db.insert_athlete_result(*row, commit=commit)
+    for row in relays:
+        if not commit and db.get_relay_result(row[0], row[1], row[2]) is not None:
+            continue
+        db.insert_relay_result(*row, commit=commit)
+    db.conn.commit()
+
+
+def load_bulk(db, athletes, relays, defer_indexes):
+    db.insert_athlete_results(athletes, defer_indexes=defer_indexes)
+    db.insert_relay_results(relays, defer_indexes=defer_indexes)
+
+
+MODES = (
+    ("per-row commit", lambda db, a, r: load_per_row(db, a, r, commit=True)),
+    ("per-row", lambda db, a, r: load_per_row(db, a, r, commit=False)),
+    ("bulk", lambda db, a, r: load_bulk(db, a, r, defer_indexes=False)),
+    ("bulk deferred", lambda db, a, r: load_bulk(db, a, r, defer_indexes=True)),
+)
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy2(SOURCE_DB, db_path)
+    db = Database(db_path)
+    for sql in INDEXES:
+        db.cursor.execute(sql)
+    db.conn.commit()
+
+    print("=" * 70)
+    print("Bulk rows == per-row rows")
+    print("=" * 70)
+    state_id = db.get_meet_id("State", 1, 2025, "Boys")
+    sectional_ids = [db.get_meet_id("Sectional", num, 2025, "Boys") for num in range(1, 33)]
+    workloads = {
+        "state meet": meet_rows(db, [state_id]),
+        "sectional round": meet_rows(db, sectional_ids),
+    }
+    loaded = {}
+    for workload, (athletes, relays) in workloads.items():
+        source_ids = [state_id] if workload == "state meet" else sectional_ids
+        for mode, load in MODES:
+            mapping = new_meets(db, source_ids, f"{mode} {workload}")
+            db.conn.commit()
+            new_athletes, new_relays = remap(athletes, relays, mapping)
+            start = time.perf_counter()
+            load(db, new_athletes, new_relays)
+            loaded[(workload, mode)] = (time.perf_counter() - start, len(new_athletes) + len(new_relays))
+            reloaded = meet_rows(db, list(mapping.values()))
+            assert sorted(reloaded[0]) == sorted(new_athletes) and sorted(reloaded[1]) == sorted(new_relays), mode
+    indexes = {row[0] for row in db.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"ix_bench_athlete_result_event", "ix_bench_relay_result_event"} <= indexes
+    assert db.cursor.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    print("  every mode wrote the same rows; deferred indexes rebuilt, integrity_check ok")
+
+    print("\n" + "=" * 70)
+    print("All or nothing")
+    print("=" * 70)
+    athletes, relays = workloads["state meet"]
+    mapping = new_meets(db, [state_id], "atomic")  # pending, commit=False style
+    new_athletes, _new_relays = remap(athletes, relays, mapping)
+    try:
+        db.insert_athlete_results(new_athletes + new_athletes[:1], commit=False, defer_indexes=True)
+    except sqlite3.IntegrityError as exc:
+        print(f"  duplicate row rejected: {exc}")
+    else:
+        raise AssertionError("duplicate row accepted")
+    assert not meet_rows(db, list(mapping.values()))[0], "partial batch left behind"
+    assert db.cursor.execute(
+        "SELECT COUNT(*) FROM meet WHERE meet_id = ?", (mapping[state_id],)
+    ).fetchone()[0] == 1, "earlier pending write lost"
+    assert "ix_bench_athlete_result_event" in {
+        row[0] for row in db.cursor.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+    }
+    db.conn.rollback()
+    try:
+        db.insert_relay_results([relays[0], relays[0]])
+    except sqlite3.IntegrityError:
+        pass
+    else:
+        raise AssertionError("duplicate relay accepted")
+    assert not db.conn.in_transaction, "failed batch left its transaction open"
+    print("  failed batch rolled back; caller's pending writes and indexes kept")
+    db.conn.close()
+
+print("\n" + "=" * 70)
+print("Benchmark")
+print("=" * 70)
+for workload in workloads:
+    baseline = loaded[(workload, "per-row commit")][0]
+    for mode, _load in MODES:
+        seconds, rows = loaded[(workload, mode)]
+        print(f"  {workload:<16} {mode:<15} {rows:>6} rows  {seconds * 1000:9.1f} ms  x{baseline / seconds:6.1f}")
+
+print("\nAll bulk insert checks passed.")
@@ -0,0 +1,105 @@
+"""
+Parity check and benchmark for the ingestion identity index.
+Run from the jupyter directory: python test_identity_index.py
+
+IdentityIndex answers the loader's athlete/school identity queries from
+dicts loaded once. Every lookup must agree with the Database query it
+replaces (get_athlete_id, get_athlete_id_by_name_school,
+get_athlete_grad_year, get_school_id), including after athletes are
+inserted or have their grad year updated through the index.
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from util.db_util import Database
+from util.identity_index import IdentityIndex
+
+SOURCE_DB = os.path.join("..", "web", "data", "Track.db")
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy2(SOURCE_DB, db_path)
+    db = Database(db_path)
+
+    start = time.perf_counter()
+    index = IdentityIndex(db)
+    load_seconds = time.perf_counter() - start
+    athletes = db.cursor.execute("SELECT athlete_id, first, last, school_id, grad_year FROM athlete").fetchall()
+    schools = db.cursor.execute("SELECT school_id, school_name, team_name FROM school").fetchall()
+    assert len(index) == len(athletes)
+
+    rng = random.Random(3)
+    athlete_queries = []
+    for _athlete_id, first, last, school_id, grad_year in athletes:
+        athlete_queries.append((first.upper(), last.upper(), school_id, grad_year))
+    for _athlete_id, first, last, school_id, grad_year in rng.sample(athletes, 200):
+        athlete_queries.append((first.upper(), last.upper(), school_id, 9999))
+        athlete_queries.append((first.upper(), last.upper(), school_id + 1, grad_year))
+        athlete_queries.append((first.upper() + "X", last.upper(), school_id, grad_year))
+    school_queries = ["Nowhere Tech", "", "School 001 HS", "Team 3 High School"]
+    for _school_id, school_name, team_name in schools:
+        school_queries += [school_name, team_name, f"{school_name} HS", f"{team_name} High School"]
+
+    def check(label):
+        for first, last, school_id, grad_year in athlete_queries:
+            expected = db.get_athlete_id(first, last, school_id, grad_year)
+            assert index.get_athlete_id(first, last, school_id, grad_year) == expected, (label, first, last, school_id, grad_year)
+            expected = db.get_athlete_id_by_name_school(first, last, school_id)
+            assert index.get_athlete_id_by_name_school(first, last, school_id) == expected, (label, first, last, school_id)
+            if expected is not None:
+                assert index.get_athlete_grad_year(expected) == db.get_athlete_grad_year(expected), (label, expected)
+        for name in school_queries:
+            assert index.get_school_id(name) == db.get_school_id(name), (label, name)
+
+    print("=" * 70)
+    print("Lookups == Database queries")
+    print("=" * 70)
+    check("loaded")
+    print(f"  {len(athlete_queries)} athlete and {len(school_queries)} school queries OK "
+          f"(index of {len(index)} athletes loaded in {load_seconds * 1000:.1f} ms)")
+
+    print("\n" + "=" * 70)
+    print("Inserts and grad-year updates keep the index current")
+    print("=" * 70)
+    new_ids = []
+    for i in range(50):
+        school_id = schools[i % len(schools)][0]
+        athlete_id = index.insert_athlete(school_id, f"NEW{i}", f"RUNNER{i}", "Boys", 2027, commit=False)
+        new_ids.append(athlete_id)
+        athlete_queries.append((f"NEW{i}", f"RUNNER{i}", school_id, 2027))
+        athlete_queries.append((f"NEW{i}", f"RUNNER{i}", school_id, 2028))
+    # A duplicate name at the same school: lookups must keep returning the lower id.
+    first, last, school_id = "NEW0", "RUNNER0", schools[0][0]
+    duplicate_id = index.insert_athlete(school_id, first, last, "Boys", 2028, commit=False)
+    assert index.get_athlete_id_by_name_school(first, last, school_id) == new_ids[0]
+    for athlete_id in new_ids[::5] + [athlete[0] for athlete in rng.sample(athletes, 50)]:
+        index.update_athlete_grad_year(athlete_id, 2028, commit=False)
+    athlete_queries += [(first.upper(), last.upper(), school_id, 2028) for _id, first, last, school_id, _grad in athletes[:50]]
+    check("after writes")
+    assert index.get_athlete_id(first, last, school_id, 2028) == min(new_ids[0], duplicate_id)
+    db.conn.rollback()
+    print("  inserted 51 athletes, updated 60 grad years; lookups still agree")
+
+    print("\n" + "=" * 70)
+    print("Benchmark")
+    print("=" * 70)
+    sample = athlete_queries[:2000]
+    start = time.perf_counter()
+    for first, last, school_id, grad_year in sample:
+        db.get_athlete_id(first, last, school_id, grad_year)
+        db.get_athlete_id_by_name_school(first, last, school_id)
+    db_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    for first, last, school_id, grad_year in sample:
+        index.get_athlete_id(first, last, school_id, grad_year)
+        index.get_athlete_id_by_name_school(first, last, school_id)
+    index_seconds = time.perf_counter() - start
+    print(f"  {2 * len(sample)} athlete lookups: Database {db_seconds * 1000:.0f} ms, "
+          f"index {index_seconds * 1000:.2f} ms (x{db_seconds / index_seconds:.0f})")
+    db.conn.close()
+
+print("\nAll identity index checks passed.")
@@ -0,0 +1,415 @@
+"""
+Checks and benchmark for the concurrent MileSplit fetch pipeline.
+Run from the jupyter directory: python test_milesplit_pipeline.py
+
+A local HTTP server replays /api/v1/meets/<id>/performances payloads from a
+fixture directory (one <meet_id>-<results_id>.json per results page, written
+from the 2025 Boys sectionals in Track.db in the API's field layout) and can
+inject slow responses, 5xx/429 failures and 404s. Checks the token bucket
+and per-host limiter on a fake clock, the fetcher's rate limit and
+concurrency bound on the send times it reserves, and retries, then loads the sectional
+round through fetch -> parse -> resolve -> insert into a temp copy of
+Track.db and compares the stored rows with the source meets.
+"""
+
+import asyncio
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from util.db_util import Database
+from util.identity_index import IdentityIndex
+from util.milesplit_pipeline import (
+    PERFORMANCE_FIELDS, FetchError, Fetcher, HostRateLimiter, TokenBucket, fetch_performances, run_pipeline,
+)
+
+SOURCE_DB = os.path.join("..", "web", "data", "Track.db")
+PATH_RE = re.compile(r"^/api/v1/meets/(\d+)/performances$")
+
+
+class FixtureServer:
+    """Replays <meet_id>-<results_id>.json files; records every request."""
+
+    def __init__(self, fixture_dir):
+        self.fixture_dir = fixture_dir
+        self.latency = 0.0
+        self.faults = {}  # (meet_id, results_id) -> list of (status, headers) served before the payload
+        self.requests = []  # (start time, meet_id, results_id)
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def reset(self, latency=0.0):
+        with self.lock:
+            self.latency = latency
+            self.faults = {}
+            self.requests = []
+
+    def count(self, meet_id, results_id):
+        return sum(1 for _t, m, r in self.requests if (m, r) == (str(meet_id), str(results_id)))
+
+    def handle(self, request):
+        url = urlsplit(request.path)
+        match = PATH_RE.match(url.path)
+        query = parse_qs(url.query)
+        meet_id = match.group(1) if match else None
+        results_id = query.get("resultsId", [""])[0]
+        with self.lock:
+            self.requests.append((time.monotonic(), meet_id, results_id))
+            queued = self.faults.get((meet_id, results_id))
+            fault = queued.pop(0) if queued else None
+        time.sleep(self.latency)
+        path = os.path.join(self.fixture_dir, f"{meet_id}-{results_id}.json")
+        if fault is None and (match is None or query.get("fields") != [PERFORMANCE_FIELDS] or not os.path.exists(path)):
+            fault = (404, {})
+        if fault is not None:
+            status, headers = fault
+            request.send_response(status)
+            for key, value in headers.items():
+                request.send_header(key, value)
+            request.send_header("Content-Length", "0")
+            request.end_headers()
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        request.send_response(200)
+        request.send_header("Content-Type", "application/json")
+        request.send_header("Content-Length", str(len(body)))
+        request.end_headers()
+        request.wfile.write(body)
+
+
+def record_fixtures(db, fixture_dir, year, gender):
+    """Write each sectional as two results pages (finals, prelims + relays) in the API layout.
+
+    Returns {meet_num: (api meet_id, [results ids])} and the source rows per meet_num.
+    """
+    meets = {}
+    source = {}
+    for meet_id, meet_num in db.cursor.execute(
+        "SELECT meet_id, meet_num FROM meet WHERE meet_type = 'Sectional' AND year = ? AND gender = ?",
+        (year, gender),
+    ).fetchall():
+        athletes = db.cursor.execute(
+            """
+            SELECT a.first, a.last, s.school_name, a.grad_year, ar.event, ar.result_type, ar.grade,
+                   ar.result, ar.result2, ar.place
+            FROM athlete_result ar
+            JOIN athlete a ON ar.athlete_id = a.athlete_id
+            JOIN school s ON a.school_id = s.school_id
+            WHERE ar.meet_id = ?
+            """,
+            (meet_id,),
+        ).fetchall()
+        relays = db.cursor.execute(
+            """
+            SELECT s.school_name, rr.event, rr.result, rr.result2, rr.place
+            FROM relay_result rr JOIN school s ON rr.school_id = s.school_id
+            WHERE rr.meet_id = ?
+            """,
+            (meet_id,),
+        ).fetchall()
+        api_meet_id = 700000 + meet_num
+        pages = {f"{meet_num}01": [], f"{meet_num}02": []}
+        for first, last, school, grad_year, event, result_type, _grade, result, _result2, place in athletes:
+            page = f"{meet_num}01" if result_type == "Final" else f"{meet_num}02"
+            pages[page].append({
+                "meetId": api_meet_id, "eventName": event, "roundName": f"{result_type}s",
+                "place": place, "mark": result, "statusCode": "", "firstName": first,
+                "lastName": last, "teamName": school, "gradYear": grad_year,
+            })
+        for school, event, result, _result2, place in relays:
+            pages[f"{meet_num}02"].append({
+                "meetId": api_meet_id, "eventName": event, "roundName": "Finals", "place": place,
+                "mark": result, "statusCode": "", "firstName": "", "lastName": "", "teamName": school,
+            })
+        for results_id, data in pages.items():
+            with open(os.path.join(fixture_dir, f"{api_meet_id}-{results_id}.json"), "w") as f:
+                json.dump({"data": [dict(row, id=i) for i, row in enumerate(data)]}, f)
+        meets[meet_num] = (api_meet_id, sorted(pages))
+        source[meet_num] = (athletes, relays)
+    return meets, source
+
+
+def check_token_bucket():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, burst=2, clock=lambda: now[0])
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    now[0] = 1.5  # the two reserved tokens are paid back, one more earned
+    assert bucket.reserve() == 0.0 and bucket.reserve() == 0.5
+    now[0] = 100.0  # idle time refills to the burst size only
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+    for bad in ({"rate": 0}, {"rate": 1, "burst": 0}):
+        try:
+            TokenBucket(**bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad}")
+
+
+def check_host_limiter():
+    now = [0.0]
+    limiter = HostRateLimiter(rate=2, burst=1, clock=lambda: now[0])
+    first, other = "http://a.example/meets/1", "http://B.example/meets/1"
+    assert limiter.bucket("http://A.example/meets/2") is limiter.bucket(first)
+    assert [limiter.bucket(first).reserve() for _ in range(3)] == [0.0, 0.5, 1.0]
+    assert limiter.bucket(other).reserve() == 0.0, "each host has its own budget"
+    now[0] = 1.5
+    assert limiter.bucket(first).reserve() == 0.0
+
+
+async def check_limits(server, meets):
+    """Rate, burst and concurrency, asserted on the fetcher's own bookkeeping.
+
+    Every token reservation is recorded with the send time it was granted
+    (bucket clock + wait), and every request as it is handed to urllib. The
+    granted send times must obey the bucket exactly, and a token may only be
+    reserved by a request holding a concurrency slot, i.e. at most
+    ``concurrency`` granted tokens are ever waiting to be sent.
+    """
+    targets = [(api_id, rid) for api_id, rids in meets.values() for rid in rids][:40]
+    server.reset(latency=0.02)
+    rate, burst, concurrency = 25, 3, 5
+    fetcher = Fetcher(rate=rate, burst=burst, concurrency=concurrency)
+    bucket = fetcher.limiter.bucket(server.base)
+    granted = []
+    counts = {"waiting": 0, "max_waiting": 0, "sending": 0, "max_sending": 0}
+    lock = threading.Lock()
+    reserve, request = bucket.reserve, fetcher._request
+
+    def recording_reserve():
+        wait = reserve()
+        with lock:
+            granted.append(bucket._updated + wait)
+            counts["waiting"] += 1
+            counts["max_waiting"] = max(counts["max_waiting"], counts["waiting"])
+        return wait
+
+    def recording_request(url):
+        with lock:
+            counts["waiting"] -= 1
+            counts["sending"] += 1
+            counts["max_sending"] = max(counts["max_sending"], counts["sending"])
+        try:
+            return request(url)
+        finally:
+            with lock:
+                counts["sending"] -= 1
+
+    bucket.reserve = recording_reserve
+    fetcher._request = recording_request
+    start = time.monotonic()
+    payloads = await asyncio.gather(*(fetch_performances(fetcher, m, r, base=server.base) for m, r in targets))
+    elapsed = time.monotonic() - start
+    assert all(isinstance(p["data"], list) for p in payloads)
+    assert len(granted) == len(targets) == len(server.requests)
+    granted.sort()
+    for i in range(len(granted)):
+        for j in range(i + 1, len(granted)):
+            # Any j - i + 1 consecutive sends need at least j - i + 1 - burst newly earned tokens.
+            assert granted[j] - granted[i] >= (j - i + 1 - burst) / rate - 1e-9, (i, j, granted[j] - granted[i])
+    assert counts["max_waiting"] <= concurrency, counts
+    assert counts["max_sending"] <= concurrency, counts
+    return len(targets), elapsed, counts["max_sending"]
+
+
+async def check_retries(server, meets):
+    (api_id, (rid, other_rid)) = meets[1]
+    server.reset()
+    server.faults[(str(api_id), rid)] = [(503, {}), (429, {"Retry-After": "0.3"}), (500, {})]
+    fetcher = Fetcher(rate=100, burst=5, retries=4, backoff=0.01, max_backoff=0.05)
+    start = time.monotonic()
+    payload = await fetch_performances(fetcher, api_id, rid, base=server.base)
+    assert payload["data"] and server.count(api_id, rid) == 4
+    assert time.monotonic() - start >= 0.3, "Retry-After not honoured"
+
+    server.faults[(str(api_id), other_rid)] = [(503, {})] * 3
+    try:
+        await fetch_performances(Fetcher(rate=100, burst=5, retries=2, backoff=0.01), api_id, other_rid, base=server.base)
+    except FetchError as exc:
+        assert exc.status == 503 and exc.retryable
+    else:
+        raise AssertionError("exhausted retries did not raise")
+    assert server.count(api_id, other_rid) == 3
+
+    try:
+        await fetch_performances(fetcher, api_id, "999999", base=server.base)
+    except FetchError as exc:
+        assert exc.status == 404 and not exc.retryable
+    else:
+        raise AssertionError("404 did not raise")
+    assert server.count(api_id, "999999") == 1, "404 was retried"
+
+    closed = Fetcher(rate=100, burst=5, retries=2, backoff=0.01, timeout=1)
+    try:
+        await closed.get("http://127.0.0.1:9/api/v1/meets/1/performances")
+    except FetchError as exc:
+        assert exc.status is None and exc.retryable
+    else:
+        raise AssertionError("connection refused did not raise")
+
+
+def main():
+    print("=" * 70)
+    print("Token bucket")
+    print("=" * 70)
+    check_token_bucket()
+    check_host_limiter()
+    print("  reservations, debt, refill and per-host buckets OK")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "Track.db")
+        shutil.copy2(SOURCE_DB, db_path)
+        fixture_dir = os.path.join(tmp_dir, "fixtures")
+        os.mkdir(fixture_dir)
+        db = Database(db_path)
+        meets, source = record_fixtures(db, fixture_dir, 2025, "Boys")
+        assert len(meets) == 32
+        server = FixtureServer(fixture_dir)
+
+        print("\n" + "=" * 70)
+        print("Per-host rate limit and concurrency bound")
+        print("=" * 70)
+        requests, elapsed, in_flight = asyncio.run(check_limits(server, meets))
+        print(f"  {requests} requests at 25/s (burst 3) in {elapsed:.2f}s, max {in_flight} in flight (limit 5)")
+
+        print("\n" + "=" * 70)
+        print("Retries")
+        print("=" * 70)
+        asyncio.run(check_retries(server, meets))
+        print("  503/429/500 retried (Retry-After honoured), exhausted retries, 404 and refused connection raise")
+
+        print("\n" + "=" * 70)
+        print("Pipeline loads the sectional round")
+        print("=" * 70)
+        identity = IdentityIndex(db)
+        year = 1999
+        depth = {"fetched": 0, "inserted": 0, "max": 0}
+
+        async def fetch(meet_num):
+            api_id, results_ids = meets[meet_num]
+            pages = await asyncio.gather(*(fetch_performances(fetcher, api_id, rid, base=server.base) for rid in results_ids))
+            depth["fetched"] += 1
+            depth["max"] = max(depth["max"], depth["fetched"] - depth["inserted"])
+            return pages
+
+        def parse(meet_num, pages):
+            return [row for page in pages for row in page["data"]]
+
+        def resolve(meet_num, records):
+            db.insert_meet(f"Fixture {meet_num}", "Sectional", meet_num, year, "Boys", commit=False)
+            meet_id = db.get_meet_id("Sectional", meet_num, year, "Boys")
+            athlete_rows, relay_rows = [], []
+            for rec in records:
+                school_id = identity.get_school_id(rec["teamName"])
+                if "Relay" in rec["eventName"]:
+                    relay_rows.append((school_id, meet_id, rec["eventName"], rec["mark"], None, rec["place"], ""))
+                    continue
+                athlete_id = identity.get_athlete_id(rec["firstName"], rec["lastName"], school_id, rec["gradYear"])
+                result_type = rec["roundName"][:-1]
+                athlete_rows.append((athlete_id, meet_id, rec["eventName"], result_type, "", rec["mark"], None, rec["place"]))
+            return athlete_rows, relay_rows
+
+        def insert(meet_num, rows):
+            time.sleep(0.03)  # a slow writer: fetching must wait on the bounded queues
+            athlete_rows, relay_rows = rows
+            inserted = db.insert_athlete_results(athlete_rows, commit=False) + db.insert_relay_results(relay_rows, commit=False)
+            depth["inserted"] += 1
+            return inserted
+
+        server.reset(latency=0.01)
+        server.faults[(str(meets[3][0]), meets[3][1][0])] = [(502, {})]
+        server.faults[(str(meets[5][0]), meets[5][1][1])] = [(404, {})]
+        fetcher = Fetcher(rate=200, burst=8, concurrency=8, backoff=0.01)
+        workers, queue_size = 4, 2
+        results = asyncio.run(run_pipeline(sorted(meets), fetch, parse, resolve, insert, workers=workers, queue_size=queue_size))
+        db.do_commit()
+
+        assert [r["job"] for r in results] == sorted(meets)
+        failed = [r for r in results if r["error"] is not None]
+        assert [(r["job"], r["stage"], r["error"].status) for r in failed] == [(5, "fetch", 404)], failed
+        assert depth["max"] <= workers + 3 * (queue_size + 1), depth
+        for result in results:
+            meet_num = result["job"]
+            if meet_num == 5:
+                assert db.get_meet_id("Sectional", 5, year, "Boys") is None
+                continue
+            meet_id = db.get_meet_id("Sectional", meet_num, year, "Boys")
+            stored = db.cursor.execute(
+                """
+                SELECT a.first, a.last, s.school_name, a.grad_year, ar.event, ar.result_type, ar.result, ar.place
+                FROM athlete_result ar
+                JOIN athlete a ON ar.athlete_id = a.athlete_id
+                JOIN school s ON a.school_id = s.school_id
+                WHERE ar.meet_id = ?
+                """,
+                (meet_id,),
+            ).fetchall()
+            stored_relays = db.cursor.execute(
+                "SELECT s.school_name, rr.event, rr.result, rr.place FROM relay_result rr "
+                "JOIN school s ON rr.school_id = s.school_id WHERE rr.meet_id = ?",
+                (meet_id,),
+            ).fetchall()
+            athletes, relays = source[meet_num]
+            assert sorted(stored) == sorted(r[:6] + r[7:8] + r[9:] for r in athletes), meet_num
+            assert sorted(stored_relays) == sorted(r[:3] + r[4:] for r in relays), meet_num
+            assert result["value"] == len(athletes) + len(relays)
+        assert server.count(meets[3][0], meets[3][1][0]) == 2
+        rows = sum(r["value"] for r in results if r["error"] is None)
+        print(f"  {len(results) - 1} meets, {rows} rows stored == source; "
+              f"502 retried, 404 meet reported as a fetch error and skipped")
+        print(f"  max {depth['max']} meets fetched but not yet inserted (bound {workers + 3 * (queue_size + 1)})")
+
+        print("\n" + "=" * 70)
+        print("Benchmark")
+        print("=" * 70)
+        targets = [(api_id, rid) for api_id, rids in meets.values() for rid in rids][:32]
+        latency = 0.1
+        server.reset(latency=latency)
+
+        async def serial():
+            one = Fetcher(rate=40, burst=1, concurrency=1)
+            for api_id, rid in targets:
+                await fetch_performances(one, api_id, rid, base=server.base)
+
+        async def concurrent():
+            many = Fetcher(rate=40, burst=4, concurrency=8)
+            await asyncio.gather(*(fetch_performances(many, api_id, rid, base=server.base) for api_id, rid in targets))
+
+        start = time.perf_counter()
+        asyncio.run(serial())
+        serial_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        asyncio.run(concurrent())
+        concurrent_seconds = time.perf_counter() - start
+        print(f"  {len(targets)} results pages at {latency * 1000:.0f} ms latency, 40 requests/s per host:")
+        print(f"    one at a time {serial_seconds:.2f}s, 8 in flight {concurrent_seconds:.2f}s "
+              f"(x{serial_seconds / concurrent_seconds:.1f}); "
+              f"the old 1.5-3 s sleep per request alone would add ~{2.25 * len(targets):.0f}s")
+
+        server.httpd.shutdown()
+        server.httpd.server_close()
+        db.conn.close()
+
+    print("\nAll MileSplit pipeline checks passed.")
+
+
+if __name__ == "__main__":
+    main()
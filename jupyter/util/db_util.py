@@ -20,6 +20,53 @@ class Database:
 				if "database is locked" not in str(e).lower() or attempt == retries:
 					raise
 				time.sleep(delay * (attempt + 1))
+
+	def _drop_indexes(self, table):
+		# Explicit (CREATE INDEX) indexes on table; primary-key/UNIQUE constraint indexes can't be dropped.
+		indexes = self.cursor.execute(
+			"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+			(table,),
+		).fetchall()
+		for name, _sql in indexes:
+			self.cursor.execute(f'DROP INDEX "{name}"')
+		return [sql for _name, sql in indexes]
+
+	def _executemany_write(self, table, query, rows, defer_indexes=False, retries=5, delay=0.4):
+		"""
+		Run query for every row inside one transaction, all or nothing. Joins the
+		caller's open transaction (commit=False writes) through a savepoint, so a
+		failed batch rolls back without losing earlier pending writes.
+		With defer_indexes, the table's explicit indexes are dropped for the load
+		and rebuilt once at the end, inside the same transaction. Rebuilding scans
+		the whole table, so this only pays off for batches that are large next to
+		the table (e.g. reloading a season into a fresh DB).
+		"""
+		rows = list(rows)
+		if not rows:
+			return 0
+		began = not self.conn.in_transaction
+		if began:
+			# Take the write lock up front so executemany can't stall half way.
+			self._execute_write("BEGIN IMMEDIATE", retries=retries, delay=delay)
+		for attempt in range(retries + 1):
+			self.cursor.execute("SAVEPOINT bulk_write")
+			try:
+				indexes = self._drop_indexes(table) if defer_indexes else []
+				self.cursor.executemany(query, rows)
+				for sql in indexes:
+					self.cursor.execute(sql)
+			except Exception as e:
+				self.cursor.execute("ROLLBACK TO bulk_write")
+				self.cursor.execute("RELEASE bulk_write")
+				locked = isinstance(e, sqlite3.OperationalError) and "database is locked" in str(e).lower()
+				if not locked or attempt == retries:
+					if began:
+						self.conn.rollback()
+					raise
+				time.sleep(delay * (attempt + 1))
+				continue
+			self.cursor.execute("RELEASE bulk_write")
+			return len(rows)
 	
 	def get_all_schools(self, year=2024):       
 		query = "SELECT school.school_id, school_name, team_name, school_type, nickname, address, city, zip, \
@@ -123,6 +170,11 @@ class Database:
 		else:
 			return int(df.iloc[0,0])
 	
+	def get_athlete_result_keys(self, meet_id):
+		# (athlete_id, event, result_type) of every athlete_result already loaded for a meet.
+		query = "select athlete_id, event, result_type from athlete_result where meet_id = ?"
+		return set(self.cursor.execute(query, (meet_id, )).fetchall())
+	
 	def get_all_relay_results(self):
 		query = "select school.school_id, event, result, result2, place, athlete_names, school_name, team_name, \
 		school_type, host, meet_type, meet_num, gender, enrollment, meet.year \
@@ -144,6 +196,11 @@ class Database:
 		else:
 			return int(df.iloc[0,0])
 	
+	def get_relay_result_keys(self, meet_id):
+		# (school_id, event) of every relay_result already loaded for a meet.
+		query = "select school_id, event from relay_result where meet_id = ?"
+		return set(self.cursor.execute(query, (meet_id, )).fetchall())
+	
 	def get_school_classifications(self):       
 		query = "SELECT * from school_classification"
 		df = pd.read_sql_query(query, self.conn)
@@ -213,6 +270,20 @@ class Database:
 		if commit:
 			self.conn.commit()
 	
+	def insert_athlete_results(self, rows, commit=True, defer_indexes=False):
+		"""
+		Bulk insert_athlete_result: rows are (athlete_id, meet_id, event, type, grade,
+		result, result2, place) tuples, written with one executemany in a single
+		transaction. Returns the number of rows inserted.
+		"""
+		query = "INSERT INTO athlete_result (athlete_id, meet_id, event, result_type, grade, result, result2, place) \
+		VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+		count = self._executemany_write("athlete_result", query, rows, defer_indexes=defer_indexes)
+
+		if commit:
+			self.conn.commit()
+		return count
+	
 	def insert_relay_result(self, school_id, meet_id, event, result, result2, place, athlete_names, commit=True):
 		query = "INSERT INTO relay_result (school_id, meet_id, event, result, result2, place, athlete_names) \
 		VALUES (?, ?, ?, ?, ?, ?, ?)"
@@ -225,6 +296,21 @@ class Database:
 		# Return the autoincremented relay_id for the inserted row - RTR add
 		return self.cursor.lastrowid
 
+	def insert_relay_results(self, rows, commit=True, defer_indexes=False):
+		"""
+		Bulk insert_relay_result: rows are (school_id, meet_id, event, result, result2,
+		place, athlete_names) tuples, written with one executemany in a single
+		transaction. Returns the number of rows inserted (not the relay ids; use
+		insert_relay_result when relay_athlete rows need them).
+		"""
+		query = "INSERT INTO relay_result (school_id, meet_id, event, result, result2, place, athlete_names) \
+		VALUES (?, ?, ?, ?, ?, ?, ?)"
+		count = self._executemany_write("relay_result", query, rows, defer_indexes=defer_indexes)
+
+		if commit:
+			self.conn.commit()
+		return count
+
 	# RTR add
 	def insert_relay_athlete(self, relay_id, athlete_id, commit=True):
 		query = "INSERT INTO relay_athlete (relay_id, athlete_id) \
@@ -476,7 +562,22 @@ class Database:
 		else:
 			return df.iloc[0,0] 
 
+	def bump_ingest_counter(self, commit=True):
+		# The web app compares this counter (with max(meet_id)) to decide when
+		# cached qualifier status needs rebuilding.
+		self._execute_write(
+			"CREATE TABLE IF NOT EXISTS ingest_state (key VARCHAR PRIMARY KEY, counter INTEGER NOT NULL DEFAULT 0, updated_at DATETIME)"
+		)
+		self._execute_write(
+			"INSERT INTO ingest_state (key, counter, updated_at) VALUES ('results', 1, datetime('now')) "
+			"ON CONFLICT(key) DO UPDATE SET counter = counter + 1, updated_at = excluded.updated_at"
+		)
+
+		if commit:
+			self.conn.commit()
+
 	def do_commit(self):
+		self.bump_ingest_counter(commit=False)
 		self.conn.commit()
 
 	def get_athlete_id_by_name_school(self, first: str, last: str, school_id: int) -> int | None:
@@ -0,0 +1,100 @@
+import bisect
+
+
+def _name_key(value):
+	# Matches the loader's UPPER(...) comparisons.
+	return str(value or "").strip().upper()
+
+
+class IdentityIndex:
+	"""
+	In-memory athlete and school lookups for ingestion. Loads the athlete and
+	school tables once and answers the Database identity queries
+	(get_athlete_id, get_athlete_id_by_name_school, get_athlete_grad_year,
+	get_school_id) from dicts. insert_athlete / update_athlete_grad_year write
+	through to the Database and update the index in place, so lookups stay in
+	step with uncommitted writes. Ties resolve to the lowest id, like the
+	LIMIT 1 queries they replace.
+	"""
+
+	def __init__(self, db):
+		self.db = db
+		self._by_identity = {}  # (FIRST, LAST, school_id, grad_year) -> sorted athlete_ids
+		self._by_name_school = {}  # (FIRST, LAST, school_id) -> sorted athlete_ids
+		self._athletes = {}  # athlete_id -> (FIRST, LAST, school_id, grad_year)
+		self._schools = {}  # school_name / team_name -> lowest school_id
+
+		rows = db.cursor.execute("SELECT athlete_id, first, last, school_id, grad_year FROM athlete ORDER BY athlete_id")
+		for athlete_id, first, last, school_id, grad_year in rows:
+			self._add_athlete(athlete_id, first, last, school_id, grad_year)
+
+		rows = db.cursor.execute("SELECT school_id, school_name, team_name FROM school ORDER BY school_id")
+		for school_id, school_name, team_name in rows:
+			self.add_school_alias(school_name, school_id)
+			self.add_school_alias(team_name, school_id)
+
+	@staticmethod
+	def _add_id(index, key, athlete_id):
+		bisect.insort(index.setdefault(key, []), athlete_id)
+
+	@staticmethod
+	def _remove_id(index, key, athlete_id):
+		ids = index.get(key)
+		if ids and athlete_id in ids:
+			ids.remove(athlete_id)
+			if not ids:
+				del index[key]
+
+	def _add_athlete(self, athlete_id, first, last, school_id, grad_year):
+		first, last = _name_key(first), _name_key(last)
+		self._athletes[athlete_id] = (first, last, school_id, grad_year)
+		self._add_id(self._by_identity, (first, last, school_id, grad_year), athlete_id)
+		self._add_id(self._by_name_school, (first, last, school_id), athlete_id)
+
+	def __len__(self):
+		return len(self._athletes)
+
+	def get_athlete_id(self, first, last, school_id, grad_year):
+		ids = self._by_identity.get((_name_key(first), _name_key(last), school_id, grad_year))
+		return ids[0] if ids else None
+
+	def get_athlete_id_by_name_school(self, first, last, school_id):
+		ids = self._by_name_school.get((_name_key(first), _name_key(last), school_id))
+		return ids[0] if ids else None
+
+	def get_athlete_grad_year(self, athlete_id):
+		athlete = self._athletes.get(athlete_id)
+		return athlete[3] if athlete else None
+
+	def add_school_alias(self, name, school_id):
+		# First (lowest) school_id wins, like "where school_name = ? or team_name = ?".
+		if name and (name not in self._schools or school_id < self._schools[name]):
+			self._schools[name] = school_id
+
+	def get_school_id(self, school_name):
+		# Same candidate names as Database.get_school_id.
+		candidate_names = [school_name]
+		clean_name = str(school_name).strip()
+		if clean_name.upper().endswith(" HS"):
+			candidate_names.append(clean_name[:-3].strip())
+		candidate_names.append(clean_name.replace(" High School", "").strip())
+
+		for candidate in candidate_names:
+			if candidate in self._schools:
+				return self._schools[candidate]
+		return None
+
+	def insert_athlete(self, school_id, first, last, gender, grad_year, commit=True):
+		athlete_id = self.db.insert_athlete(school_id, first, last, gender, grad_year, commit=commit)
+		self._add_athlete(athlete_id, first, last, school_id, grad_year)
+		return athlete_id
+
+	def update_athlete_grad_year(self, athlete_id, grad_year, commit=True):
+		self.db.update_athlete_grad_year(athlete_id, grad_year, commit=commit)
+		athlete = self._athletes.get(athlete_id)
+		if athlete is None:
+			return
+		first, last, school_id, old_grad_year = athlete
+		self._remove_id(self._by_identity, (first, last, school_id, old_grad_year), athlete_id)
+		self._athletes[athlete_id] = (first, last, school_id, grad_year)
+		self._add_id(self._by_identity, (first, last, school_id, grad_year), athlete_id)
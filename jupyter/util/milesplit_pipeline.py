@@ -0,0 +1,257 @@
+import asyncio
+import http.client
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+
+BASE = "https://in.milesplit.com"
+PERFORMANCE_FIELDS = (
+	"id,meetId,eventName,roundName,place,mark,statusCode,"
+	"firstName,lastName,teamName,gradYear,units,millimeters"
+)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+	"""Allows ``rate`` requests per second on average, in bursts of up to ``burst``.
+
+	Each acquire reserves the next token immediately (the bucket may go into
+	debt) and then waits until that token has been earned, so callers are
+	served in arrival order whether they are coroutines or threads.
+	"""
+
+	def __init__(self, rate, burst=1, clock=time.monotonic):
+		if rate <= 0:
+			raise ValueError(f"rate must be positive, got {rate}")
+		if burst < 1:
+			raise ValueError(f"burst must be at least 1, got {burst}")
+		self.rate = float(rate)
+		self.burst = float(burst)
+		self.tokens = self.burst
+		self._clock = clock
+		self._updated = clock()
+		self._lock = threading.Lock()
+
+	def reserve(self):
+		"""Take a token and return how many seconds to wait before using it."""
+		with self._lock:
+			now = self._clock()
+			self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+			self._updated = now
+			self.tokens -= 1
+			return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+	async def acquire(self):
+		wait = self.reserve()
+		if wait > 0:
+			await asyncio.sleep(wait)
+
+	def acquire_blocking(self):
+		wait = self.reserve()
+		if wait > 0:
+			time.sleep(wait)
+
+
+class HostRateLimiter:
+	"""One TokenBucket per host, created on first use."""
+
+	def __init__(self, rate, burst=1, clock=time.monotonic):
+		self.rate = rate
+		self.burst = burst
+		self._clock = clock
+		self._buckets = {}
+		self._lock = threading.Lock()
+
+	def bucket(self, url):
+		host = urlsplit(url).netloc.lower()
+		with self._lock:
+			if host not in self._buckets:
+				self._buckets[host] = TokenBucket(self.rate, self.burst, clock=self._clock)
+			return self._buckets[host]
+
+	async def acquire(self, url):
+		await self.bucket(url).acquire()
+
+	def acquire_blocking(self, url):
+		self.bucket(url).acquire_blocking()
+
+
+class FetchError(Exception):
+	"""A request that failed; ``status`` is None for network errors and timeouts."""
+
+	def __init__(self, url, message, status=None, retry_after=None):
+		super().__init__(f"{message} ({url})")
+		self.url = url
+		self.status = status
+		self.retry_after = retry_after
+
+	@property
+	def retryable(self):
+		return self.status is None or self.status in RETRY_STATUSES
+
+
+def _retry_after(headers):
+	"""Seconds from a Retry-After header (delta-seconds or HTTP date), else None."""
+	value = headers.get("Retry-After") if headers is not None else None
+	if not value:
+		return None
+	try:
+		return max(0.0, float(value))
+	except ValueError:
+		pass
+	try:
+		return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+	except (TypeError, ValueError):
+		return None
+
+
+def backoff_delay(attempt, backoff=1.0, max_backoff=10.0, rng=random):
+	"""Full-jitter exponential backoff: uniform in [0, min(max_backoff, backoff * 2**attempt)]."""
+	return rng.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+
+
+class Fetcher:
+	"""Rate-limited HTTP GETs for asyncio code.
+
+	Requests run in worker threads through urllib, at most ``concurrency`` at
+	a time. Each attempt takes a token from the per-host limiter only once it
+	holds a concurrency slot, right before it is sent, so queued requests
+	never bank tokens and then fire together (pass one ``limiter`` to share a
+	budget with other fetch code). Network errors, timeouts and 429/5xx
+	responses are retried up to ``retries`` times with jittered exponential
+	backoff, waiting at least as long as a Retry-After header asks; other
+	HTTP errors raise FetchError at once.
+	"""
+
+	def __init__(self, rate=1.0, burst=2, concurrency=4, retries=4, backoff=1.0, max_backoff=10.0,
+			timeout=30.0, headers=None, limiter=None, rng=None):
+		self.limiter = limiter if limiter is not None else HostRateLimiter(rate, burst)
+		self.concurrency = concurrency
+		self.retries = retries
+		self.backoff = backoff
+		self.max_backoff = max_backoff
+		self.timeout = timeout
+		self.headers = dict(headers or {})
+		self.rng = rng if rng is not None else random.Random()
+		self._semaphore = None
+		self._loop = None
+
+	def _request(self, url):
+		request = urllib.request.Request(url, headers=self.headers)
+		try:
+			with urllib.request.urlopen(request, timeout=self.timeout) as response:
+				return response.read()
+		except urllib.error.HTTPError as e:
+			raise FetchError(url, f"HTTP {e.code}", status=e.code, retry_after=_retry_after(e.headers)) from e
+		except (OSError, http.client.HTTPException) as e:
+			raise FetchError(url, str(e) or type(e).__name__) from e
+
+	async def get(self, url, params=None):
+		"""Return the response body of ``url`` as bytes."""
+		if params:
+			url = f"{url}?{urlencode(params)}"
+		loop = asyncio.get_running_loop()
+		if self._loop is not loop:
+			self._semaphore = asyncio.Semaphore(self.concurrency)
+			self._loop = loop
+		for attempt in range(self.retries + 1):
+			try:
+				async with self._semaphore:
+					await self.limiter.acquire(url)
+					return await asyncio.to_thread(self._request, url)
+			except FetchError as e:
+				if not e.retryable or attempt == self.retries:
+					raise
+				delay = backoff_delay(attempt, self.backoff, self.max_backoff, self.rng)
+				if e.retry_after is not None:
+					delay = max(delay, e.retry_after)
+			await asyncio.sleep(delay)
+
+	async def get_json(self, url, params=None):
+		return json.loads(await self.get(url, params=params))
+
+
+def performances_url(meet_id, base=BASE):
+	return f"{base}/api/v1/meets/{meet_id}/performances"
+
+
+async def fetch_performances(fetcher, meet_id, results_id, base=BASE):
+	"""The decoded ``/api/v1/meets/<meet_id>/performances`` payload for one resultsId."""
+	params = {"resultsId": str(results_id), "fields": PERFORMANCE_FIELDS}
+	return await fetcher.get_json(performances_url(meet_id, base), params=params)
+
+
+async def run_pipeline(jobs, fetch, parse, resolve, insert, workers=4, queue_size=8):
+	"""Run each job through fetch -> parse -> resolve -> insert.
+
+	``fetch`` is a coroutine function ``fetch(job)``, run by ``workers``
+	concurrent workers. ``parse``, ``resolve`` and ``insert`` are plain
+	functions ``stage(job, value)`` that get the previous stage's return
+	value. Each runs as a single worker on the event-loop thread, one item at
+	a time, so they can share a sqlite connection or IdentityIndex without
+	locking. Stages are joined by queues of at most ``queue_size`` items,
+	so fetching stalls instead of piling up payloads when a later stage
+	falls behind.
+
+	Returns one dict per job, in job order: ``{"job", "value", "error",
+	"stage"}``. ``value`` is what ``insert`` returned. If a stage raises,
+	``error`` holds the exception, ``stage`` names the stage, and the job
+	goes no further; the other jobs carry on.
+	"""
+	jobs = list(jobs)
+	results = [{"job": job, "value": None, "error": None, "stage": None} for job in jobs]
+	pending = asyncio.Queue()
+	for index in range(len(jobs)):
+		pending.put_nowait(index)
+	parse_queue, resolve_queue, insert_queue = (asyncio.Queue(maxsize=queue_size) for _ in range(3))
+
+	def fail(index, stage, exc):
+		results[index]["error"] = exc
+		results[index]["stage"] = stage
+
+	async def fetch_worker():
+		while not pending.empty():
+			index = pending.get_nowait()
+			try:
+				value = await fetch(jobs[index])
+			except Exception as exc:
+				fail(index, "fetch", exc)
+				continue
+			await parse_queue.put((index, value))
+
+	async def stage_worker(stage, func, inbox, outbox):
+		while True:
+			item = await inbox.get()
+			if item is None:
+				if outbox is not None:
+					await outbox.put(None)
+				return
+			index, value = item
+			try:
+				value = func(jobs[index], value)
+			except Exception as exc:
+				fail(index, stage, exc)
+				continue
+			if outbox is None:
+				results[index]["value"] = value
+			else:
+				await outbox.put((index, value))
+
+	stages = [
+		asyncio.ensure_future(stage_worker("parse", parse, parse_queue, resolve_queue)),
+		asyncio.ensure_future(stage_worker("resolve", resolve, resolve_queue, insert_queue)),
+		asyncio.ensure_future(stage_worker("insert", insert, insert_queue, None)),
+	]
+	try:
+		await asyncio.gather(*(fetch_worker() for _ in range(max(1, workers))))
+		await parse_queue.put(None)
+		await asyncio.gather(*stages)
+	finally:
+		for task in stages:
+			task.cancel()
+	return results
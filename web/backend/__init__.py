@@ -29,6 +29,7 @@ def create_app(config_class=Config):
     # Auto-create tables for fresh or empty SQLite databases so new environments
     # don't crash when queries run before migrations are applied.
     if db_uri.startswith('sqlite:///'):
+        from . import models  # noqa: F401  (register every table before create_all)
         with app.app_context():
             db.create_all()
 
@@ -0,0 +1,368 @@
+"""Versioned store for the precomputed JSON artifacts.
+
+Each precompute run stages a complete copy of the artifact tree under
+``versions/.staging-<id>/`` (unchanged files are hard-linked from the current
+version, so staging is cheap), writes the artifacts it rebuilt, then
+publishes by renaming the directory into place and atomically replacing the
+``CURRENT.json`` pointer. Readers resolve every artifact through the pointer,
+so they switch to a new version the moment it is published, never see a
+half-written set, and an operator can swap back to the previous version with
+``rollback``.
+
+Publishing holds an exclusive lock on ``<root>/.lock`` from staging through
+activate and prune, so overlapping runs queue instead of publishing over
+each other's artifacts or pruning each other's versions. Where ``fcntl`` is
+unavailable, a publish whose base version was replaced in the meantime is
+refused instead.
+
+Until a version is published (fresh checkout, or a file no version contains)
+paths resolve to the committed files under ``frontend/static/data``.
+
+Usage:
+    python -m backend.artifact_store list
+    python -m backend.artifact_store rollback
+    python -m backend.artifact_store activate 20260519T201502-3fa2
+    python -m backend.artifact_store prune --keep 5
+    python -m backend.artifact_store export      # copy current version into frontend/static/data
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import brotli
+except ImportError:  # optional: gzip variants are always written
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows: publish falls back to the base version check
+    fcntl = None
+
+STATIC_DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'frontend', 'static', 'data'))
+POINTER_NAME = "CURRENT.json"
+LOCK_NAME = ".lock"
+DEFAULT_KEEP = 5
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_json_artifact(path, payload, indent=None):
+    """
+    Write ``payload`` as JSON at ``path`` plus its .gz/.br siblings.
+
+    Output is minified unless ``indent`` is given (handy when diffing an
+    artifact by hand). Every file goes to a temp name and is renamed into
+    place, JSON first, so the server only trusts a variant at least as new as
+    its JSON. Returns the JSON size in bytes.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    separators = (",", ":") if indent is None else None
+    body = json.dumps(payload, indent=indent, separators=separators).encode("utf-8")
+
+    _atomic_write(path, body)
+    _atomic_write(f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _atomic_write(f"{path}.br", brotli.compress(body, quality=11))
+    elif os.path.exists(f"{path}.br"):
+        os.remove(f"{path}.br")
+    return len(body)
+
+
+def _new_version_id():
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:4]}"
+
+
+def _link_tree(src, dst):
+    """Mirror ``src`` into ``dst`` with hard links (copies where links are unsupported)."""
+    for dirpath, _dirnames, filenames in os.walk(src):
+        rel = os.path.relpath(dirpath, src)
+        target_dir = os.path.join(dst, rel) if rel != "." else dst
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in filenames:
+            if filename.endswith(".tmp"):
+                continue
+            source = os.path.join(dirpath, filename)
+            target = os.path.join(target_dir, filename)
+            try:
+                os.link(source, target)
+            except OSError:
+                shutil.copy2(source, target)
+
+
+class StagedVersion:
+    """A version being assembled; write artifacts by path relative to the data root."""
+
+    def __init__(self, version_id, path):
+        self.version_id = version_id
+        self.path = path
+
+    def artifact_path(self, relpath):
+        return os.path.join(self.path, relpath)
+
+    def write_json(self, relpath, payload, indent=None):
+        return write_json_artifact(self.artifact_path(relpath), payload, indent=indent)
+
+
+class ArtifactStore:
+    def __init__(self, root, seed_dir=STATIC_DATA_DIR, keep=DEFAULT_KEEP):
+        self.root = os.path.abspath(root)
+        self.seed_dir = seed_dir
+        self.keep = keep
+        self.versions_dir = os.path.join(self.root, "versions")
+        self.pointer_path = os.path.join(self.root, POINTER_NAME)
+        self._pointer_key = None
+        self._state = {"current": None, "history": []}
+        self._lock = threading.Lock()
+
+    # -- reading -----------------------------------------------------------
+
+    def state(self):
+        """``{"current": id | None, "history": [older ids, newest last]}``, re-read when the pointer changes."""
+        try:
+            stat = os.stat(self.pointer_path)
+        except OSError:
+            return {"current": None, "history": []}
+        key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if key != self._pointer_key:
+            with self._lock:
+                with open(self.pointer_path, "r", encoding="utf-8") as f:
+                    self._state = json.load(f)
+                self._pointer_key = key
+        return self._state
+
+    def current_version(self):
+        return self.state().get("current")
+
+    def version_dir(self, version_id):
+        return os.path.join(self.versions_dir, version_id)
+
+    def resolve(self, relpath):
+        """Absolute path of ``relpath`` in the current version, else in the seed directory."""
+        version_id = self.current_version()
+        if version_id:
+            candidate = os.path.join(self.version_dir(version_id), relpath)
+            if os.path.exists(candidate):
+                return candidate
+        return os.path.join(self.seed_dir, relpath)
+
+    def list_versions(self):
+        if not os.path.isdir(self.versions_dir):
+            return []
+        return sorted(name for name in os.listdir(self.versions_dir) if not name.startswith("."))
+
+    # -- writing -----------------------------------------------------------
+
+    @contextmanager
+    def _locked(self):
+        """Hold the store's inter-process lock (one publish, activate or prune at a time)."""
+        os.makedirs(self.root, exist_ok=True)
+        with open(os.path.join(self.root, LOCK_NAME), "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    @contextmanager
+    def publish(self):
+        """
+        Stage a new version seeded from the current one and publish it when
+        the block exits cleanly. On error the staging directory is discarded
+        and the current version is untouched. The store stays locked for the
+        whole block, so a concurrent run waits and then stages on top of this
+        one. Raises ValueError (publishing nothing) if the current version
+        still moved while staging.
+        """
+        with self._locked():
+            version_id = _new_version_id()
+            staging = os.path.join(self.versions_dir, f".staging-{version_id}")
+            base = self.current_version()
+            base_dir = self.version_dir(base) if base else self.seed_dir
+            os.makedirs(self.versions_dir, exist_ok=True)
+            if base_dir and os.path.isdir(base_dir):
+                _link_tree(base_dir, staging)
+            else:
+                os.makedirs(staging)
+
+            version = StagedVersion(version_id, staging)
+            try:
+                yield version
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+
+            current = self.current_version()
+            if current != base:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise ValueError(
+                    f"Artifact version changed from {base} to {current} while staging {version_id}; "
+                    "rerun to rebuild on top of it"
+                )
+            os.replace(staging, self.version_dir(version_id))
+            version.path = self.version_dir(version_id)
+            self._activate(version_id)
+            self._prune(self.keep)
+
+    def _write_pointer(self, state):
+        os.makedirs(self.root, exist_ok=True)
+        data = json.dumps(dict(state, updated_at=datetime.now(timezone.utc).isoformat()), indent=2)
+        _atomic_write(self.pointer_path, data.encode("utf-8"))
+
+    def activate(self, version_id):
+        """Point readers at ``version_id``; the version it replaces becomes the rollback target."""
+        with self._locked():
+            self._activate(version_id)
+
+    def _activate(self, version_id):
+        if not os.path.isdir(self.version_dir(version_id)):
+            raise ValueError(f"Unknown artifact version: {version_id}")
+        state = self.state()
+        history = [v for v in state.get("history", []) if v != version_id]
+        if state.get("current") and state["current"] != version_id:
+            history.append(state["current"])
+        self._write_pointer({"current": version_id, "history": history})
+
+    def rollback(self):
+        """Re-activate the previous version. Returns its id."""
+        with self._locked():
+            state = self.state()
+            history = [v for v in state.get("history", []) if os.path.isdir(self.version_dir(v))]
+            if not history:
+                raise ValueError("No previous artifact version to roll back to")
+            previous = history.pop()
+            self._write_pointer({"current": previous, "history": history})
+            return previous
+
+    def prune(self, keep=DEFAULT_KEEP):
+        """
+        Delete every version except the current one and the ``keep - 1``
+        most recent rollback targets. Returns the removed ids. Staging
+        directories of runs in progress are never touched.
+        """
+        with self._locked():
+            return self._prune(keep)
+
+    def _prune(self, keep):
+        state = self.state()
+        history = state.get("history", [])
+        kept = set(history[-(keep - 1):]) if keep > 1 else set()
+        if state.get("current"):
+            kept.add(state["current"])
+        removed = [version_id for version_id in self.list_versions() if version_id not in kept]
+        for version_id in removed:
+            shutil.rmtree(self.version_dir(version_id), ignore_errors=True)
+        if any(version_id in removed for version_id in history):
+            self._write_pointer({
+                "current": state.get("current"),
+                "history": [v for v in history if v not in removed],
+            })
+        return removed
+
+    def export(self, target_dir=None):
+        """Copy the current version's JSON artifacts into ``target_dir`` (default: the seed directory)."""
+        version_id = self.current_version()
+        if not version_id:
+            raise ValueError("No artifact version has been published")
+        target_dir = target_dir or self.seed_dir
+        source_dir = self.version_dir(version_id)
+        copied = 0
+        for dirpath, _dirnames, filenames in os.walk(source_dir):
+            for filename in filenames:
+                if not filename.endswith(".json"):
+                    continue
+                source = os.path.join(dirpath, filename)
+                target = os.path.join(target_dir, os.path.relpath(source, source_dir))
+                if os.path.exists(target) and os.path.samefile(source, target):
+                    continue
+                # Replace rather than overwrite: the target may be hard-linked into older versions.
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(source, "rb") as f:
+                    _atomic_write(target, f.read())
+                copied += 1
+        return copied
+
+
+_stores = {}
+
+
+def artifact_store(root=None, seed_dir=STATIC_DATA_DIR):
+    """Shared ``ArtifactStore`` for ``root`` (default: ``Config.ARTIFACT_STORE_PATH``)."""
+    if root is None:
+        from config import Config
+
+        root = Config.ARTIFACT_STORE_PATH
+    key = (os.path.abspath(root), os.path.abspath(seed_dir))
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = ArtifactStore(root, seed_dir=seed_dir)
+    return store
+
+
+@contextmanager
+def publish_artifacts(root=None):
+    """
+    Publish a new version through the store at ``root`` (default:
+    ``Config.ARTIFACT_STORE_PATH``). With the store disabled ('') artifacts
+    are written straight into frontend/static/data as before.
+    """
+    if root is None:
+        from config import Config
+
+        root = Config.ARTIFACT_STORE_PATH
+    if not root:
+        yield StagedVersion(None, STATIC_DATA_DIR)
+        return
+    with artifact_store(root).publish() as version:
+        yield version
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage published artifact versions.")
+    parser.add_argument("--root", help="store directory (default: Config.ARTIFACT_STORE_PATH)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="show versions, marking the current one")
+    commands.add_parser("rollback", help="re-activate the previous version")
+    activate = commands.add_parser("activate", help="activate a specific version")
+    activate.add_argument("version")
+    prune = commands.add_parser("prune", help="delete old versions")
+    prune.add_argument("--keep", type=int, default=DEFAULT_KEEP)
+    commands.add_parser("export", help="copy the current version into frontend/static/data")
+    args = parser.parse_args(argv)
+
+    store = artifact_store(args.root)
+    try:
+        if args.command == "list":
+            current = store.current_version()
+            for version_id in store.list_versions():
+                print(f"{'*' if version_id == current else ' '} {version_id}")
+        elif args.command == "rollback":
+            print(f"Current version: {store.rollback()}")
+        elif args.command == "activate":
+            store.activate(args.version)
+            print(f"Current version: {args.version}")
+        elif args.command == "prune":
+            print(f"Removed: {store.prune(args.keep)}")
+        elif args.command == "export":
+            print(f"Exported {store.export()} artifacts to {store.seed_dir}")
+    except ValueError as exc:
+        parser.exit(1, f"{exc}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    main()
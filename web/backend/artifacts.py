@@ -0,0 +1,219 @@
+"""In-memory serving of the precomputed JSON artifacts under frontend/static/data.
+
+``artifact_cache`` keeps each file's bytes (plus gzip/brotli variants) in
+memory keyed by path and mtime, so the API answers from ready-made bytes
+without opening or parsing the file per request. Variants written at
+precompute time (``name.json.gz`` / ``name.json.br``, see
+``artifact_store.write_json_artifact``) are used when they are at least as new as
+the JSON; otherwise the variant is compressed once here and cached.
+
+Clients pick a representation with ``?format=json|columnar|msgpack`` or the
+matching ``Accept`` type (see ``util/artifact_format.py``); the compact ones
+are encoded once per file version and cached alongside the JSON bytes.
+
+``artifact_path`` resolves through the versioned ``ArtifactStore``, so a
+newly published (or rolled back) version is picked up on the next request.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+from flask import Response, current_app, jsonify, request
+
+from .artifact_store import artifact_store
+from .util.artifact_format import MIMETYPES, available_formats, encode_payload
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip/identity are served
+    brotli = None
+
+# Preference order when the client accepts more than one encoding.
+ENCODINGS = ("br", "gzip")
+
+
+class Artifact:
+    def __init__(self, path, stat_key, body, last_modified):
+        self.path = path
+        self.stat_key = stat_key
+        self.last_modified = last_modified
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.bodies = {("json", "identity"): body}
+        self._parsed = None
+        self._lock = threading.RLock()
+
+    def body(self, encoding, fmt="json"):
+        """Bytes for ``fmt``/``encoding``, building the variant on first use (None if unavailable)."""
+        key = (fmt, encoding)
+        if key in self.bodies:
+            return self.bodies[key]
+        with self._lock:
+            if key not in self.bodies:
+                self.bodies[key] = self._load_variant(fmt, encoding)
+        return self.bodies[key]
+
+    def _load_variant(self, fmt, encoding):
+        if encoding == "identity":
+            return encode_payload(self.json(), fmt)
+
+        if fmt == "json":
+            suffix = ".br" if encoding == "br" else ".gz"
+            sidecar = self.path + suffix
+            try:
+                if os.stat(sidecar).st_mtime_ns >= self.stat_key[0]:
+                    with open(sidecar, "rb") as f:
+                        return f.read()
+            except OSError:
+                pass
+
+        identity = self.body("identity", fmt)
+        if encoding == "gzip":
+            return gzip.compress(identity, compresslevel=6, mtime=0)
+        if encoding == "br" and brotli is not None:
+            return brotli.compress(identity, quality=5)
+        return None
+
+    def json(self):
+        """Parsed payload, decoded once per file version."""
+        if self._parsed is None:
+            self._parsed = json.loads(self.bodies[("json", "identity")])
+        return self._parsed
+
+
+class ArtifactCache:
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """Return the cached ``Artifact`` for ``path``, reloading it when the file changed; None if missing."""
+        path = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry.stat_key == stat_key:
+            return entry
+
+        with open(path, "rb") as f:
+            body = f.read()
+        last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).replace(microsecond=0)
+        entry = Artifact(path, stat_key, body, last_modified)
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def load_json(self, path, default=None):
+        artifact = self.get(path)
+        if artifact is None:
+            return default
+        try:
+            return artifact.json()
+        except ValueError:
+            return default
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+artifact_cache = ArtifactCache()
+
+
+_served_version = None
+
+
+def artifact_path(*parts):
+    """
+    Absolute path of an artifact in the currently published version, falling
+    back to frontend/static/data. Drops the cached bytes of the previous
+    version whenever the published version changes.
+    """
+    global _served_version
+    seed_dir = os.path.abspath(os.path.join(current_app.root_path, '..', 'frontend', 'static', 'data'))
+    root = current_app.config.get('ARTIFACT_STORE_PATH')
+    if not root:
+        return os.path.join(seed_dir, *parts)
+
+    store = artifact_store(root, seed_dir=seed_dir)
+    version = store.current_version()
+    if version != _served_version:
+        artifact_cache.clear()
+        _served_version = version
+    return store.resolve(os.path.join(*parts))
+
+
+def requested_format():
+    """
+    The representation the client asked for: ``?format=`` wins, then the
+    best ``Accept`` match, defaulting to plain JSON. Raises ValueError for
+    an unknown or unavailable ``format`` parameter.
+    """
+    formats = available_formats()
+    fmt = (request.args.get('format') or '').strip().lower()
+    if fmt:
+        if fmt not in formats:
+            raise ValueError(f"format must be one of {', '.join(formats)}")
+        return fmt
+    best = request.accept_mimetypes.best_match([MIMETYPES[name] for name in formats], default=MIMETYPES["json"])
+    return next(name for name in formats if MIMETYPES[name] == best)
+
+
+def _preferred_encoding(artifact, fmt):
+    for encoding in ENCODINGS:
+        if request.accept_encodings[encoding] and artifact.body(encoding, fmt) is not None:
+            return encoding
+    return "identity"
+
+
+def artifact_response(artifact):
+    """
+    Serve an artifact's pre-encoded bytes with validators.
+
+    Answers 304 when the client's If-None-Match / If-Modified-Since is
+    current; otherwise returns the negotiated format as brotli, gzip or
+    identity per Accept-Encoding.
+    """
+    try:
+        fmt = requested_format()
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+
+    etag = artifact.etag if fmt == "json" else f"{artifact.etag}-{fmt}"
+    headers = {
+        "ETag": f'W/"{etag}"',
+        "Last-Modified": artifact.last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept, Accept-Encoding",
+    }
+
+    if request.if_none_match:
+        not_modified = request.if_none_match.contains_weak(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and artifact.last_modified <= since
+    if not_modified:
+        return Response(status=304, headers=headers)
+
+    encoding = _preferred_encoding(artifact, fmt)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(artifact.body(encoding, fmt), mimetype=MIMETYPES[fmt], headers=headers)
+
+
+def payload_response(payload):
+    """Negotiated-format response for a payload computed live (no artifact on disk)."""
+    try:
+        fmt = requested_format()
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    if fmt == "json":
+        return jsonify(payload)
+    return Response(encode_payload(payload, fmt), mimetype=MIMETYPES[fmt], headers={"Vary": "Accept"})
@@ -124,3 +124,21 @@ class HouseValues(db.Model):
     year = db.Column(db.Integer, primary_key=True)
     avg_value = db.Column(db.Integer)
 
+
+# Sectional/regional hosts scraped offline by scripts/refresh_tournament_hosts.py
+class TournamentHost(db.Model):
+    __tablename__ = "tournament_host"
+    year = db.Column(db.Integer, primary_key=True)
+    gender = db.Column(db.String, db.ForeignKey("gender.gender"), primary_key=True)
+    meet_type = db.Column(db.String, db.ForeignKey("meet_type.meet_type"), primary_key=True)
+    meet_num = db.Column(db.Integer, primary_key=True)
+    host = db.Column(db.String)
+    source_url = db.Column(db.String)
+    refreshed_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Bumped by the loaders after every committed ingest (see jupyter/util/db_util.py)
+class IngestState(db.Model):
+    __tablename__ = "ingest_state"
+    key = db.Column(db.String, primary_key=True)
+    counter = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)
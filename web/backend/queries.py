@@ -9,13 +9,18 @@ if not logger.hasHandlers():
     handler.setFormatter(formatter)
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
-import html as html_lib
+from bisect import bisect_left, bisect_right
+import hashlib
+import json
+import threading
+from collections import OrderedDict, defaultdict
+from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
+from flask import current_app, g
 from sqlalchemy import or_, func, and_
 from sqlalchemy.orm import joinedload
 
@@ -27,11 +32,14 @@ from .models import (
     Meet,
     Event,
     SchoolEnrollment,
+    TournamentHost,
+    IngestState,
 )
 from . import db
 from .util.conversion_util import Conversion
+from .util.payload_cache import PayloadCache
 from .util.regional_hosts import get_configured_regional_hosts
-from .util.standards_util import meets_state_standard, get_state_standard_display
+from .util.standards_util import meets_state_standard_many, get_state_standard_display
 
 
 CONVERSION = Conversion()
@@ -2422,7 +2430,8 @@ def get_school_dashboard_data(school_id: int):
 
     roster = _build_school_roster(school_id)
     cumulative_points = _compute_cumulative_points(school_id)
-    school_percentiles = _compute_school_percentiles(school_id)
+    percentiles_by_year = _compute_school_percentiles_by_year(school_id)
+    school_percentiles = percentiles_by_year.get("all", [])
     percentile_years = _get_school_percentile_years(school_id)
     relay_results = _compute_school_relay_results(school_id)
     relay_years = sorted({row["year"] for row in relay_results if row.get("year") is not None}, reverse=True)
@@ -2432,6 +2441,7 @@ def get_school_dashboard_data(school_id: int):
         "roster": roster,
         "cumulative_points": cumulative_points,
         "school_percentiles": school_percentiles,
+        "school_percentiles_by_year": percentiles_by_year,
         "percentile_years": percentile_years,
         "relay_results": relay_results,
         "relay_years": relay_years,
@@ -2729,79 +2739,73 @@ def _compute_cumulative_points(school_id: int):
     return result
 
 
-def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
+def _athlete_season_marks(rows):
     """
-    For each event+gender (individual AND relay), compute the school's
-    best mark percentile relative to all statewide results, plus the
-    top-2 athletes per individual event (for "Avg of Top 2" metric).
+    Collapse rows to per-athlete-per-year season-best marks using
+    the Final-preferred / Prelim-fallback rule per meet.
 
-    Per-athlete season mark rule (individual events):
-      • Per meet, prefer the athlete's Final result; fall back to Prelim
-        when no Final exists (relevant for 100, 200, 100H, 110H).
-      • Season best = best of those per-meet marks across all meets.
+    rows: iterable of objects exposing
+        athlete_id, event, meet_id, result_type, result2,
+        event_type, year (Meet.year)
 
-    If *year* is given, only results from that single season are
-    considered (for both the school and statewide comparison).
-    Otherwise all results since MIN_RECORDS_YEAR are used.
+    Returns dict: (event, year, athlete_id) -> {
+        "mark_raw": float,
+        "event_type": str,
+    }
     """
+    # Step 1: per (athlete, event, meet) keep one mark — Final preferred.
+    per_meet = {}  # (athlete_id, event, meet_id) -> {result_type: (result2, year)}
+    event_type_map = {}
+    for r in rows:
+        key = (r.athlete_id, r.event, r.meet_id)
+        per_meet.setdefault(key, {})[r.result_type] = (r.result2, r.year)
+        event_type_map[r.event] = r.event_type
+
+    # Step 2: per (athlete, event, year) take season best across that year's meets.
+    season = {}  # (event, year, athlete_id) -> best dict
+    for (athlete_id, event, _meet_id), marks in per_meet.items():
+        picked = marks.get("Final") or marks.get("Prelim")
+        if picked is None:
+            # Fallback for any other result_type values — take first available.
+            picked = next(iter(marks.values()), None)
+        if picked is None:
+            continue
+        mark_val, mark_year = picked
+        event_type = event_type_map[event]
+        lower = _is_lower_better(event_type)
+        existing = season.get((event, mark_year, athlete_id))
+        if existing is None or (
+            (lower and mark_val < existing["mark_raw"])
+            or (not lower and mark_val > existing["mark_raw"])
+        ):
+            season[(event, mark_year, athlete_id)] = {
+                "mark_raw": mark_val,
+                "event_type": event_type,
+            }
+    return season
 
-    year_filter = (Meet.year == year) if year else (Meet.year >= MIN_RECORDS_YEAR)
-
-    def _athlete_season_marks(rows):
-        """
-        Collapse rows to per-athlete-per-year season-best marks using
-        the Final-preferred / Prelim-fallback rule per meet.
 
-        rows: iterable of objects exposing
-            athlete_id, event, meet_id, result_type, result2,
-            event_type, year (Meet.year)
+@lru_cache(maxsize=1)
+def _statewide_percentile_marks(data_version: str):
+    """
+    Sorted statewide comparison marks for every percentile scope, built
+    from one pass over the individual and relay results. Cached for one
+    qualifier_data_version(), so the next ingest rebuilds it.
 
-        Returns dict: (event, year, athlete_id) -> {
-            "mark_raw": float,
-            "event_type": str,
-        }
-        """
-        # Step 1: per (athlete, event, meet) keep one mark — Final preferred.
-        per_meet = {}  # (athlete_id, event, meet_id) -> {result_type: (result2, year)}
-        event_type_map = {}
-        for r in rows:
-            key = (r.athlete_id, r.event, r.meet_id)
-            per_meet.setdefault(key, {})[r.result_type] = (r.result2, r.year)
-            event_type_map[r.event] = r.event_type
-
-        # Step 2: per (athlete, event, year) take season best across that year's meets.
-        season = {}  # (event, year, athlete_id) -> best dict
-        for (athlete_id, event, _meet_id), marks in per_meet.items():
-            picked = marks.get("Final") or marks.get("Prelim")
-            if picked is None:
-                # Fallback for any other result_type values — take first available.
-                picked = next(iter(marks.values()), None)
-            if picked is None:
-                continue
-            mark_val, mark_year = picked
-            event_type = event_type_map[event]
-            lower = _is_lower_better(event_type)
-            existing = season.get((event, mark_year, athlete_id))
-            if existing is None or (
-                (lower and mark_val < existing["mark_raw"])
-                or (not lower and mark_val > existing["mark_raw"])
-            ):
-                season[(event, mark_year, athlete_id)] = {
-                    "mark_raw": mark_val,
-                    "event_type": event_type,
-                }
-        return season
+    Scope is ``"all"`` (each athlete/school's best since MIN_RECORDS_YEAR)
+    or a season year as a string (the season best within that year).
 
-    # ── School individual results ──
-    school_indiv_rows = (
+    Returns dict: {"indiv": {(scope, event, gender): [marks]},
+                   "relay": {(scope, event, gender): [marks]}}
+    with every mark list sorted ascending for bisect lookups.
+    """
+    all_indiv_rows = (
         db.session.query(
             AthleteResult.event,
             AthleteResult.meet_id,
             AthleteResult.result_type,
             AthleteResult.result2,
             AthleteResult.athlete_id,
-            Athlete.first,
-            Athlete.last,
             Athlete.gender,
             Event.event_type,
             Meet.year,
@@ -2810,39 +2814,86 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
         .join(Meet, AthleteResult.meet_id == Meet.meet_id)
         .join(Event, AthleteResult.event == Event.event)
         .filter(
-            Athlete.school_id == school_id,
             AthleteResult.result2.isnot(None),
-            year_filter,
+            Meet.year >= MIN_RECORDS_YEAR,
             Event.event_type != "Relay",
         )
         .all()
     )
 
-    # athlete metadata for name + gender lookups
-    school_athlete_meta = {}  # athlete_id -> (name, gender)
-    for r in school_indiv_rows:
-        if r.athlete_id not in school_athlete_meta:
-            school_athlete_meta[r.athlete_id] = (
-                "{} {}".format(r.first, r.last).strip(),
-                r.gender,
-            )
+    sw_athlete_gender = {}
+    for r in all_indiv_rows:
+        if r.athlete_id not in sw_athlete_gender:
+            sw_athlete_gender[r.athlete_id] = r.gender
 
-    school_season = _athlete_season_marks(school_indiv_rows)
+    indiv_marks = {}
+    sw_athlete_best = {}  # (event, gender, athlete_id) -> best mark across seasons
+    for (event, season_year, athlete_id), info in _athlete_season_marks(all_indiv_rows).items():
+        gender = sw_athlete_gender.get(athlete_id)
+        if gender is None:
+            continue
+        indiv_marks.setdefault((str(season_year), event, gender), []).append(info["mark_raw"])
 
-    # Group school season-bests by (event, gender, year) → list of athlete entries.
-    school_event_year_athletes = {}  # (event, gender, year) -> list of dicts
-    for (event, season_year, athlete_id), info in school_season.items():
-        name, gender = school_athlete_meta[athlete_id]
-        school_event_year_athletes.setdefault((event, gender, season_year), []).append({
-            "athlete_id": athlete_id,
-            "name": name,
-            "mark_raw": info["mark_raw"],
-            "year": season_year,
-            "event_type": info["event_type"],
-        })
+        lower = _is_lower_better(info["event_type"])
+        key = (event, gender, athlete_id)
+        existing = sw_athlete_best.get(key)
+        if existing is None or (
+            (lower and info["mark_raw"] < existing)
+            or (not lower and info["mark_raw"] > existing)
+        ):
+            sw_athlete_best[key] = info["mark_raw"]
+    for (event, gender, _aid), mark in sw_athlete_best.items():
+        indiv_marks.setdefault(("all", event, gender), []).append(mark)
+
+    # Relay school bests per season; the all-time best is the min across seasons.
+    all_relay_rows = (
+        db.session.query(
+            RelayResult.event,
+            Meet.gender,
+            Meet.year,
+            RelayResult.school_id,
+            func.min(RelayResult.result2).label("best"),
+        )
+        .join(Meet, RelayResult.meet_id == Meet.meet_id)
+        .filter(
+            RelayResult.result2.isnot(None),
+            Meet.year >= MIN_RECORDS_YEAR,
+        )
+        .group_by(RelayResult.event, Meet.gender, Meet.year, RelayResult.school_id)
+        .all()
+    )
+
+    relay_marks = {}
+    relay_school_best = {}  # (event, gender, school_id) -> best mark across seasons
+    for row in all_relay_rows:
+        relay_marks.setdefault((str(row.year), row.event, row.gender), []).append(row.best)
+        key = (row.event, row.gender, row.school_id)
+        existing = relay_school_best.get(key)
+        if existing is None or row.best < existing:
+            relay_school_best[key] = row.best
+    for (event, gender, _sid), mark in relay_school_best.items():
+        relay_marks.setdefault(("all", event, gender), []).append(mark)
+
+    for marks in indiv_marks.values():
+        marks.sort()
+    for marks in relay_marks.values():
+        marks.sort()
+
+    return {"indiv": indiv_marks, "relay": relay_marks}
+
+
+def _school_percentile_table(school_event_year_athletes, relay_rows, statewide, scope):
+    """
+    Build the percentile rows for one scope ("all" or a season year string)
+    from the school's pre-collapsed season marks and relay rows.
+    """
+    scoped_athletes = {
+        key: athletes for key, athletes in school_event_year_athletes.items()
+        if scope == "all" or str(key[2]) == scope
+    }
 
     # Collect unique (event, gender) pairs.
-    event_gender_pairs = {(e, g) for (e, g, _y) in school_event_year_athletes.keys()}
+    event_gender_pairs = {(e, g) for (e, g, _y) in scoped_athletes.keys()}
 
     # For each (event, gender):
     #   • Best = single best mark across all athletes/seasons → that holder + year.
@@ -2853,7 +2904,7 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
     indiv_best = {}
     for (event, gender) in event_gender_pairs:
         year_groups = {
-            y: lst for (e, g, y), lst in school_event_year_athletes.items()
+            y: lst for (e, g, y), lst in scoped_athletes.items()
             if e == event and g == gender
         }
         # event_type is consistent across rows for this event.
@@ -2876,7 +2927,6 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
         # ── Peak duo: pick the single season with the best top-2 average ──
         peak_top2 = None
         peak_avg = None
-        peak_year = None
         for y, athletes in year_groups.items():
             if len(athletes) < 2:
                 continue
@@ -2890,7 +2940,6 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
             ):
                 peak_avg = avg
                 peak_top2 = top2
-                peak_year = y
 
         if peak_top2 is not None:
             top_athletes = peak_top2
@@ -2921,27 +2970,10 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
         }
 
     # ── Relay events ──
-    relay_rows = (
-        db.session.query(
-            RelayResult.event,
-            RelayResult.result2,
-            RelayResult.athlete_names,
-            Meet.gender,
-            Meet.year,
-            Event.event_type,
-        )
-        .join(Meet, RelayResult.meet_id == Meet.meet_id)
-        .join(Event, RelayResult.event == Event.event)
-        .filter(
-            RelayResult.school_id == school_id,
-            RelayResult.result2.isnot(None),
-            year_filter,
-        )
-        .all()
-    )
-
     relay_best = {}
     for row in relay_rows:
+        if scope != "all" and str(row.year) != scope:
+            continue
         key = (row.event, row.gender)
         lower_is_better = _is_lower_better(row.event_type)
         existing = relay_best.get(key)
@@ -2973,111 +3005,24 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
     all_bests.update(indiv_best)
     all_bests.update(relay_best)
 
-    if not all_bests:
-        return []
-
-    # ── OPTIMIZATION: Pre-fetch ALL statewide individual bests in ONE query ──
-    indiv_events = [(e, g) for (e, g), info in all_bests.items() if not info["is_relay"]]
-    relay_events = [(e, g) for (e, g), info in all_bests.items() if info["is_relay"]]
-
-    # Structure: {(event, gender): [(athlete_id, best_mark), ...]}
-    statewide_indiv_bests = {}
-    statewide_relay_bests = {}
-
-    if indiv_events:
-        # Pull all statewide individual results (with result_type + meet_id) and
-        # collapse to per-athlete season bests using the Final-preferred /
-        # Prelim-fallback rule — same logic used for the school above.
-        all_indiv_rows = (
-            db.session.query(
-                AthleteResult.event,
-                AthleteResult.meet_id,
-                AthleteResult.result_type,
-                AthleteResult.result2,
-                AthleteResult.athlete_id,
-                Athlete.gender,
-                Event.event_type,
-                Meet.year,
-            )
-            .join(Athlete, AthleteResult.athlete_id == Athlete.athlete_id)
-            .join(Meet, AthleteResult.meet_id == Meet.meet_id)
-            .join(Event, AthleteResult.event == Event.event)
-            .filter(
-                AthleteResult.result2.isnot(None),
-                year_filter,
-                Event.event_type != "Relay",
-            )
-            .all()
-        )
-
-        sw_athlete_gender = {}
-        for r in all_indiv_rows:
-            if r.athlete_id not in sw_athlete_gender:
-                sw_athlete_gender[r.athlete_id] = r.gender
-
-        sw_season = _athlete_season_marks(all_indiv_rows)
-        # Aggregate each athlete's overall best across seasons (matches the
-        # school's "best ever" measure used for the percentile comparison).
-        sw_athlete_best = {}  # (event, gender, athlete_id) -> best mark
-        for (event, _season_year, athlete_id), info in sw_season.items():
-            gender = sw_athlete_gender.get(athlete_id)
-            if gender is None:
-                continue
-            lower = _is_lower_better(info["event_type"])
-            key = (event, gender, athlete_id)
-            existing = sw_athlete_best.get(key)
-            if existing is None or (
-                (lower and info["mark_raw"] < existing)
-                or (not lower and info["mark_raw"] > existing)
-            ):
-                sw_athlete_best[key] = info["mark_raw"]
-        for (event, gender, _aid), mark in sw_athlete_best.items():
-            statewide_indiv_bests.setdefault((event, gender), []).append(mark)
-
-    if relay_events:
-        # Get all relay school bests grouped by event+gender in one query
-        all_relay_rows = (
-            db.session.query(
-                RelayResult.event,
-                Meet.gender,
-                RelayResult.school_id,
-                func.min(RelayResult.result2).label("best"),
-            )
-            .join(Meet, RelayResult.meet_id == Meet.meet_id)
-            .filter(
-                RelayResult.result2.isnot(None),
-                year_filter,
-            )
-            .group_by(RelayResult.event, Meet.gender, RelayResult.school_id)
-            .all()
-        )
-        
-        for row in all_relay_rows:
-            key = (row.event, row.gender)
-            if key not in statewide_relay_bests:
-                statewide_relay_bests[key] = []
-            statewide_relay_bests[key].append(row.best)
-
-    # ── Calculate percentiles using pre-fetched data ──
+    # ── Calculate percentiles against the pre-sorted statewide marks ──
     results = []
     for (event_name, gender), info in sorted(all_bests.items()):
         event_type = info["event_type"]
         lower_is_better = _is_lower_better(event_type)
         school_best_val = info["raw"]
 
-        if info["is_relay"]:
-            all_marks = statewide_relay_bests.get((event_name, gender), [])
-        else:
-            all_marks = statewide_indiv_bests.get((event_name, gender), [])
+        pool = statewide["relay"] if info["is_relay"] else statewide["indiv"]
+        all_marks = pool.get((scope, event_name, gender), [])
 
         if not all_marks:
             continue
 
         total = len(all_marks)
         if lower_is_better:
-            better_or_equal = sum(1 for m in all_marks if m <= school_best_val)
+            better_or_equal = bisect_right(all_marks, school_best_val)
         else:
-            better_or_equal = sum(1 for m in all_marks if m >= school_best_val)
+            better_or_equal = total - bisect_left(all_marks, school_best_val)
 
         percentile = round((1 - better_or_equal / total) * 100, 1)
         # Cap at 99.9: the school's own athlete is in the statewide pool, so
@@ -3111,33 +3056,133 @@ def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
     return results
 
 
-def _get_school_percentile_years(school_id: int) -> List[int]:
-    """Return sorted list of years (descending) that a school has results (individual or relay)."""
-    indiv_years = (
-        db.session.query(Meet.year)
-        .join(AthleteResult, AthleteResult.meet_id == Meet.meet_id)
+def _compute_school_percentiles_by_year(school_id: int):
+    """
+    Every percentile scope for a school (see _school_percentiles_by_year),
+    cached until the next ingest moves qualifier_data_version().
+    """
+    return _school_percentiles_by_year(school_id, qualifier_data_version())
+
+
+@lru_cache(maxsize=256)
+def _school_percentiles_by_year(school_id: int, data_version: str):
+    """
+    For each event+gender (individual AND relay), compute the school's
+    best mark percentile relative to all statewide results, plus the
+    top-2 athletes per individual event (for "Avg of Top 2" metric).
+
+    Every scope the dashboard offers is produced from a single pass over
+    the school's results: ``"all"`` covers every season since
+    MIN_RECORDS_YEAR, and each season year (as a string key) covers only
+    that season for both the school and the statewide comparison.
+
+    Per-athlete season mark rule (individual events):
+      • Per meet, prefer the athlete's Final result; fall back to Prelim
+        when no Final exists (relevant for 100, 200, 100H, 110H).
+      • Season best = best of those per-meet marks across all meets.
+
+    Returns dict: {"all": [...], "2026": [...], "2025": [...], ...} with
+    season keys ordered newest first.
+    """
+
+    # ── School individual results ──
+    school_indiv_rows = (
+        db.session.query(
+            AthleteResult.event,
+            AthleteResult.meet_id,
+            AthleteResult.result_type,
+            AthleteResult.result2,
+            AthleteResult.athlete_id,
+            Athlete.first,
+            Athlete.last,
+            Athlete.gender,
+            Event.event_type,
+            Meet.year,
+        )
         .join(Athlete, AthleteResult.athlete_id == Athlete.athlete_id)
+        .join(Meet, AthleteResult.meet_id == Meet.meet_id)
+        .join(Event, AthleteResult.event == Event.event)
         .filter(
             Athlete.school_id == school_id,
             AthleteResult.result2.isnot(None),
             Meet.year >= MIN_RECORDS_YEAR,
+            Event.event_type != "Relay",
         )
-        .distinct()
         .all()
     )
-    relay_years = (
-        db.session.query(Meet.year)
-        .join(RelayResult, RelayResult.meet_id == Meet.meet_id)
+
+    # athlete metadata for name + gender lookups
+    school_athlete_meta = {}  # athlete_id -> (name, gender)
+    for r in school_indiv_rows:
+        if r.athlete_id not in school_athlete_meta:
+            school_athlete_meta[r.athlete_id] = (
+                "{} {}".format(r.first, r.last).strip(),
+                r.gender,
+            )
+
+    school_season = _athlete_season_marks(school_indiv_rows)
+
+    # Group school season-bests by (event, gender, year) → list of athlete entries.
+    school_event_year_athletes = {}  # (event, gender, year) -> list of dicts
+    for (event, season_year, athlete_id), info in school_season.items():
+        name, gender = school_athlete_meta[athlete_id]
+        school_event_year_athletes.setdefault((event, gender, season_year), []).append({
+            "athlete_id": athlete_id,
+            "name": name,
+            "mark_raw": info["mark_raw"],
+            "year": season_year,
+            "event_type": info["event_type"],
+        })
+
+    # ── School relay results ──
+    relay_rows = (
+        db.session.query(
+            RelayResult.event,
+            RelayResult.result2,
+            RelayResult.athlete_names,
+            Meet.gender,
+            Meet.year,
+            Event.event_type,
+        )
+        .join(Meet, RelayResult.meet_id == Meet.meet_id)
+        .join(Event, RelayResult.event == Event.event)
         .filter(
             RelayResult.school_id == school_id,
             RelayResult.result2.isnot(None),
             Meet.year >= MIN_RECORDS_YEAR,
         )
-        .distinct()
         .all()
     )
-    all_years = set(r.year for r in indiv_years) | set(r.year for r in relay_years)
-    return sorted(all_years, reverse=True)
+
+    season_years = {y for (_e, _g, y) in school_event_year_athletes.keys()}
+    season_years.update(row.year for row in relay_rows)
+
+    if not season_years:
+        return {"all": []}
+
+    statewide = _statewide_percentile_marks(data_version)
+    tables = {"all": _school_percentile_table(school_event_year_athletes, relay_rows, statewide, "all")}
+    for season_year in sorted(season_years, reverse=True):
+        scope = str(season_year)
+        tables[scope] = _school_percentile_table(school_event_year_athletes, relay_rows, statewide, scope)
+    return tables
+
+
+def _compute_school_percentiles(school_id: int, year: Optional[int] = None):
+    """
+    Return the school's percentile rows for one scope.
+
+    If *year* is given, only results from that single season are
+    considered (for both the school and statewide comparison).
+    Otherwise all results since MIN_RECORDS_YEAR are used.
+    """
+    scope = str(year) if year else "all"
+    return _compute_school_percentiles_by_year(school_id).get(scope, [])
+
+
+def _get_school_percentile_years(school_id: int) -> List[int]:
+    """Return sorted list of years (descending) that a school has results (individual or relay)."""
+    return [int(key) for key in _compute_school_percentiles_by_year(school_id) if key != "all"]
 
 
 def _format_result_display(raw_value, event_type):
@@ -3353,6 +3398,11 @@ REGIONAL_SECTIONAL_GROUPS = {
     7: (25, 26, 27, 28),
     8: (29, 30, 31, 32),
 }
+SECTIONAL_TO_REGIONAL = {
+    sectional_num: regional_num
+    for regional_num, feeders in REGIONAL_SECTIONAL_GROUPS.items()
+    for sectional_num in feeders
+}
 REGIONAL_TARGET_FIELD_SIZE = 16
 STATE_TARGET_FIELD_SIZE_BY_YEAR = {
     2023: 27,
@@ -3362,6 +3412,23 @@ STATE_TARGET_FIELD_SIZE_BY_YEAR = {
 }
 
 
+def qualifier_dependents(meet_type: str, meet_nums) -> dict:
+    """
+    What has to be rebuilt when the given meets load or change.
+
+    Follows the tournament chain: a sectional feeds one regional (via
+    ``REGIONAL_SECTIONAL_GROUPS``) and the regionals feed state. Returns
+    ``{"regionals": [regional_num, ...], "state": bool}``.
+    """
+    nums = {int(num) for num in meet_nums}
+    if meet_type == "Sectional":
+        regionals = sorted({SECTIONAL_TO_REGIONAL[num] for num in nums if num in SECTIONAL_TO_REGIONAL})
+        return {"regionals": regionals, "state": False}
+    if meet_type == "Regional":
+        return {"regionals": [], "state": bool(nums & set(REGIONAL_SECTIONAL_GROUPS))}
+    return {"regionals": [], "state": False}
+
+
 def _state_target_field_size(year: int) -> int:
     try:
         parsed_year = int(year)
@@ -3395,104 +3462,37 @@ def _regional_events_for_gender(gender: str):
     return events
 
 
-@lru_cache(maxsize=32)
-def _ihsaa_regional_hosts(year: int, gender: str):
-    gender_slug = "boys" if str(gender).strip().lower() == "boys" else "girls"
-    parsed_year = int(year)
-    season_slug = f"{parsed_year - 1}-{parsed_year % 100:02d}"
-    url = f"https://www.ihsaa.org/sports/{gender_slug}/track-field/{season_slug}-tournament?round=regionals"
+def _registered_tournament_hosts(year: int, gender: str, meet_type: str):
+    """
+    Hosts from the ``tournament_host`` registry, keyed by meet number.
 
-    try:
-        request = Request(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+    The registry is filled offline by ``scripts/refresh_tournament_hosts.py``
+    so request paths never wait on ihsaa.org. Lookups are memoized on
+    ``flask.g``, i.e. for the current request (app context) only, so every
+    worker sees a refresh on its next request.
+    """
+    key = (int(year), (gender or "").strip().title(), meet_type)
+    memo = g.setdefault("tournament_hosts", {})
+    if key not in memo:
+        rows = (
+            db.session.query(TournamentHost.meet_num, TournamentHost.host)
+            .filter(
+                TournamentHost.year == key[0],
+                TournamentHost.gender == key[1],
+                TournamentHost.meet_type == meet_type,
+            )
+            .all()
         )
-        with urlopen(request, timeout=20) as response:
-            html = response.read().decode("utf-8", errors="ignore")
-    except Exception:
-        return {}
-
-    hosts = {}
+        memo[key] = {int(meet_num): host for meet_num, host in rows if host}
+    return memo[key]
 
-    # The tournament page includes sectional and regional rows together.
-    # Regional rows include "Sectional Host:" in their text.
-    paragraphs = re.findall(r"<p[^>]*>.*?</p>", html, flags=re.IGNORECASE | re.DOTALL)
-    for block in paragraphs:
-        lower_block = block.lower()
-        if "in.milesplit.com" not in lower_block or "/results" not in lower_block:
-            continue
-        if "sectional host:" not in lower_block:
-            continue
 
-        text = re.sub(r"<[^>]+>", " ", block)
-        text = html_lib.unescape(re.sub(r"\s+", " ", text)).strip()
-
-        before_tickets = text.split("Tickets", 1)[0].strip()
-        match = re.match(r"^(\d{1,2})\.\s*(.+)$", before_tickets)
-        if not match:
-            continue
-
-        regional_num = int(match.group(1))
-        host = re.sub(
-            r"\s+\d{1,2}(?::\d{2})?\s*[ap]m(?:\s*[A-Z]{2})?$",
-            "",
-            match.group(2).strip(),
-            flags=re.IGNORECASE,
-        ).strip(" -")
-        host = re.sub(r"\s*\(\d+\)\s*$", "", host).strip()
-        if host and regional_num not in hosts:
-            hosts[regional_num] = host
-
-    return hosts
+def _ihsaa_regional_hosts(year: int, gender: str):
+    return _registered_tournament_hosts(year, gender, "Regional")
 
 
-@lru_cache(maxsize=32)
 def _ihsaa_sectional_hosts(year: int, gender: str):
-    gender_slug = "boys" if str(gender).strip().lower() == "boys" else "girls"
-    parsed_year = int(year)
-    season_slug = f"{parsed_year - 1}-{parsed_year % 100:02d}"
-    url = f"https://www.ihsaa.org/sports/{gender_slug}/track-field/{season_slug}-tournament?round=sectionals"
-
-    try:
-        request = Request(
-            url,
-            headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
-        )
-        with urlopen(request, timeout=20) as response:
-            html = response.read().decode("utf-8", errors="ignore")
-    except Exception:
-        return {}
-
-    hosts = {}
-    paragraphs = re.findall(r"<p[^>]*>.*?</p>", html, flags=re.IGNORECASE | re.DOTALL)
-    for block in paragraphs:
-        lower_block = block.lower()
-        if "in.milesplit.com" not in lower_block or "/results" not in lower_block:
-            continue
-        if "schools:" not in lower_block:
-            continue
-
-        text = re.sub(r"<[^>]+>", " ", block)
-        text = html_lib.unescape(re.sub(r"\s+", " ", text)).strip()
-
-        before_tickets = text.split("Tickets", 1)[0].strip()
-        match = re.match(r"^(\d{1,2})\.\s*(.+)$", before_tickets)
-        if not match:
-            continue
-
-        sectional_num = int(match.group(1))
-        host = re.sub(
-            r"\s+\d{1,2}(?::\d{2})?\s*[ap]m(?:\s*[A-Z]{2})?$",
-            "",
-            match.group(2).strip(),
-            flags=re.IGNORECASE,
-        ).strip(" -")
-        host = re.sub(r"\s*\(\d+\)\s*$", "", host).strip()
-
-        if 1 <= sectional_num <= 32 and host and sectional_num not in hosts:
-            hosts[sectional_num] = host
-
-    return hosts
+    return _registered_tournament_hosts(year, gender, "Sectional")
 
 
 def _display_sectional_host(host: Optional[str], meet_num: Optional[int], year: int, gender: str) -> str:
@@ -3539,6 +3539,63 @@ def _regional_hosts_for_year(year: int, gender: str):
     return regional_hosts
 
 
+def qualifier_data_version() -> str:
+    """
+    Token that changes whenever meets are loaded.
+
+    Built from max(meet_id), the meet count and the loaders' ingest counter,
+    so it only reads the small meet and ingest_state tables.
+    """
+    max_meet_id, meet_count = db.session.query(func.max(Meet.meet_id), func.count(Meet.meet_id)).one()
+    ingest_counter = (
+        db.session.query(IngestState.counter)
+        .filter(IngestState.key == "results")
+        .scalar()
+    )
+    return f"{max_meet_id or 0}.{meet_count or 0}.{ingest_counter or 0}"
+
+
+def bump_ingest_counter() -> None:
+    """
+    Move ``qualifier_data_version()`` after a write made outside the loaders
+    (e.g. the tournament host registry). The caller commits.
+    """
+    state = db.session.get(IngestState, "results")
+    if state is None:
+        db.session.add(IngestState(key="results", counter=1))
+    else:
+        state.counter = IngestState.counter + 1
+        state.updated_at = datetime.utcnow()
+
+
+# (kind, gender, year) -> (data_version, payload), least recently used first;
+# one per worker process. Bounded because the year comes from the query string.
+_STATUS_CACHE = OrderedDict()
+_STATUS_CACHE_SIZE = 32
+_STATUS_CACHE_LOCK = threading.Lock()
+
+
+def _cached_status(kind: str, gender: str, year: int, build):
+    """Return the cached status payload, rebuilding it only when the data version moves."""
+    version = qualifier_data_version()
+    key = (kind, gender, year)
+    with _STATUS_CACHE_LOCK:
+        cached = _STATUS_CACHE.get(key)
+        if cached is not None and cached[0] == version:
+            _STATUS_CACHE.move_to_end(key)
+            return cached[1]
+
+    payload = build()
+    payload["generated_at"] = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    payload["data_version"] = version
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE[key] = (version, payload)
+        _STATUS_CACHE.move_to_end(key)
+        while len(_STATUS_CACHE) > _STATUS_CACHE_SIZE:
+            _STATUS_CACHE.popitem(last=False)
+    return payload
+
+
 def _regional_group_status(year: int, gender: str):
     meet_nums = (
         db.session.query(Meet.meet_num)
@@ -3603,10 +3660,12 @@ def get_regional_qualifiers_status(gender: str, year: int = CURRENT_QUALIFIER_YE
     if clean_gender not in ("Boys", "Girls"):
         raise ValueError("gender must be Boys or Girls")
 
-    payload = _regional_group_status(year, clean_gender)
-    payload["generated_at"] = str(db.session.query(func.datetime("now")).scalar())
-    payload["disclaimer"] = "Unofficial until IHSAA confirmation."
-    return payload
+    def build():
+        payload = _regional_group_status(year, clean_gender)
+        payload["disclaimer"] = "Unofficial until IHSAA confirmation."
+        return payload
+
+    return _cached_status("regional", clean_gender, year, build)
 
 
 def _state_group_status(year: int, gender: str):
@@ -3662,10 +3721,12 @@ def get_state_qualifiers_status(gender: str, year: int = CURRENT_QUALIFIER_YEAR)
     if clean_gender not in ("Boys", "Girls"):
         raise ValueError("gender must be Boys or Girls")
 
-    payload = _state_group_status(year, clean_gender)
-    payload["generated_at"] = str(db.session.query(func.datetime("now")).scalar())
-    payload["disclaimer"] = "Unofficial until IHSAA confirmation."
-    return payload
+    def build():
+        payload = _state_group_status(year, clean_gender)
+        payload["disclaimer"] = "Unofficial until IHSAA confirmation."
+        return payload
+
+    return _cached_status("state", clean_gender, year, build)
 
 
 def _extend_to_cutoff_with_ties(rows, target_count):
@@ -3751,6 +3812,84 @@ def _qualifier_sort_key(row, lower_is_better: bool):
     return value
 
 
+def _relay_qualifier_query(gender: str, year: int, feeder_meet_nums: tuple, source_meet_type: str, event_name: str = None):
+    filters = [
+        Meet.meet_type == source_meet_type,
+        Meet.year == year,
+        Meet.gender == gender,
+        Meet.meet_num.in_(feeder_meet_nums),
+        RelayResult.result2.isnot(None),
+        RelayResult.place.isnot(None),
+    ]
+    if event_name is not None:
+        filters.append(RelayResult.event == event_name)
+    return (
+        db.session.query(
+            RelayResult.school_id.label("school_id"),
+            School.school_name.label("school_name"),
+            RelayResult.event.label("event"),
+            RelayResult.result.label("result"),
+            RelayResult.result2.label("result2"),
+            RelayResult.place.label("place"),
+            Meet.host.label("host"),
+            Meet.meet_num.label("meet_num"),
+        )
+        .join(Meet, RelayResult.meet_id == Meet.meet_id)
+        .join(School, RelayResult.school_id == School.school_id)
+        .filter(*filters)
+        .order_by(Meet.meet_num, RelayResult.place, RelayResult.school_id)
+    )
+
+
+def _individual_qualifier_query(gender: str, year: int, feeder_meet_nums: tuple, source_meet_type: str, event_name: str = None):
+    filters = [
+        Meet.meet_type == source_meet_type,
+        Meet.year == year,
+        Meet.gender == gender,
+        Meet.meet_num.in_(feeder_meet_nums),
+        AthleteResult.result_type == "Final",
+        AthleteResult.result2.isnot(None),
+        AthleteResult.place.isnot(None),
+    ]
+    if event_name is not None:
+        filters.append(AthleteResult.event == event_name)
+    return (
+        db.session.query(
+            AthleteResult.athlete_id.label("athlete_id"),
+            Athlete.first.label("first"),
+            Athlete.last.label("last"),
+            Athlete.school_id.label("school_id"),
+            AthleteResult.grade.label("grade"),
+            School.school_name.label("school_name"),
+            AthleteResult.event.label("event"),
+            AthleteResult.result.label("result"),
+            AthleteResult.result2.label("result2"),
+            AthleteResult.place.label("place"),
+            Meet.host.label("host"),
+            Meet.meet_num.label("meet_num"),
+        )
+        .join(Athlete, AthleteResult.athlete_id == Athlete.athlete_id)
+        .join(School, Athlete.school_id == School.school_id)
+        .join(Meet, AthleteResult.meet_id == Meet.meet_id)
+        .filter(*filters)
+        .order_by(Meet.meet_num, AthleteResult.place, AthleteResult.athlete_id)
+    )
+
+
+def _fetch_qualifier_rows_by_event(gender: str, year: int, feeder_meet_nums: tuple, source_meet_type: str = "Sectional"):
+    """
+    Load every feeder result for a gender/season in two queries (relay and
+    individual) and group the rows by event, so callers scoring many events
+    or regionals don't go back to the database once per event.
+    """
+    rows_by_event = defaultdict(list)
+    for row in _relay_qualifier_query(gender, year, feeder_meet_nums, source_meet_type).all():
+        rows_by_event[row.event].append(row)
+    for row in _individual_qualifier_query(gender, year, feeder_meet_nums, source_meet_type).all():
+        rows_by_event[row.event].append(row)
+    return rows_by_event
+
+
 def _compute_event_qualifiers(
     event_name: str,
     gender: str,
@@ -3758,36 +3897,26 @@ def _compute_event_qualifiers(
     feeder_meet_nums: tuple,
     source_meet_type: str = "Sectional",
     target_field_size: int = REGIONAL_TARGET_FIELD_SIZE,
+    rows=None,
 ):
+    """
+    Build the projected qualifier list for one event.
+
+    ``rows`` may carry feeder results already loaded by
+    ``_fetch_qualifier_rows_by_event``; they are narrowed to
+    ``feeder_meet_nums`` here. Without them the event is queried directly.
+    """
     event_type = _get_event_types_map().get(event_name, "Track")
     lower_is_better = event_type != "Field"
 
-    if "Relay" in event_name:
-        rows = (
-            db.session.query(
-                RelayResult.school_id.label("school_id"),
-                School.school_name.label("school_name"),
-                RelayResult.event.label("event"),
-                RelayResult.result.label("result"),
-                RelayResult.result2.label("result2"),
-                RelayResult.place.label("place"),
-                Meet.host.label("host"),
-                Meet.meet_num.label("meet_num"),
-            )
-            .join(Meet, RelayResult.meet_id == Meet.meet_id)
-            .join(School, RelayResult.school_id == School.school_id)
-            .filter(
-                Meet.meet_type == source_meet_type,
-                Meet.year == year,
-                Meet.gender == gender,
-                Meet.meet_num.in_(feeder_meet_nums),
-                RelayResult.event == event_name,
-                RelayResult.result2.isnot(None),
-                RelayResult.place.isnot(None),
-            )
-            .all()
-        )
+    if rows is None:
+        query_fn = _relay_qualifier_query if "Relay" in event_name else _individual_qualifier_query
+        rows = query_fn(gender, year, feeder_meet_nums, source_meet_type, event_name).all()
+    else:
+        feeder_set = set(feeder_meet_nums)
+        rows = [row for row in rows if row.meet_num in feeder_set]
 
+    if "Relay" in event_name:
         # Detect which sectionals are missing the event entirely
         present_meet_nums = {row.meet_num for row in rows}
         missing_event_meet_nums = set(feeder_meet_nums) - present_meet_nums
@@ -3801,10 +3930,10 @@ def _compute_event_qualifiers(
         others = [row for row in rows if row.place is not None and row.place > 3]
         others_sorted = sorted(others, key=lambda row: row.result2, reverse=not lower_is_better)
 
-        standard_qualifiers = [
-            row for row in others_sorted
-            if meets_state_standard(row.result2, gender, event_name, event_type, year=year)
-        ]
+        others_met = meets_state_standard_many(
+            [row.result2 for row in others_sorted], gender, event_name, event_type, year=year
+        ).tolist()
+        standard_qualifiers = [row for row, met in zip(others_sorted, others_met) if met]
         selected_school_ids = {row.school_id for row in top3}
         selected_school_ids.update(row.school_id for row in standard_qualifiers)
 
@@ -3813,9 +3942,12 @@ def _compute_event_qualifiers(
         needed_for_field_size = max(0, target_field_size - (auto_slots + len(standard_qualifiers)))
         fill_qualifiers = _extend_to_cutoff_with_ties(remaining, needed_for_field_size)
 
+        top3_met = meets_state_standard_many(
+            [row.result2 for row in top3], gender, event_name, event_type, year=year
+        ).tolist()
+
         formatted = []
-        for row in top3:
-            met_standard = meets_state_standard(row.result2, gender, event_name, event_type, year=year)
+        for row, met_standard in zip(top3, top3_met):
             formatted.append(
                 {
                     "event": row.event,
@@ -3919,37 +4051,6 @@ def _compute_event_qualifiers(
 
         return sorted(formatted, key=lambda row: _qualifier_sort_key(row, lower_is_better), reverse=not lower_is_better)
 
-    rows = (
-        db.session.query(
-            AthleteResult.athlete_id.label("athlete_id"),
-            Athlete.first.label("first"),
-            Athlete.last.label("last"),
-            Athlete.school_id.label("school_id"),
-            AthleteResult.grade.label("grade"),
-            School.school_name.label("school_name"),
-            AthleteResult.event.label("event"),
-            AthleteResult.result.label("result"),
-            AthleteResult.result2.label("result2"),
-            AthleteResult.place.label("place"),
-            Meet.host.label("host"),
-            Meet.meet_num.label("meet_num"),
-        )
-        .join(Athlete, AthleteResult.athlete_id == Athlete.athlete_id)
-        .join(School, Athlete.school_id == School.school_id)
-        .join(Meet, AthleteResult.meet_id == Meet.meet_id)
-        .filter(
-            Meet.meet_type == source_meet_type,
-            Meet.year == year,
-            Meet.gender == gender,
-            Meet.meet_num.in_(feeder_meet_nums),
-            AthleteResult.event == event_name,
-            AthleteResult.result_type == "Final",
-            AthleteResult.result2.isnot(None),
-            AthleteResult.place.isnot(None),
-        )
-        .all()
-    )
-
     # Detect which sectionals are missing the event entirely (individual events)
     present_meet_nums = {row.meet_num for row in rows}
     missing_event_meet_nums = set(feeder_meet_nums) - present_meet_nums
@@ -3963,10 +4064,10 @@ def _compute_event_qualifiers(
     others = [row for row in rows if row.place is not None and row.place > 3]
     others_sorted = sorted(others, key=lambda row: row.result2, reverse=not lower_is_better)
 
-    standard_qualifiers = [
-        row for row in others_sorted
-        if meets_state_standard(row.result2, gender, event_name, event_type, year=year)
-    ]
+    others_met = meets_state_standard_many(
+        [row.result2 for row in others_sorted], gender, event_name, event_type, year=year
+    ).tolist()
+    standard_qualifiers = [row for row, met in zip(others_sorted, others_met) if met]
     selected_athlete_ids = {row.athlete_id for row in top3}
     selected_athlete_ids.update(row.athlete_id for row in standard_qualifiers)
 
@@ -3977,9 +4078,12 @@ def _compute_event_qualifiers(
     needed_for_field_size = max(0, target_field_size - (auto_slots + len(standard_qualifiers)))
     fill_qualifiers = _extend_to_cutoff_with_ties(remaining, needed_for_field_size)
 
+    top3_met = meets_state_standard_many(
+        [row.result2 for row in top3], gender, event_name, event_type, year=year
+    ).tolist()
+
     formatted = []
-    for row in top3:
-        met_standard = meets_state_standard(row.result2, gender, event_name, event_type, year=year)
+    for row, met_standard in zip(top3, top3_met):
         formatted.append(
             {
                 "event": row.event,
@@ -4087,19 +4191,7 @@ def _compute_event_qualifiers(
     return sorted(formatted, key=lambda row: _qualifier_sort_key(row, lower_is_better), reverse=not lower_is_better)
 
 
-@lru_cache(maxsize=128)
-def get_regional_qualifiers(gender: str, regional_num: int, year: int = CURRENT_QUALIFIER_YEAR):
-    clean_gender = (gender or "").strip().title()
-    if clean_gender not in ("Boys", "Girls"):
-        raise ValueError("gender must be Boys or Girls")
-
-    if regional_num not in REGIONAL_SECTIONAL_GROUPS:
-        raise ValueError("regional_num must be an integer between 1 and 8")
-
-    status_payload = _regional_group_status(year, clean_gender)
-    status_map = {row["regional_num"]: row for row in status_payload["regionals"]}
-    regional_status = status_map[regional_num]
-
+def _regional_qualifier_payload(clean_gender: str, regional_num: int, year: int, regional_status, rows_by_event):
     response = {
         "context": {
             "year": year,
@@ -4127,7 +4219,13 @@ def get_regional_qualifiers(gender: str, regional_num: int, year: int = CURRENT_
             loaded_feeders = tuple(set(feeder_meet_nums).intersection(set(regional_status["loaded_sectionals"])))
             if not loaded_feeders:
                 continue
-            qualifiers = _compute_event_qualifiers(event_name, clean_gender, year, loaded_feeders)
+            qualifiers = _compute_event_qualifiers(
+                event_name,
+                clean_gender,
+                year,
+                loaded_feeders,
+                rows=rows_by_event.get(event_name, []),
+            )
             response["events"].append(
                 {
                     "event": event_name,
@@ -4141,7 +4239,13 @@ def get_regional_qualifiers(gender: str, regional_num: int, year: int = CURRENT_
     feeder_meet_nums = REGIONAL_SECTIONAL_GROUPS[regional_num]
     events = _regional_events_for_gender(clean_gender)
     for event_name in events:
-        qualifiers = _compute_event_qualifiers(event_name, clean_gender, year, feeder_meet_nums)
+        qualifiers = _compute_event_qualifiers(
+            event_name,
+            clean_gender,
+            year,
+            feeder_meet_nums,
+            rows=rows_by_event.get(event_name, []),
+        )
         response["events"].append(
             {
                 "event": event_name,
@@ -4154,11 +4258,239 @@ def get_regional_qualifiers(gender: str, regional_num: int, year: int = CURRENT_
     return response
 
 
+QUALIFIER_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=4)
+def _payload_cache_for(path: str) -> PayloadCache:
+    return PayloadCache(path)
+
+
+def _qualifier_cache() -> Optional[PayloadCache]:
+    path = current_app.config.get("QUALIFIER_CACHE_PATH")
+    return _payload_cache_for(path) if path else None
+
+
+def _feeder_meet_signatures(gender: str, year: int, feeder_meet_nums: tuple, source_meet_type: str = "Sectional"):
+    """
+    Per-meet content hash of the loaded feeder results, keyed by meet_num.
+
+    Hashes every individual row (with the athlete's name) and relay row of
+    each meet, so re-scrapes, merges and name, grade or mark edits all show
+    up. This reads the full result tables and is meant for the offline
+    precompute scripts; request paths validate on ``_qualifier_fingerprint``.
+    """
+    meet_rows = (
+        db.session.query(Meet.meet_num, Meet.meet_id, Meet.host)
+        .filter(
+            Meet.meet_type == source_meet_type,
+            Meet.year == year,
+            Meet.gender == gender,
+            Meet.meet_num.in_(feeder_meet_nums),
+        )
+        .all()
+    )
+    meet_ids = [row.meet_id for row in meet_rows]
+    if not meet_ids:
+        return {}
+
+    digests = defaultdict(hashlib.sha1)
+    individual_rows = (
+        db.session.query(
+            AthleteResult.meet_id,
+            AthleteResult.athlete_id,
+            Athlete.first,
+            Athlete.last,
+            Athlete.school_id,
+            AthleteResult.event,
+            AthleteResult.result_type,
+            AthleteResult.grade,
+            AthleteResult.result,
+            AthleteResult.result2,
+            AthleteResult.place,
+        )
+        .join(Athlete, Athlete.athlete_id == AthleteResult.athlete_id)
+        .filter(AthleteResult.meet_id.in_(meet_ids))
+        .order_by(
+            AthleteResult.meet_id,
+            AthleteResult.athlete_id,
+            AthleteResult.event,
+            AthleteResult.result_type,
+        )
+    )
+    for row in individual_rows:
+        digests[("individual", row[0])].update(json.dumps(list(row[1:]), default=str).encode("utf-8"))
+    relay_rows = (
+        db.session.query(
+            RelayResult.meet_id,
+            RelayResult.school_id,
+            RelayResult.event,
+            RelayResult.result,
+            RelayResult.result2,
+            RelayResult.place,
+            RelayResult.athlete_names,
+        )
+        .filter(RelayResult.meet_id.in_(meet_ids))
+        .order_by(RelayResult.meet_id, RelayResult.school_id, RelayResult.event)
+    )
+    for row in relay_rows:
+        digests[("relay", row[0])].update(json.dumps(list(row[1:]), default=str).encode("utf-8"))
+
+    def _digest(kind, meet_id):
+        digest = digests.get((kind, meet_id))
+        return digest.hexdigest() if digest is not None else None
+
+    signatures = defaultdict(list)
+    for meet_num, meet_id, host in sorted(meet_rows, key=lambda row: row.meet_id):
+        signatures[meet_num].append(
+            [meet_id, host, _digest("individual", meet_id), _digest("relay", meet_id)]
+        )
+    return dict(signatures)
+
+
+def _host_registry_signature(year: int, gender: str) -> dict:
+    """Every host source the qualifier and status payloads fall back on for one season."""
+    return {
+        "Sectional": sorted(_ihsaa_sectional_hosts(year, gender).items()),
+        "Regional": sorted(_ihsaa_regional_hosts(year, gender).items()),
+        "Configured": sorted(get_configured_regional_hosts(year, gender).items()),
+    }
+
+
+def _qualifier_fingerprint(gender: str, year: int) -> str:
+    """
+    Cache validator for the qualifier payloads of one season.
+
+    Combines ``qualifier_data_version()``, which moves on every loader commit
+    and only reads the meet and ingest_state tables, with the host registry.
+    A cache hit therefore never scans the result tables. Edits made outside
+    the loaders must bump the ingest counter to be picked up.
+    """
+    parts = [
+        QUALIFIER_CACHE_VERSION,
+        qualifier_data_version(),
+        _host_registry_signature(year, gender),
+    ]
+    return hashlib.sha1(json.dumps(parts, default=str).encode("utf-8")).hexdigest()
+
+
+def _compute_regional_qualifiers(gender: str, regional_num: int, year: int):
+    status_payload = _regional_group_status(year, gender)
+    status_map = {row["regional_num"]: row for row in status_payload["regionals"]}
+    regional_status = status_map[regional_num]
+
+    rows_by_event = _fetch_qualifier_rows_by_event(
+        gender, year, REGIONAL_SECTIONAL_GROUPS[regional_num]
+    )
+    return _regional_qualifier_payload(gender, regional_num, year, regional_status, rows_by_event)
+
+
+def get_regional_qualifiers(gender: str, regional_num: int, year: int = CURRENT_QUALIFIER_YEAR):
+    """
+    Projected qualifiers for one regional.
+
+    Payloads are kept in the shared qualifier cache, keyed by
+    (gender, regional, year) and validated on ``_qualifier_fingerprint``, so
+    every worker reuses them until results are loaded or hosts change.
+    """
+    clean_gender = (gender or "").strip().title()
+    if clean_gender not in ("Boys", "Girls"):
+        raise ValueError("gender must be Boys or Girls")
+
+    if regional_num not in REGIONAL_SECTIONAL_GROUPS:
+        raise ValueError("regional_num must be an integer between 1 and 8")
+
+    cache = _qualifier_cache()
+    if cache is None:
+        return _compute_regional_qualifiers(clean_gender, regional_num, year)
+
+    fingerprint = _qualifier_fingerprint(clean_gender, year)
+    cache_key = f"regional_qualifiers:{clean_gender}:{regional_num}:{year}"
+    payload = cache.get(cache_key, fingerprint)
+    if payload is None:
+        payload = _compute_regional_qualifiers(clean_gender, regional_num, year)
+        cache.set(cache_key, fingerprint, payload)
+    return payload
+
+
+def get_all_regional_qualifiers(gender: str, year: int = CURRENT_QUALIFIER_YEAR):
+    """Return ``{regional_num: payload}`` for all 8 regionals.
+
+    Every payload matches ``get_regional_qualifiers`` for the same regional.
+    Cached regionals are reused; the rest share a single bulk load of their
+    feeder rows (one individual and one relay query) partitioned in memory.
+    If the bulk load fails, each regional is loaded on its own. A regional
+    whose payload cannot be built is logged and left out, so one bad feeder
+    does not blank the others.
+    """
+    clean_gender = (gender or "").strip().title()
+    if clean_gender not in ("Boys", "Girls"):
+        raise ValueError("gender must be Boys or Girls")
+
+    cache = _qualifier_cache()
+    payloads = {}
+    fingerprint = None
+    if cache is not None:
+        fingerprint = _qualifier_fingerprint(clean_gender, year)
+        for regional_num in REGIONAL_SECTIONAL_GROUPS:
+            cached = cache.get(f"regional_qualifiers:{clean_gender}:{regional_num}:{year}", fingerprint)
+            if cached is not None:
+                payloads[regional_num] = cached
+
+    stale = [regional_num for regional_num in sorted(REGIONAL_SECTIONAL_GROUPS.keys()) if regional_num not in payloads]
+    if stale:
+        status_payload = _regional_group_status(year, clean_gender)
+        status_map = {row["regional_num"]: row for row in status_payload["regionals"]}
+
+        stale_feeders = tuple(
+            meet_num for regional_num in stale for meet_num in REGIONAL_SECTIONAL_GROUPS[regional_num]
+        )
+        try:
+            rows_by_event = _fetch_qualifier_rows_by_event(clean_gender, year, stale_feeders)
+        except Exception:
+            logger.exception(f"Bulk feeder load failed for {year} {clean_gender}; loading regionals one at a time")
+            rows_by_event = None
+        for regional_num in stale:
+            try:
+                if rows_by_event is None:
+                    payloads[regional_num] = _compute_regional_qualifiers(clean_gender, regional_num, year)
+                else:
+                    payloads[regional_num] = _regional_qualifier_payload(
+                        clean_gender, regional_num, year, status_map[regional_num], rows_by_event
+                    )
+            except Exception:
+                logger.exception(f"Regional {regional_num} qualifiers failed for {year} {clean_gender}; skipping")
+                continue
+            if cache is not None:
+                cache.set(
+                    f"regional_qualifiers:{clean_gender}:{regional_num}:{year}",
+                    fingerprint,
+                    payloads[regional_num],
+                )
+
+    return {regional_num: payloads[regional_num] for regional_num in sorted(payloads)}
+
+
 def get_state_qualifiers(gender: str, year: int = CURRENT_QUALIFIER_YEAR):
+    """Projected state qualifiers, cached like ``get_regional_qualifiers``."""
     clean_gender = (gender or "").strip().title()
     if clean_gender not in ("Boys", "Girls"):
         raise ValueError("gender must be Boys or Girls")
 
+    cache = _qualifier_cache()
+    if cache is None:
+        return _compute_state_qualifiers(clean_gender, year)
+
+    fingerprint = _qualifier_fingerprint(clean_gender, year)
+    cache_key = f"state_qualifiers:{clean_gender}:{year}"
+    payload = cache.get(cache_key, fingerprint)
+    if payload is None:
+        payload = _compute_state_qualifiers(clean_gender, year)
+        cache.set(cache_key, fingerprint, payload)
+    return payload
+
+
+def _compute_state_qualifiers(clean_gender: str, year: int):
     status_payload = _state_group_status(year, clean_gender)
 
     response = {
@@ -4179,6 +4511,9 @@ def get_state_qualifiers(gender: str, year: int = CURRENT_QUALIFIER_YEAR):
         return response
 
     feeder_meet_nums = tuple(sorted(REGIONAL_SECTIONAL_GROUPS.keys()))
+    rows_by_event = _fetch_qualifier_rows_by_event(
+        clean_gender, year, feeder_meet_nums, source_meet_type="Regional"
+    )
     events = _regional_events_for_gender(clean_gender)
     target_field_size = _state_target_field_size(year)
     for event_name in events:
@@ -4189,6 +4524,7 @@ def get_state_qualifiers(gender: str, year: int = CURRENT_QUALIFIER_YEAR):
             feeder_meet_nums,
             source_meet_type="Regional",
             target_field_size=target_field_size,
+            rows=rows_by_event.get(event_name, []),
         )
         response["events"].append(
             {
@@ -4200,4 +4536,3 @@ def get_state_qualifiers(gender: str, year: int = CURRENT_QUALIFIER_YEAR):
         )
 
     return response
-
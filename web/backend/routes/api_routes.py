@@ -1,7 +1,6 @@
-import json
-import os
-from flask import jsonify, request, current_app
+from flask import Response, jsonify, request, current_app
 from . import api_bp
+from ..artifacts import artifact_cache, artifact_path, artifact_response, payload_response
 from ..queries import (
     get_athletes,
     get_athlete_by_id,
@@ -19,10 +18,18 @@ from ..queries import (
     _compute_school_percentiles,
     get_regional_qualifiers_status,
     get_regional_qualifiers,
+    get_all_regional_qualifiers,
     get_state_qualifiers_status,
     get_state_qualifiers,
+    qualifier_data_version,
 )
 
+# school_rankings lives under backend/scripts; queries.py already adds that
+# directory to sys.path, so this import resolves at app boot.
+from school_rankings import get_available_ranking_years, get_school_rankings  # type: ignore  # noqa: E402
+from what_if import get_what_if_meet, what_if  # type: ignore  # noqa: E402
+from ..status_stream import MAX_STREAMS, status_event_stream, status_notifier  # noqa: E402
+
 
 @api_bp.route('/athletes')
 def api_get_athletes():
@@ -236,6 +243,40 @@ def api_get_school_percentiles(school_id):
     return jsonify(results)
 
 
+@api_bp.route('/schools/rankings')
+def api_school_rankings():
+    """Return statewide school power rankings for a gender, optionally for one season.
+
+    Served from school_rankings_{scope}_{gender}.json written by
+    web/backend/scripts/precompute_school_rankings.py while the file's
+    data_version matches qualifier_data_version(); when the file is missing
+    or older than the loaded results, falls back to a live batch computation,
+    cached until the next ingest. Seasons without results return 404.
+    """
+    gender = (request.args.get('gender', 'Boys') or '').strip().title()
+    year = request.args.get('year', type=int)
+    if gender not in ('Boys', 'Girls'):
+        return jsonify({'error': 'gender must be Boys or Girls'}), 400
+    if year is not None and year < 2000:
+        return jsonify({'error': 'year must be a valid season year'}), 400
+
+    scope = 'all' if year is None else str(year)
+    artifact = artifact_cache.get(artifact_path('school_rankings', f'school_rankings_{scope}_{gender.lower()}.json'))
+    try:
+        if artifact is not None and artifact.json().get('data_version') == qualifier_data_version():
+            return artifact_response(artifact)
+        if year is not None and year not in get_available_ranking_years():
+            return jsonify({'error': f'no results loaded for {year}'}), 404
+        rankings = get_school_rankings(year=year)
+    except Exception as exc:
+        return jsonify({'error': str(exc)}), 500
+
+    return payload_response({
+        'context': {'gender': gender, 'year': year},
+        'rows': rankings.get(gender, []),
+    })
+
+
 @api_bp.route('/regional-qualifiers/status')
 def api_regional_qualifiers_status():
     """Return regional readiness status for a gender and year."""
@@ -246,13 +287,59 @@ def api_regional_qualifiers_status():
 
     try:
         payload = get_regional_qualifiers_status(gender=gender, year=year)
-        return jsonify(payload)
+        return _status_response(payload)
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
     except Exception as exc:
         return jsonify({'error': str(exc)}), 500
 
 
+def _status_response(payload):
+    """Status JSON validated on its data version, so unchanged polls get a 304."""
+    response = jsonify(payload)
+    response.set_etag(payload['data_version'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+
+def _status_stream_response(status_fn):
+    gender = request.args.get('gender', 'Boys').strip()
+    year = request.args.get('year', default=2026, type=int)
+    if year is None or year < 2000:
+        return jsonify({'error': 'year must be a valid season year'}), 400
+
+    try:
+        # Validate up front so bad params get a 400 instead of a broken stream.
+        status_fn(gender=gender, year=year)
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+
+    # Each open stream holds a sync worker thread; past the cap clients
+    # poll the status endpoint instead (see backend/status_stream.py).
+    if not status_notifier.acquire_stream(current_app.config.get('STATUS_STREAM_MAX', MAX_STREAMS)):
+        return jsonify({'error': 'too many open status streams; poll the status endpoint'}), 503
+
+    stream = status_event_stream(
+        current_app._get_current_object(),
+        (status_fn.__name__, gender.title(), year),
+        lambda: status_fn(gender=gender, year=year),
+        last_event_id=request.headers.get('Last-Event-ID'),
+    )
+    response = Response(
+        stream,
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+    response.call_on_close(status_notifier.release_stream)
+    return response
+
+
+@api_bp.route('/regional-qualifiers/status/stream')
+def api_regional_qualifiers_status_stream():
+    """Server-Sent Events: push regional readiness whenever new meets are ingested."""
+    return _status_stream_response(get_regional_qualifiers_status)
+
+
 @api_bp.route('/regional-qualifiers')
 def api_regional_qualifiers():
     """Return regional qualifier list for a specific gender, year, and regional."""
@@ -284,7 +371,7 @@ def api_state_qualifiers_status():
 
     try:
         payload = get_state_qualifiers_status(gender=gender, year=year)
-        return jsonify(payload)
+        return _status_response(payload)
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
     except Exception as exc:
@@ -292,6 +379,12 @@ def api_state_qualifiers_status():
 
 
 
+@api_bp.route('/state-qualifiers/status/stream')
+def api_state_qualifiers_status_stream():
+    """Server-Sent Events: push state readiness whenever new meets are ingested."""
+    return _status_stream_response(get_state_qualifiers_status)
+
+
 @api_bp.route('/state-qualifiers')
 def api_state_qualifiers():
     """Return state qualifier list for a specific gender and year, using precomputed JSON if available."""
@@ -303,22 +396,14 @@ def api_state_qualifiers():
         return jsonify({'error': 'gender must be Boys or Girls'}), 400
 
     # Prefer precomputed JSON for speed
-    precomputed_path = os.path.join(
-        current_app.root_path,
-        '..', 'frontend', 'static', 'data', 'state_predictions',
-        f'state_qualifiers_{year}_{gender.lower()}.json',
-    )
-    if os.path.exists(precomputed_path):
-        try:
-            with open(precomputed_path, 'r', encoding='utf-8') as f:
-                return jsonify(json.load(f))
-        except Exception:
-            pass  # Fall through to live computation if file is unreadable
-
-    # Fallback to live computation if file missing or unreadable
+    artifact = artifact_cache.get(artifact_path('state_predictions', f'state_qualifiers_{year}_{gender.lower()}.json'))
+    if artifact is not None:
+        return artifact_response(artifact)
+
+    # Fallback to live computation if the file is missing
     try:
         payload = get_state_qualifiers(gender=gender, year=year)
-        return jsonify(payload)
+        return payload_response(payload)
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
     except Exception as exc:
@@ -348,24 +433,15 @@ def api_regional_top_list():
     # Generated by web/backend/scripts/precompute_combined_rankings.py and
     # web/backend/scripts/precompute_combined_results.py respectively.
     file_prefix = 'combined_rankings' if source == 'rankings' else 'combined_results'
-    precomputed_path = os.path.join(
-        current_app.root_path,
-        '..', 'frontend', 'static', 'data', 'regional_predictions',
-        f'{file_prefix}_{year}_{gender.lower()}.json',
-    )
-    if os.path.exists(precomputed_path):
-        try:
-            with open(precomputed_path, 'r', encoding='utf-8') as f:
-                return jsonify(json.load(f))
-        except Exception:
-            # Fall through to live computation if the file is unreadable.
-            pass
+    artifact = artifact_cache.get(artifact_path('regional_predictions', f'{file_prefix}_{year}_{gender.lower()}.json'))
+    if artifact is not None:
+        return artifact_response(artifact)
 
     # For source='results' we cannot fall back to the sectional-based live
     # computation (that would return projections, not actual regional results).
     # Return an empty payload so the UI shows "no data" instead of misleading data.
     if source == 'results':
-        return jsonify({
+        return payload_response({
             'context': {'gender': gender, 'year': year, 'source': 'results'},
             'events': [],
         })
@@ -374,11 +450,11 @@ def api_regional_top_list():
 
     combined = {}
     event_meta = {}
-    for regional_num in range(1, 9):
-        try:
-            payload = get_regional_qualifiers(gender=gender, regional_num=regional_num, year=year)
-        except Exception:
-            continue
+    try:
+        payloads = get_all_regional_qualifiers(gender=gender, year=year)
+    except Exception:
+        payloads = {}
+    for regional_num, payload in sorted(payloads.items()):
         for event_block in payload.get('events', []):
             event_name = event_block.get('event')
             if not event_name:
@@ -423,8 +499,84 @@ def api_regional_top_list():
             'qualifiers': unique_rows,
         })
 
-    return jsonify({
+    return payload_response({
         'context': {'gender': gender, 'year': year},
         'events': events_out,
     })
 
+
+
+def _what_if_params(source):
+    """Validate meet/year/gender/regional_num; returns (params, error response)."""
+    meet = (str(source.get('meet') or 'Regional')).strip().title()
+    gender = (str(source.get('gender') or 'Boys')).strip().title()
+    try:
+        year = int(source.get('year') or 2026)
+        regional_num = source.get('regional_num')
+        regional_num = int(regional_num) if regional_num not in (None, '') else None
+    except (TypeError, ValueError):
+        return None, (jsonify({'error': 'year and regional_num must be integers'}), 400)
+    if year < 2000:
+        return None, (jsonify({'error': 'year must be a valid season year'}), 400)
+    if gender not in ('Boys', 'Girls'):
+        return None, (jsonify({'error': 'gender must be Boys or Girls'}), 400)
+    if meet == 'Regional' and regional_num is None:
+        return None, (jsonify({'error': 'regional_num is required'}), 400)
+    return {'meet_type': meet, 'year': year, 'gender': gender, 'regional_num': regional_num}, None
+
+
+@api_bp.route('/what-if')
+def api_what_if_meet():
+    """Return the projected standings and every event's scored entries for a regional or state meet.
+
+    The entries carry the athlete_id / school_id that POST /api/what-if
+    changes refer to.
+    """
+    params, error = _what_if_params(request.args)
+    if error:
+        return error
+
+    try:
+        meet = get_what_if_meet(**params)
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except Exception as exc:
+        return jsonify({'error': str(exc)}), 500
+    if meet is None:
+        return jsonify({'error': 'feeder meets are not all loaded yet'}), 404
+
+    return jsonify({
+        'context': {'meet': params['meet_type'], 'year': params['year'], 'gender': params['gender'],
+                    'regional_num': params['regional_num'] if params['meet_type'] == 'Regional' else None},
+        'rows': meet.rows,
+        'events': [{'event': event, 'entries': meet.event_rows(event)} for event in meet.events],
+    })
+
+
+@api_bp.route('/what-if', methods=['POST'])
+def api_what_if():
+    """Re-score a projected regional or state meet with edited marks, scratches or added entries.
+
+    Body: {"meet": "Regional"|"State", "year", "gender", "regional_num",
+    "changes": [...]} (see scripts/what_if.py for the change format). Only
+    the touched events are re-placed; returns baseline and scenario standings.
+    """
+    data = request.get_json() or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'request body must be a JSON object'}), 400
+    params, error = _what_if_params(data)
+    if error:
+        return error
+    changes = data.get('changes') or []
+    if not isinstance(changes, list):
+        return jsonify({'error': 'changes must be a list'}), 400
+
+    try:
+        payload = what_if(changes=changes, **params)
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    except Exception as exc:
+        return jsonify({'error': str(exc)}), 500
+    if payload is None:
+        return jsonify({'error': 'feeder meets are not all loaded yet'}), 404
+    return jsonify(payload)
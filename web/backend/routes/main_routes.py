@@ -2,6 +2,7 @@ from datetime import datetime
 
 from flask import render_template, request, url_for, Response
 from . import main_bp
+from ..artifacts import artifact_cache, artifact_path
 from ..queries import get_athletes
 from ..models import Athlete, School
 from ..videos import INTERVIEW_VIDEOS
@@ -77,23 +78,13 @@ def hypothetical_query_page():
 # Register the 2026 regional predictions report route
 @main_bp.route('/insights/reports/2026-regional-predictions')
 def regional_predictions_2026_report_page():
-    import os, json
     from datetime import datetime
     year = 2026
     top_n = 10
-    static_dir = os.path.join(os.path.dirname(__file__), '../../frontend/static/data/regional_predictions')
-    girls_path = os.path.join(static_dir, f'regional_predictions_{year}_girls.json')
-    boys_path = os.path.join(static_dir, f'regional_predictions_{year}_boys.json')
-    try:
-        with open(girls_path, encoding='utf-8') as f:
-            predictions_girls = json.load(f)
-    except Exception:
-        predictions_girls = []
-    try:
-        with open(boys_path, encoding='utf-8') as f:
-            predictions_boys = json.load(f)
-    except Exception:
-        predictions_boys = []
+    predictions_girls = artifact_cache.load_json(
+        artifact_path('regional_predictions', f'regional_predictions_{year}_girls.json'), default=[])
+    predictions_boys = artifact_cache.load_json(
+        artifact_path('regional_predictions', f'regional_predictions_{year}_boys.json'), default=[])
     now = datetime.now()
     updated_label = f"{now.strftime('%B')} {now.day}, {now.year}"
 
@@ -114,22 +105,16 @@ def regional_predictions_2026_report_page():
 
 @main_bp.route('/insights/reports/2026-state-predictions')
 def state_predictions_2026_report_page():
-    import os, json
     from datetime import datetime
     year = 2026
-    static_dir = os.path.join(os.path.dirname(__file__), '../../frontend/static/data/state_predictions')
-    girls_path = os.path.join(static_dir, f'state_predictions_{year}_girls.json')
-    boys_path = os.path.join(static_dir, f'state_predictions_{year}_boys.json')
-
-    def _load(path):
-        try:
-            with open(path, encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return {"ready": False, "rows": [], "missing_regionals": [], "regionals_loaded": 0}
-
-    girls = _load(girls_path)
-    boys = _load(boys_path)
+
+    def _load(gender):
+        path = artifact_path('state_predictions', f'state_predictions_{year}_{gender}.json')
+        empty = {"ready": False, "rows": [], "missing_regionals": [], "regionals_loaded": 0}
+        return artifact_cache.load_json(path, default=empty)
+
+    girls = _load('girls')
+    boys = _load('boys')
     now = datetime.now()
     updated_label = f"{now.strftime('%B')} {now.day}, {now.year}"
 
@@ -182,6 +167,7 @@ def regional_qualifiers_page():
         load_error='Unable to load regional qualifiers.',
         detail_unavailable_text='That regional is awaiting meet result data.',
         api_status_url='/api/regional-qualifiers/status',
+        api_stream_url='/api/regional-qualifiers/status/stream',
         api_detail_url='/api/regional-qualifiers',
     )
 
@@ -202,6 +188,7 @@ def state_qualifiers_page():
         status_error='Unable to load state status.',
         pending_text='State qualifiers are pending.',
         api_status_url='/api/state-qualifiers/status',
+        api_stream_url='/api/state-qualifiers/status/stream',
         api_detail_url='/api/state-qualifiers',
     )
 
@@ -0,0 +1,112 @@
+"""
+Advancement Probabilities
+
+Estimates, for every athlete (or relay) on the projected regional qualifier
+lists, how likely they are to advance from the regional to the state meet:
+finish top-3 in their regional (auto qualifier) or meet the state standard.
+
+Each regional event's field is resampled ``n_sims`` times at once with the
+variance model from ``meet_simulation`` (feeder mark times ``exp(sigma * z)``,
+sigma shrunk toward the event's pooled spread), then top-3 finishes and
+standard marks are counted across the simulated finals.
+
+The probabilities are attached to each row of the combined-rankings payload
+(``precompute_combined_rankings.py``) as ``top3_probability``,
+``standard_probability`` and ``advance_probability``.
+"""
+
+import os
+import sqlite3
+import sys
+import zlib
+from collections import defaultdict
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.util.standards_util import meets_state_standard_many  # noqa: E402
+from meet_simulation import HISTORY_MEET_TYPES, _fetch_history, entrant_spreads  # noqa: E402
+from regional_predictions import DB_PATH  # noqa: E402
+
+DEFAULT_SIMULATIONS = 2000
+DEFAULT_SEED = 0
+AUTO_QUALIFIERS = 3
+
+
+def _entrant(row):
+    if row.get("athlete_id") is not None:
+        return ("athlete", row["athlete_id"])
+    if "Relay" in (row.get("event") or "") and row.get("school_id") is not None:
+        return ("relay", row["school_id"])
+    return None
+
+
+def field_probabilities(event_name, event_type, gender, year, base, spreads, n_sims, rng):
+    """
+    Simulate one regional final ``n_sims`` times.
+
+    ``base`` and ``spreads`` are the field's feeder marks and log-scale
+    standard deviations. Returns ``(top3, standard, advance)`` probability
+    arrays aligned with ``base``.
+    """
+    lower_is_better = event_type != "Field"
+    marks = base * np.exp(spreads * rng.standard_normal((n_sims, len(base))))
+    if len(base) <= AUTO_QUALIFIERS:
+        top3 = np.ones(marks.shape, dtype=bool)
+    else:
+        signed = marks if lower_is_better else -marks
+        cutoff = np.partition(signed, AUTO_QUALIFIERS - 1, axis=1)[:, AUTO_QUALIFIERS - 1:AUTO_QUALIFIERS]
+        top3 = signed <= cutoff
+    standard = meets_state_standard_many(marks, gender, event_name, event_type, year=year)
+    return top3.mean(axis=0), standard.mean(axis=0), (top3 | standard).mean(axis=0)
+
+
+def attach_advancement_probabilities(payload, n_sims=DEFAULT_SIMULATIONS, seed=DEFAULT_SEED,
+                                     variance_scale=1.0, db_path=None):
+    """
+    Add ``top3_probability``, ``standard_probability`` and
+    ``advance_probability`` to every row of a combined-rankings payload, in
+    place. Rows without a mark or entrant id get None. Each (regional,
+    event) field draws from its own stream seeded by ``(seed, regional_num,
+    event)``, so an incremental update matches a full rebuild. Returns
+    ``payload``.
+    """
+    context = payload.get("context", {})
+    gender, year = context.get("gender"), context.get("year")
+
+    fields = defaultdict(list)
+    for event_block in payload.get("events", []):
+        for row in event_block.get("qualifiers", []):
+            row["top3_probability"] = row["standard_probability"] = row["advance_probability"] = None
+            entrant = _entrant(row)
+            if row.get("result2") is None or entrant is None or row.get("regional_num") is None:
+                continue
+            fields[(row["regional_num"], event_block["event"], event_block.get("event_type"))].append((row, entrant))
+    if not fields:
+        return payload
+
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        history = _fetch_history(conn, year, gender, HISTORY_MEET_TYPES["Regional"])
+    finally:
+        conn.close()
+
+    for (regional_num, event_name, event_type), entries in sorted(fields.items()):
+        spreads = entrant_spreads(
+            [(event_name, None, None, entrant, row["result2"]) for row, entrant in entries],
+            history,
+        ) * variance_scale
+        base = np.array([row["result2"] for row, _ in entries], dtype=float)
+        rng = np.random.default_rng([seed, regional_num, zlib.crc32(event_name.encode("utf-8"))])
+        top3, standard, advance = field_probabilities(
+            event_name, event_type, gender, year, base, spreads, n_sims, rng,
+        )
+        for (row, _), p_top3, p_standard, p_advance in zip(entries, top3, standard, advance):
+            row["top3_probability"] = round(float(p_top3), 4)
+            row["standard_probability"] = round(float(p_standard), 4)
+            row["advance_probability"] = round(float(p_advance), 4)
+    return payload
@@ -0,0 +1,329 @@
+"""
+Prediction Backtesting
+
+Replays the team-score projections against what actually happened, for every
+season and gender in Track.db:
+
+  - sectional -> regional: ``regional_predictions`` vs each regional's actual
+    team scores;
+  - regional -> state: ``state_predictions`` vs the state meet's actual team
+    scores.
+
+Actual team scores are computed once per season from the meet's own finals
+(individual finals + relays, ``meet_scoring.TIE_AVERAGE``, the way a real
+meet splits points on a tie) and cached per process until the database's
+data version changes. Seasons run in a process pool.
+
+Metrics per meet, averaged per stage and per season in the report:
+
+``top_k_overlap``
+    Teams in both the projected and the actual top ``k``, out of ``k``.
+``winner_hit``
+    Whether the projected winner won.
+``rank_correlation``
+    Spearman correlation of projected vs actual team scores over every team
+    that scored in either (a team missing from one side counts as 0 points).
+``score_mae``
+    Mean absolute error of the projected team scores over the same teams.
+
+Usage:
+    python backtest_predictions.py
+    python backtest_predictions.py --years 2024 2025 --gender Girls --top-k 3 --jobs 4
+    python backtest_predictions.py --details --output backtest_report.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, TIE_AVERAGE, rank_teams, score_meet
+from regional_predictions import DB_PATH, get_regional_predictions
+from state_predictions import get_state_predictions
+from util.db_util import data_version
+
+
+DEFAULT_TOP_K = 5
+STAGES = ("Regional", "State")
+POINTS_BY_STAGE = {"Regional": REGIONAL_POINTS, "State": STATE_POINTS}
+METRICS = ("top_k_overlap", "winner_hit", "rank_correlation", "score_mae")
+
+# Per-process actual scores: {(db_path, year, gender, meet_type): (data version, {meet_num: meet})}.
+_actuals_cache = {}
+_actuals_cache_lock = threading.Lock()
+
+
+def _score_actuals(conn, year, gender, meet_type):
+    """
+    ``{meet_num: {"host", "rows"}}`` for every ``meet_type`` meet of a
+    season, scored from one load of its finals. ``rows`` are ranked
+    ``{place, team, score}``; meets without results are left out.
+    """
+    params = (year, gender, meet_type)
+    rows = conn.execute(
+        """
+        SELECT m.meet_num, ar.event, e.event_type, s.school_id, s.school_name, ar.result2
+        FROM athlete_result ar
+        JOIN meet m ON ar.meet_id = m.meet_id
+        JOIN athlete a ON ar.athlete_id = a.athlete_id
+        JOIN school s ON a.school_id = s.school_id
+        JOIN event e ON ar.event = e.event
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type = ?
+          AND ar.result_type = 'Final'
+          AND ar.result2 IS NOT NULL AND ar.result2 NOT IN (0, 9999)
+        UNION ALL
+        SELECT m.meet_num, rr.event, 'Relay', s.school_id, s.school_name, rr.result2
+        FROM relay_result rr
+        JOIN meet m ON rr.meet_id = m.meet_id
+        JOIN school s ON rr.school_id = s.school_id
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type = ?
+          AND rr.result2 IS NOT NULL AND rr.result2 NOT IN (0, 9999)
+        """,
+        params + params,
+    ).fetchall()
+    hosts = dict(conn.execute(
+        "SELECT meet_num, host FROM meet WHERE year = ? AND gender = ? AND meet_type = ?",
+        params,
+    ).fetchall())
+
+    by_meet = defaultdict(list)
+    for meet_num, *row in rows:
+        by_meet[meet_num].append(row)
+
+    actuals = {}
+    for meet_num, meet_rows in sorted(by_meet.items()):
+        events, event_types, school_ids, names, marks = zip(*meet_rows)
+        totals = score_meet(
+            events, school_ids, marks, POINTS_BY_STAGE[meet_type],
+            tie_policy=TIE_AVERAGE,
+            # Field events: higher is better; track + relays: lower is better.
+            ascending=[event_type != "Field" for event_type in event_types],
+        )
+        actuals[meet_num] = {
+            "host": hosts.get(meet_num),
+            "rows": rank_teams(totals, dict(zip(school_ids, names))),
+        }
+    return actuals
+
+
+def actual_scores(conn, db_path, year, gender, meet_type):
+    """``_score_actuals`` cached per process until the database's data version changes."""
+    key = (os.path.abspath(db_path), year, gender, meet_type)
+    version = data_version(conn.cursor())
+    cached = _actuals_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _actuals_cache_lock:
+        cached = _actuals_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, _score_actuals(conn, year, gender, meet_type))
+            _actuals_cache[key] = cached
+    return cached[1]
+
+
+def meet_metrics(projected, actual, top_k=DEFAULT_TOP_K):
+    """
+    Accuracy of one projected meet. ``projected`` and ``actual`` are ranked
+    ``{place, team, score}`` rows. ``rank_correlation`` is None when either
+    side has fewer than two distinct scores.
+    """
+    projected_scores = {row["team"]: row["score"] for row in projected}
+    actual_scores_ = {row["team"]: row["score"] for row in actual}
+    teams = sorted(set(projected_scores) | set(actual_scores_))
+    projected_top = {row["team"] for row in projected[:top_k]}
+    actual_top = {row["team"] for row in actual[:top_k]}
+
+    x = pd.Series([projected_scores.get(team, 0.0) for team in teams], dtype=float)
+    y = pd.Series([actual_scores_.get(team, 0.0) for team in teams], dtype=float)
+    correlation = None
+    if len(teams) > 1 and x.nunique() > 1 and y.nunique() > 1:
+        correlation = round(float(np.corrcoef(x.rank(), y.rank())[0, 1]), 4)
+
+    return {
+        "top_k_overlap": round(len(projected_top & actual_top) / top_k, 4),
+        "winner_hit": bool(projected and actual and projected[0]["team"] == actual[0]["team"]),
+        "rank_correlation": correlation,
+        "score_mae": round(float((x - y).abs().mean()), 4) if teams else None,
+    }
+
+
+def backtest_season(year, gender, top_k=DEFAULT_TOP_K, db_path=None):
+    """
+    One record per meet that has both a projection and actual results:
+    ``{year, gender, stage, meet_num, host, projected, actual, <metrics>}``
+    with ``projected`` / ``actual`` cut to the top ``k`` rows.
+    """
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path)
+    try:
+        regional_actuals = actual_scores(conn, db_path, year, gender, "Regional")
+        state_actuals = actual_scores(conn, db_path, year, gender, "State")
+    finally:
+        conn.close()
+
+    pairs = []
+    for entry in get_regional_predictions(year, gender, top_n=None, db_path=db_path):
+        actual = regional_actuals.get(entry["regional_num"])
+        if actual is not None:
+            pairs.append(("Regional", entry["regional_num"], entry["rows"], actual))
+    if state_actuals:
+        state = get_state_predictions(year, gender, db_path=db_path)
+        if state["ready"]:
+            for meet_num, actual in state_actuals.items():
+                pairs.append(("State", meet_num, state["rows"], actual))
+
+    records = []
+    for stage, meet_num, projected, actual in pairs:
+        records.append({
+            "year": year,
+            "gender": gender,
+            "stage": stage,
+            "meet_num": meet_num,
+            "host": actual["host"],
+            "projected": projected[:top_k],
+            "actual": actual["rows"][:top_k],
+            **meet_metrics(projected, actual["rows"], top_k=top_k),
+        })
+    return records
+
+
+def _average(records):
+    summary = {"meets": len(records)}
+    for metric in METRICS:
+        values = [float(r[metric]) for r in records if r[metric] is not None]
+        summary[metric] = round(sum(values) / len(values), 4) if values else None
+    return summary
+
+
+def summarize(records):
+    """Average metrics per stage, and per stage and season."""
+    by_stage = defaultdict(list)
+    by_season = defaultdict(list)
+    for record in records:
+        by_stage[record["stage"]].append(record)
+        by_season[(record["stage"], record["year"], record["gender"])].append(record)
+    return {
+        "stages": {stage: _average(by_stage[stage]) for stage in STAGES if by_stage[stage]},
+        "seasons": [
+            {"stage": stage, "year": year, "gender": gender, **_average(group)}
+            for (stage, year, gender), group in sorted(
+                by_season.items(), key=lambda item: (STAGES.index(item[0][0]), item[0][1], item[0][2])
+            )
+        ],
+    }
+
+
+def available_seasons(db_path=None):
+    """Every (year, gender) with at least one regional or state meet."""
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        return conn.execute(
+            """
+            SELECT DISTINCT year, gender FROM meet
+            WHERE meet_type IN ('Regional', 'State')
+            ORDER BY year, gender
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def run_backtest(years=None, genders=("Boys", "Girls"), top_k=DEFAULT_TOP_K, jobs=1, db_path=None):
+    """
+    Backtest every available season (optionally limited to ``years`` /
+    ``genders``), ``jobs`` seasons at a time. Returns
+    ``{"top_k", "summary", "meets"}``.
+    """
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+    seasons = [
+        (year, gender) for year, gender in available_seasons(db_path)
+        if (years is None or year in years) and gender in genders
+    ]
+    args = [(year, gender, top_k, db_path) for year, gender in seasons]
+    if jobs <= 1 or len(args) <= 1:
+        results = [backtest_season(*a) for a in args]
+    else:
+        # spawn, not fork: each worker opens its own SQLite connection.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            results = list(pool.map(backtest_season, *zip(*args)))
+    records = [record for season in results for record in season]
+    return {"top_k": top_k, "summary": summarize(records), "meets": records}
+
+
+def _format(value, percent=False):
+    if value is None:
+        return "-"
+    return f"{100 * value:.1f}%" if percent else f"{value:.3f}"
+
+
+def _print_summary_row(label, summary):
+    print(
+        f"  {label:<22} {summary['meets']:>5} {_format(summary['top_k_overlap'], True):>9} "
+        f"{_format(summary['winner_hit'], True):>8} {_format(summary['rank_correlation']):>8} "
+        f"{_format(summary['score_mae']):>8}"
+    )
+
+
+def _print_details(record, top_k):
+    print(f"--- {record['year']} {record['gender']} {record['stage']} {record['meet_num']}  "
+          f"({record['host'] or 'unknown host'}) ---")
+    print(f"{'Pl':>2}  {'Projected':<28} {'Proj Pts':>8}    {'Actual':<28} {'Act Pts':>8}")
+    for i in range(top_k):
+        proj = record["projected"][i] if i < len(record["projected"]) else {"team": "", "score": None}
+        act = record["actual"][i] if i < len(record["actual"]) else {"team": "", "score": None}
+        proj_pts = f"{proj['score']:.1f}" if proj["score"] is not None else ""
+        act_pts = f"{act['score']:.1f}" if act["score"] is not None else ""
+        print(f"{i + 1:>2}  {proj['team']:<28} {proj_pts:>8}    {act['team']:<28} {act_pts:>8}")
+    print(f"      Top-{top_k} overlap: {_format(record['top_k_overlap'], True)}   "
+          f"winner: {'hit' if record['winner_hit'] else 'miss'}   "
+          f"rank correlation: {_format(record['rank_correlation'])}")
+    print()
+
+
+def print_report(report, details=False):
+    top_k = report["top_k"]
+    if details:
+        for record in report["meets"]:
+            _print_details(record, top_k)
+
+    header = f"  {'':<22} {'Meets':>5} {'Top-' + str(top_k):>9} {'Winner':>8} {'Spearman':>8} {'MAE':>8}"
+    print("=== Backtest summary ===")
+    print(header)
+    for stage, summary in report["summary"]["stages"].items():
+        _print_summary_row(f"{stage} (all seasons)", summary)
+    print()
+    print(header)
+    for season in report["summary"]["seasons"]:
+        _print_summary_row(f"{season['stage']} {season['year']} {season['gender']}", season)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backtest regional/state team-score projections against actual results.")
+    parser.add_argument("--years", type=int, nargs="+", help="seasons to replay (default: every season in the DB)")
+    parser.add_argument("--gender", choices=["Boys", "Girls"], help="limit to one gender")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="k for the top-k overlap")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (one season each)")
+    parser.add_argument("--details", action="store_true", help="print projected vs actual top-k for every meet")
+    parser.add_argument("--output", help="write the full report as JSON to this path")
+    args = parser.parse_args()
+
+    report = run_backtest(
+        years=args.years,
+        genders=(args.gender,) if args.gender else ("Boys", "Girls"),
+        top_k=args.top_k,
+        jobs=args.jobs,
+    )
+    print_report(report, details=args.details)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
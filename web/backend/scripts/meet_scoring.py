@@ -0,0 +1,220 @@
+"""
+Meet Scoring
+
+One NumPy scoring engine for every team-score projection. A meet is scored
+in a single pass: rows from all events are sorted together by
+(event, mark, tie-break), places fall out of each row's position within its
+event, and points come from a lookup into the points table.
+
+Two tie policies are supported:
+
+``TIE_SEQUENTIAL``
+    Ties on the mark are broken alphabetically by school name and assigned
+    sequential places. Used by the regional/state predictions: a real meet
+    breaks ties with a jump-off / countback, which we don't have data for.
+``TIE_AVERAGE``
+    Tied marks share the average of the points for the places they span
+    (two teams tied for 8th at a regional each get (1 + 0) / 2). Used by
+    the projected team scores and by actual-score comparisons.
+
+``rank_teams`` turns team totals into the ranked ``{place, team, score}``
+rows served by the prediction endpoints. ``score_simulations`` places a
+whole batch of simulated meets at once for the Monte Carlo simulator
+(``meet_simulation.py``).
+"""
+
+import numpy as np
+
+
+REGIONAL_POINTS = {1: 10, 2: 8, 3: 6, 4: 5, 5: 4, 6: 3, 7: 2, 8: 1}
+STATE_POINTS = {1: 10, 2: 8, 3: 7, 4: 6, 5: 5, 6: 4, 7: 3, 8: 2, 9: 1}
+
+TIE_SEQUENTIAL = "sequential"
+TIE_AVERAGE = "average"
+TIE_POLICIES = (TIE_SEQUENTIAL, TIE_AVERAGE)
+
+
+def is_track_like_event(event_name):
+    """Running events and relays (lower mark is better) start with a distance."""
+    return bool(event_name) and event_name[0].isdigit()
+
+
+def _points_lookup(points_by_place, size):
+    """Array ``p`` where ``p[place - 1]`` is the points for ``place`` (0 past the table)."""
+    lookup = np.zeros(size, dtype=float)
+    for place, pts in points_by_place.items():
+        if 1 <= place <= size:
+            lookup[place - 1] = pts
+    return lookup
+
+
+def _codes(values):
+    """Dense integer codes for ``values``, ordered like Python's sort of the values."""
+    _uniques, codes = np.unique(np.asarray(values, dtype=object).astype(str), return_inverse=True)
+    return codes
+
+
+def place_rows(events, marks, points_by_place, tie_policy=TIE_SEQUENTIAL, ascending=is_track_like_event, names=None):
+    """
+    Score every row of a meet at once.
+
+    Args:
+        events: event name per row.
+        marks: result2 per row (seconds or inches).
+        points_by_place: ``{place: points}``, e.g. ``REGIONAL_POINTS``.
+        tie_policy: ``TIE_SEQUENTIAL`` or ``TIE_AVERAGE``.
+        ascending: per-row bools (True when a lower mark is better), or a
+            function of the event name evaluated once per event.
+        names: per-row school names; the sequential tie-break.
+
+    Returns ``(places, points)`` as arrays aligned with the input rows.
+    Places are sequential or "min" ranks depending on the policy.
+    """
+    if tie_policy not in TIE_POLICIES:
+        raise ValueError(f"Unknown tie policy: {tie_policy}")
+
+    marks = np.asarray(marks, dtype=float)
+    n = len(marks)
+    if n == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=float)
+
+    event_values, event_codes = np.unique(np.asarray(events, dtype=object).astype(str), return_inverse=True)
+    if callable(ascending):
+        event_ascending = np.array([ascending(event) for event in event_values], dtype=bool)
+        row_ascending = event_ascending[event_codes]
+    else:
+        row_ascending = np.asarray(ascending, dtype=bool)
+    signed = np.where(row_ascending, marks, -marks)
+
+    # np.lexsort sorts by the last key first; it is stable, so rows that tie
+    # on every key keep their input order.
+    keys = [signed, event_codes]
+    if tie_policy == TIE_SEQUENTIAL and names is not None:
+        keys.insert(0, _codes(["" if name is None else name for name in names]))
+    order = np.lexsort(keys)
+
+    sorted_events = event_codes[order]
+    sorted_marks = signed[order]
+    index = np.arange(n)
+    new_event = np.empty(n, dtype=bool)
+    new_event[0] = True
+    new_event[1:] = sorted_events[1:] != sorted_events[:-1]
+    event_start = np.maximum.accumulate(np.where(new_event, index, 0))
+    position = index - event_start
+
+    lookup = _points_lookup(points_by_place, n)
+    if tie_policy == TIE_SEQUENTIAL:
+        sorted_places = position + 1
+        sorted_points = lookup[position]
+    else:
+        new_group = new_event.copy()
+        new_group[1:] |= sorted_marks[1:] != sorted_marks[:-1]
+        group_ids = np.cumsum(new_group) - 1
+        group_starts = index[new_group]
+        group_sizes = np.diff(np.append(group_starts, n))
+        first_place = position[group_starts]
+        # Average of lookup[first_place : first_place + size] via a prefix sum.
+        cumulative = np.concatenate(([0.0], np.cumsum(lookup)))
+        group_points = (cumulative[first_place + group_sizes] - cumulative[first_place]) / group_sizes
+        sorted_places = first_place[group_ids] + 1
+        sorted_points = group_points[group_ids]
+
+    places = np.empty(n, dtype=int)
+    points = np.empty(n, dtype=float)
+    places[order] = sorted_places
+    points[order] = sorted_points
+    return places, points
+
+
+def team_totals(school_ids, points):
+    """Sum per-row points by school. Returns ``{school_id: points}``."""
+    school_ids = np.asarray(school_ids)
+    if len(school_ids) == 0:
+        return {}
+    uniques, codes = np.unique(school_ids, return_inverse=True)
+    totals = np.bincount(codes, weights=points, minlength=len(uniques))
+    return {int(sid): float(total) for sid, total in zip(uniques, totals)}
+
+
+def score_meet(events, school_ids, marks, points_by_place, tie_policy=TIE_SEQUENTIAL, ascending=is_track_like_event, names=None):
+    """
+    Team scores for a meet: ``place_rows`` followed by ``team_totals``.
+    Every school with a row appears in the result, including those that
+    scored nothing.
+    """
+    _places, points = place_rows(
+        events, marks, points_by_place,
+        tie_policy=tie_policy, ascending=ascending, names=names,
+    )
+    return team_totals(school_ids, points)
+
+
+def rank_teams(totals, school_names, include_school_id=False):
+    """
+    Ranked ``{place, team, score}`` rows from ``{school_id: points}``.
+    Schools that scored nothing are dropped; equal (rounded) scores share a
+    place and are listed alphabetically. ``include_school_id`` adds
+    ``school_id`` to each row.
+    """
+    ranked = sorted(
+        ((sid, round(pts, 2)) for sid, pts in totals.items() if pts > 0),
+        key=lambda x: (-x[1], school_names.get(x[0], "")),
+    )
+
+    output = []
+    last_score = None
+    last_place = 0
+    for idx, (sid, score) in enumerate(ranked, start=1):
+        if score != last_score:
+            last_place = idx
+            last_score = score
+        row = {
+            "place": last_place,
+            "team": school_names.get(sid, f"School #{sid}"),
+            "score": score,
+        }
+        if include_school_id:
+            row["school_id"] = sid
+        output.append(row)
+    return output
+
+
+def score_simulations(events, school_ids, marks, points_by_place, ascending=is_track_like_event):
+    """
+    Team scores for many simulated runs of one meet.
+
+    ``marks`` is an ``(n_runs, n_rows)`` array: one sampled mark per row per
+    run. Each event is placed for every run at once with one argsort over
+    that event's rows. Sampled marks are continuous, so ties are broken by row order
+    (a stable sort); pass rows sorted by school name for the alphabetical
+    tie-break of ``TIE_SEQUENTIAL``.
+
+    Returns ``(teams, totals)``: the distinct school ids and an
+    ``(n_runs, n_teams)`` array of team scores.
+    """
+    marks = np.atleast_2d(np.asarray(marks, dtype=float))
+    n_runs, n_rows = marks.shape
+    school_ids = np.asarray(school_ids)
+    teams, team_codes = np.unique(school_ids, return_inverse=True)
+    totals = np.zeros((n_runs, len(teams)), dtype=float)
+    if n_rows == 0:
+        return teams, totals
+
+    event_values, event_codes = np.unique(np.asarray(events, dtype=object).astype(str), return_inverse=True)
+    if callable(ascending):
+        event_ascending = np.array([ascending(event) for event in event_values], dtype=bool)
+    else:
+        row_ascending = np.asarray(ascending, dtype=bool)
+        event_ascending = np.array([row_ascending[event_codes == code][0] for code in range(len(event_values))])
+
+    lookup = _points_lookup(points_by_place, n_rows)
+    run_index = np.arange(n_runs)[:, None]
+    for code, event_is_ascending in enumerate(event_ascending):
+        rows = np.flatnonzero(event_codes == code)
+        event_marks = marks[:, rows] if event_is_ascending else -marks[:, rows]
+        order = np.argsort(event_marks, axis=1, kind="stable")
+        # order[r, k] is the row placing k-th in run r; scatter the k-th place's points onto it.
+        event_points = np.zeros((n_runs, len(rows)), dtype=float)
+        event_points[run_index, order] = lookup[:len(rows)]
+        np.add.at(totals.T, team_codes[rows], event_points.T)
+    return teams, totals
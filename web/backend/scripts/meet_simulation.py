@@ -0,0 +1,330 @@
+"""
+Meet Simulation
+
+Monte Carlo version of ``regional_predictions`` / ``state_predictions``.
+Instead of scoring one projected meet from each entrant's feeder-round mark,
+every entrant's mark is resampled thousands of times and each simulated meet
+is scored, giving every team a win probability and a score distribution.
+
+Variance model: an entrant's simulated mark is their feeder-round final mark
+times ``exp(sigma * z)`` with ``z ~ N(0, 1)``. ``sigma`` is the spread of the
+entrant's own log marks this season (prelims and finals of the rounds already
+run), shrunk toward the event's pooled within-entrant spread with
+``PRIOR_WEIGHT`` pseudo-observations, so an entrant with one or two marks
+gets mostly the event-wide spread. Events with no repeated marks at all fall
+back to ``DEFAULT_SPREAD``; pooled spreads never go below ``MIN_SPREAD``.
+
+Regionals are independent and run in a process pool; each draws from its own
+stream seeded by ``(seed, regional_num)``, so results are reproducible and
+don't depend on the number of workers.
+
+Usage:
+    python meet_simulation.py --year 2025 --gender Boys
+    python meet_simulation.py --year 2025 --gender Girls --state --sims 20000 --seed 7
+"""
+
+import argparse
+import multiprocessing
+import sqlite3
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, is_track_like_event, score_simulations
+from regional_predictions import DB_PATH, _feeder_sectional_nums
+from state_predictions import NUM_REGIONALS, _present_regionals
+
+
+DEFAULT_SIMULATIONS = 5000
+DEFAULT_SEED = 0
+BATCH_SIZE = 1000
+PRIOR_WEIGHT = 3
+# Relative standard deviation when an event has no repeated marks to pool.
+DEFAULT_SPREAD = {True: 0.02, False: 0.05}  # keyed by is_track_like_event
+# Floor for the pooled spread: fields where every prelim equals its final
+# would otherwise pool to zero and simulate deterministically.
+MIN_SPREAD = 0.005
+PERCENTILES = (10, 50, 90)
+
+# Rounds whose marks count as season history when projecting the next round.
+HISTORY_MEET_TYPES = {
+    "Regional": ("Sectional",),
+    "State": ("Sectional", "Regional"),
+}
+
+
+def _valid_mark_filter(column):
+    return f"{column} IS NOT NULL AND {column} NOT IN (0, 9999)"
+
+
+def _fetch_entries(conn, year, gender, meet_type, meet_nums=None):
+    """
+    Finals rows of the feeder meets as ``(event, school_id, school_name, entrant, result2)``.
+    ``entrant`` is ``("athlete", athlete_id)`` or ``("relay", school_id)``.
+    """
+    num_filter = ""
+    params = [year, gender, meet_type]
+    if meet_nums is not None:
+        num_filter = f"AND m.meet_num IN ({','.join('?' * len(meet_nums))})"
+        params.extend(meet_nums)
+    individual = conn.execute(
+        f"""
+        SELECT ar.event, s.school_id, s.school_name, ar.athlete_id, ar.result2
+        FROM athlete_result ar
+        JOIN athlete a ON ar.athlete_id = a.athlete_id
+        JOIN school s ON a.school_id = s.school_id
+        JOIN meet m ON ar.meet_id = m.meet_id
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type = ? {num_filter}
+          AND ar.result_type = 'Final'
+          AND {_valid_mark_filter('ar.result2')}
+        """,
+        params,
+    ).fetchall()
+    relays = conn.execute(
+        f"""
+        SELECT rr.event, s.school_id, s.school_name, rr.school_id, rr.result2
+        FROM relay_result rr
+        JOIN school s ON rr.school_id = s.school_id
+        JOIN meet m ON rr.meet_id = m.meet_id
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type = ? {num_filter}
+          AND {_valid_mark_filter('rr.result2')}
+        """,
+        params,
+    ).fetchall()
+    return (
+        [(event, sid, name, ("athlete", aid), mark) for event, sid, name, aid, mark in individual]
+        + [(event, sid, name, ("relay", rid), mark) for event, sid, name, rid, mark in relays]
+    )
+
+
+def _fetch_history(conn, year, gender, meet_types):
+    """``{(entrant, event): [marks]}`` for every result of the season in ``meet_types``."""
+    placeholders = ",".join("?" * len(meet_types))
+    params = (year, gender, *meet_types)
+    history = defaultdict(list)
+    for event, aid, mark in conn.execute(
+        f"""
+        SELECT ar.event, ar.athlete_id, ar.result2
+        FROM athlete_result ar
+        JOIN meet m ON ar.meet_id = m.meet_id
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type IN ({placeholders})
+          AND {_valid_mark_filter('ar.result2')}
+        """,
+        params,
+    ):
+        history[(("athlete", aid), event)].append(mark)
+    for event, sid, mark in conn.execute(
+        f"""
+        SELECT rr.event, rr.school_id, rr.result2
+        FROM relay_result rr
+        JOIN meet m ON rr.meet_id = m.meet_id
+        WHERE m.year = ? AND m.gender = ? AND m.meet_type IN ({placeholders})
+          AND {_valid_mark_filter('rr.result2')}
+        """,
+        params,
+    ):
+        history[(("relay", sid), event)].append(mark)
+    return history
+
+
+def entrant_spreads(entries, history):
+    """
+    Log-scale standard deviation for each entry row, shrunk toward the
+    event's pooled within-entrant variance (see module docstring).
+    """
+    pooled_sum = defaultdict(float)
+    pooled_dof = defaultdict(int)
+    own = {}
+    for (entrant, event), marks in history.items():
+        if len(marks) < 2:
+            continue
+        logs = np.log(np.asarray(marks, dtype=float))
+        variance = float(np.var(logs, ddof=1))
+        own[(entrant, event)] = (len(marks) - 1, variance)
+        pooled_sum[event] += (len(marks) - 1) * variance
+        pooled_dof[event] += len(marks) - 1
+
+    spreads = np.empty(len(entries), dtype=float)
+    for i, (event, _sid, _name, entrant, _mark) in enumerate(entries):
+        if pooled_dof[event]:
+            prior = max(pooled_sum[event] / pooled_dof[event], MIN_SPREAD ** 2)
+        else:
+            prior = DEFAULT_SPREAD[is_track_like_event(event)] ** 2
+        dof, variance = own.get((entrant, event), (0, 0.0))
+        spreads[i] = np.sqrt((dof * variance + PRIOR_WEIGHT * prior) / (dof + PRIOR_WEIGHT))
+    return spreads
+
+
+def simulate_meet(entries, spreads, points_by_place, n_sims, rng, variance_scale=1.0):
+    """
+    Score ``n_sims`` simulated meets. Returns ``(teams, totals)`` as from
+    ``score_simulations``. Rows are ordered by school name first so equal
+    marks (only possible with ``variance_scale=0``) break alphabetically,
+    matching the deterministic predictions.
+    """
+    order = sorted(range(len(entries)), key=lambda i: entries[i][2] or "")
+    entries = [entries[i] for i in order]
+    spreads = spreads[order] * variance_scale
+    events = [row[0] for row in entries]
+    school_ids = [row[1] for row in entries]
+    base = np.array([row[4] for row in entries], dtype=float)
+
+    teams, batches = None, []
+    for start in range(0, n_sims, BATCH_SIZE):
+        size = min(BATCH_SIZE, n_sims - start)
+        marks = base * np.exp(spreads * rng.standard_normal((size, len(base))))
+        teams, totals = score_simulations(events, school_ids, marks, points_by_place)
+        batches.append(totals)
+    return teams, np.vstack(batches)
+
+
+def summarize(teams, totals, school_names):
+    """
+    Per-team win probability (shared wins split evenly), mean score and
+    score percentiles, best chance first.
+    """
+    best = totals.max(axis=1, keepdims=True)
+    winners = totals == best
+    win_probability = (winners / winners.sum(axis=1, keepdims=True)).mean(axis=0)
+    mean = totals.mean(axis=0)
+    percentiles = np.percentile(totals, PERCENTILES, axis=0)
+
+    rows = []
+    for i, sid in enumerate(teams):
+        if not totals[:, i].any():
+            continue
+        row = {
+            "team": school_names.get(int(sid), f"School #{sid}"),
+            "win_probability": round(float(win_probability[i]), 4),
+            "mean_score": round(float(mean[i]), 2),
+        }
+        for p, values in zip(PERCENTILES, percentiles):
+            row[f"p{p}"] = round(float(values[i]), 2)
+        rows.append(row)
+    rows.sort(key=lambda r: (-r["win_probability"], -r["mean_score"], r["team"]))
+    return rows
+
+
+def _simulate(conn, year, gender, meet_type, feeder_meet_type, feeder_nums, points_by_place, n_sims, rng, variance_scale):
+    entries = _fetch_entries(conn, year, gender, feeder_meet_type, feeder_nums)
+    if not entries:
+        return []
+    history = _fetch_history(conn, year, gender, HISTORY_MEET_TYPES[meet_type])
+    spreads = entrant_spreads(entries, history)
+    teams, totals = simulate_meet(entries, spreads, points_by_place, n_sims, rng, variance_scale=variance_scale)
+    school_names = {sid: name for _event, sid, name, _entrant, _mark in entries}
+    return summarize(teams, totals, school_names)
+
+
+def simulate_regional(year, gender, regional_num, n_sims=DEFAULT_SIMULATIONS, seed=DEFAULT_SEED,
+                      variance_scale=1.0, db_path=None):
+    """
+    Simulate one regional from its four feeder sectionals.
+
+    Returns ``{"regional_num", "simulations", "rows"}`` where ``rows`` is a
+    list of ``{team, win_probability, mean_score, p10, p50, p90}``, or None
+    while any feeder sectional is missing (same rule as
+    ``regional_predictions.get_regional_prediction``).
+    """
+    feeder_nums = _feeder_sectional_nums(regional_num)
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        present = {
+            row[0] for row in conn.execute(
+                f"""
+                SELECT DISTINCT m.meet_num FROM athlete_result ar
+                JOIN meet m ON ar.meet_id = m.meet_id
+                WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional'
+                  AND m.meet_num IN ({','.join('?' * len(feeder_nums))})
+                """,
+                (year, gender, *feeder_nums),
+            )
+        }
+        if len(present) < len(feeder_nums):
+            return None
+        rng = np.random.default_rng([seed, regional_num])
+        rows = _simulate(
+            conn, year, gender, "Regional", "Sectional", feeder_nums,
+            REGIONAL_POINTS, n_sims, rng, variance_scale,
+        )
+    finally:
+        conn.close()
+    return {"regional_num": regional_num, "simulations": n_sims, "rows": rows}
+
+
+def simulate_regionals(year, gender, n_sims=DEFAULT_SIMULATIONS, seed=DEFAULT_SEED, jobs=1,
+                       variance_scale=1.0, db_path=None):
+    """Simulate all 8 regionals, ``jobs`` at a time. Regionals with a missing feeder are skipped."""
+    args = [(year, gender, num, n_sims, seed, variance_scale, db_path) for num in range(1, NUM_REGIONALS + 1)]
+    if jobs <= 1:
+        results = [simulate_regional(*a) for a in args]
+    else:
+        # spawn, not fork: each worker opens its own SQLite connection.
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+            results = list(pool.map(simulate_regional, *zip(*args)))
+    return [entry for entry in results if entry is not None]
+
+
+def simulate_state(year, gender, n_sims=DEFAULT_SIMULATIONS, seed=DEFAULT_SEED, variance_scale=1.0, db_path=None):
+    """
+    Simulate the state meet from all 8 regional finals. Same envelope as
+    ``state_predictions.get_state_predictions`` plus ``simulations``;
+    ``rows`` stays empty until every regional is loaded.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        present = _present_regionals(conn, year, gender)
+        expected = set(range(1, NUM_REGIONALS + 1))
+        missing = sorted(expected - present)
+        rows = []
+        if not missing:
+            rng = np.random.default_rng([seed, 0])
+            rows = _simulate(
+                conn, year, gender, "State", "Regional", None,
+                STATE_POINTS, n_sims, rng, variance_scale,
+            )
+    finally:
+        conn.close()
+    return {
+        "year": year,
+        "gender": gender,
+        "ready": not missing,
+        "missing_regionals": missing,
+        "simulations": n_sims,
+        "rows": rows,
+    }
+
+
+def _print_rows(rows, top_n):
+    print(f"  {'Team':<28} {'Win %':>6} {'Mean':>7} " + " ".join(f"{'p' + str(p):>6}" for p in PERCENTILES))
+    for row in rows[:top_n]:
+        print(
+            f"  {row['team']:<28} {100 * row['win_probability']:>6.1f} {row['mean_score']:>7.1f} "
+            + " ".join(f"{row['p' + str(p)]:>6.1f}" for p in PERCENTILES)
+        )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Monte Carlo regional/state team-score simulation.")
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--gender", choices=["Boys", "Girls"], required=True)
+    parser.add_argument("--state", action="store_true", help="simulate the state meet instead of the regionals")
+    parser.add_argument("--sims", type=int, default=DEFAULT_SIMULATIONS, help="simulated meets per regional/state")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for the regionals")
+    parser.add_argument("--top", type=int, default=10, help="teams to print per meet")
+    args = parser.parse_args()
+
+    if args.state:
+        result = simulate_state(args.year, args.gender, n_sims=args.sims, seed=args.seed)
+        if not result["ready"]:
+            print(f"Missing regionals: {result['missing_regionals']}")
+        print(f"=== {args.year} {args.gender} State ({args.sims} simulations) ===")
+        _print_rows(result["rows"], args.top)
+    else:
+        for entry in simulate_regionals(args.year, args.gender, n_sims=args.sims, seed=args.seed, jobs=args.jobs):
+            print(f"=== {args.year} {args.gender} Regional {entry['regional_num']} ({args.sims} simulations) ===")
+            _print_rows(entry["rows"], args.top)
+            print()
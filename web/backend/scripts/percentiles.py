@@ -1,7 +1,100 @@
+import os
+import threading
+
 import pandas as pd
 from util.db_util import Database
 from util.const_util import CONST
 
+try:
+    import pyarrow  # noqa: F401  (enables the on-disk Parquet snapshot)
+except ImportError:
+    pyarrow = None
+
+# Parquet copies of the snapshot, one pair per data version, so a fresh worker
+# process can skip the SQL joins. Only used when pyarrow is installed.
+SNAPSHOT_DIR = os.path.join(os.path.dirname(CONST.DB_PATH), "results_snapshot")
+CATEGORY_COLUMNS = ("gender", "event", "grade", "meet_type")
+
+# Process-level snapshot shared by every request: {"version", "athletes", "relays"}.
+_snapshot = {"version": None, "athletes": None, "relays": None}
+_snapshot_lock = threading.Lock()
+
+
+def _compact(df, id_column):
+    """Categorical dtypes for the repeated strings and narrow ints for ids/years."""
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    df[id_column] = pd.to_numeric(df[id_column], downcast="integer")
+    df["year"] = pd.to_numeric(df["year"], downcast="integer")
+    df["result2"] = df["result2"].astype("float64")
+    return df
+
+
+def _snapshot_paths(version):
+    return (
+        os.path.join(SNAPSHOT_DIR, f"athlete_marks-{version}.parquet"),
+        os.path.join(SNAPSHOT_DIR, f"relay_marks-{version}.parquet"),
+    )
+
+
+def _read_parquet_snapshot(version):
+    if pyarrow is None:
+        return None
+    athletes_path, relays_path = _snapshot_paths(version)
+    if not (os.path.exists(athletes_path) and os.path.exists(relays_path)):
+        return None
+    try:
+        return pd.read_parquet(athletes_path), pd.read_parquet(relays_path)
+    except Exception:
+        return None
+
+
+def _write_parquet_snapshot(version, athletes, relays):
+    if pyarrow is None:
+        return
+    try:
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        for df, path in zip((athletes, relays), _snapshot_paths(version)):
+            tmp_path = f"{path}.tmp"
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        current = {os.path.basename(path) for path in _snapshot_paths(version)}
+        for name in os.listdir(SNAPSHOT_DIR):
+            if name.endswith(".parquet") and name not in current:
+                os.remove(os.path.join(SNAPSHOT_DIR, name))
+    except OSError:
+        pass  # the in-memory snapshot still works without the file
+
+
+def get_results_snapshot():
+    """
+    Returns (athlete marks, relay marks) DataFrames shared across calls.
+
+    Holds only the columns get_percentiles filters and groups on, with
+    categorical dtypes for the repeated strings. The snapshot is rebuilt only
+    when the database's data version changes, from the Parquet copy for that
+    version when one exists, otherwise from SQL. Treat the frames as read-only.
+    """
+    db = Database(CONST.DB_PATH)
+    try:
+        version = db.get_data_version()
+        if _snapshot["version"] == version:
+            return _snapshot["athletes"], _snapshot["relays"]
+        with _snapshot_lock:
+            if _snapshot["version"] != version:
+                frames = _read_parquet_snapshot(version)
+                if frames is None:
+                    frames = (
+                        _compact(db.get_athlete_result_marks(), "athlete_id"),
+                        _compact(db.get_relay_result_marks(), "school_id"),
+                    )
+                    _write_parquet_snapshot(version, *frames)
+                _snapshot.update(version=version, athletes=frames[0], relays=frames[1])
+            return _snapshot["athletes"], _snapshot["relays"]
+    finally:
+        db.conn.close()
+
 
 def convert_back(event_type, event_result):
     if event_type == CONST.EVENT_TYPE.FIELD:
@@ -47,10 +140,8 @@ def get_percentiles(
     Returns:
         DataFrame or tuple[DataFrame, DataFrame]: Single DataFrame if one gender specified, otherwise tuple of (Girls DataFrame, Boys DataFrame).
     """
-    # Initialize database connection and load data
-    db = Database(CONST.DB_PATH)
-    df = db.get_all_athlete_results()
-    df_relay = db.get_all_relay_results()
+    # Shared columnar snapshot of every mark (reloaded only when the data changes)
+    df, df_relay = get_results_snapshot()
     
     # Default values
     if genders is None:
@@ -70,62 +161,62 @@ def get_percentiles(
     
     # Convert percentiles to decimal format
     percentile_decimals = [p / 100.0 for p in percentiles]
-    
-    all_rows = []
-    sample_counts = {}  # Track sample sizes per gender/event
+    # Track events are lower-is-better, so their percentiles come from the other tail
+    track_percentiles = [1 - x for x in percentile_decimals]
+
+    # Every (gender, event) cell requested, in output order. Girls 110 Hurdles is actually 100 Hurdles.
+    cells = []
     for event_gender in gender_list:
         for event_name in event_list:
-            # Girls 110 Hurdles is actually 100 Hurdles
-            current_event = event_name
-            display_event = event_name
             if event_gender == CONST.GENDER.GIRLS and event_name == CONST.EVENT.E110H:
-                current_event = CONST.EVENT.E100H
-                display_event = CONST.EVENT.E100H
-            # Select appropriate dataframe (relay vs individual)
-            if CONST.EVENT_TYPE.RELAY in current_event:
-                df_source = df_relay
-            else:
-                df_source = df
-            # Build filter conditions
-            conditions = (
-                (df_source.event == current_event) &
-                (df_source.gender == event_gender) &
-                (df_source.result2 != 0) &
-                (df_source.result2 != 9999)
-            )
-            if meet_types is not None:
-                conditions &= df_source.meet_type.isin(meet_types)
-            if years is not None:
-                conditions &= df_source.year.isin(years)
-            if grade_levels is not None and CONST.EVENT_TYPE.RELAY not in current_event:
-                conditions &= df_source.grade.isin(grade_levels)
-            df2 = df_source[conditions]
-            if df2.empty:
+                event_name = CONST.EVENT.E100H
+            cells.append((event_gender, event_name))
+
+    quantiles = {}      # (gender, event, q) -> mark
+    sample_counts = {}  # (gender, event) -> unique athletes/teams
+    for df_source, id_column, is_relay in ((df, 'athlete_id', False), (df_relay, 'school_id', True)):
+        wanted = [(g, e) for g, e in cells if (CONST.EVENT_TYPE.RELAY in e) == is_relay]
+        if not wanted:
+            continue
+        # One filter over the whole frame for every requested cell
+        conditions = (
+            df_source.gender.isin({g for g, _ in wanted}) &
+            df_source.event.isin({e for _, e in wanted})
+        )
+        if meet_types is not None:
+            conditions &= df_source.meet_type.isin(meet_types)
+        if years is not None:
+            conditions &= df_source.year.isin(years)
+        if grade_levels is not None and not is_relay:
+            conditions &= df_source.grade.isin(grade_levels)
+        df2 = df_source.loc[conditions, ['gender', 'event', id_column, 'result2']]
+        if df2.empty:
+            continue
+
+        # Best mark per athlete (relays: per school) in every cell: min for track, max for field
+        marks = df2.groupby(['gender', 'event', id_column], observed=True, sort=False)['result2'].agg(['min', 'max'])
+        is_track = marks.index.get_level_values('event').astype(str).str[0].str.isdigit()
+        best_per_athlete = marks['min'].where(is_track, marks['max'])
+
+        for track, qs in ((True, track_percentiles), (False, percentile_decimals)):
+            subset = best_per_athlete[is_track == track]
+            if subset.empty:
                 continue
-            
-            # Determine if this is a track event (lower is better) or field event (higher is better)
-            if current_event[0].isdigit():
-                event_type = CONST.EVENT_TYPE.TRACK
-                # For track events, get the minimum (best) time per athlete
-                if CONST.EVENT_TYPE.RELAY in current_event:
-                    # For relays, group by school_id instead of athlete_id
-                    best_per_athlete = df2.groupby('school_id')['result2'].min()
-                else:
-                    best_per_athlete = df2.groupby('athlete_id')['result2'].min()
-                track_percentiles = [1 - x for x in percentile_decimals]
-                df3 = best_per_athlete.quantile(track_percentiles)
-            else:
-                event_type = CONST.EVENT_TYPE.FIELD
-                # For field events, get the maximum (best) distance/height per athlete
-                best_per_athlete = df2.groupby('athlete_id')['result2'].max()
-                df3 = best_per_athlete.quantile(percentile_decimals)
-            
-            # Store sample count (unique athletes/teams, not total records)
-            sample_counts[(event_gender, display_event)] = len(best_per_athlete)
-            
-            percentile_values = [convert_back(event_type, df3.iloc[i]) for i in range(len(percentiles))]
-            # Add a row for each event/gender
-            all_rows.append([event_gender, display_event] + percentile_values)
+            by_cell = subset.groupby(level=['gender', 'event'], observed=True, sort=False)
+            quantiles.update(by_cell.quantile(qs).to_dict())
+            sample_counts.update(by_cell.size().to_dict())
+
+    all_rows = []
+    for event_gender, event_name in cells:
+        if (event_gender, event_name) not in sample_counts:
+            continue
+        if event_name[0].isdigit():
+            event_type, qs = CONST.EVENT_TYPE.TRACK, track_percentiles
+        else:
+            event_type, qs = CONST.EVENT_TYPE.FIELD, percentile_decimals
+        percentile_values = [convert_back(event_type, quantiles[(event_gender, event_name, q)]) for q in qs]
+        # Add a row for each event/gender
+        all_rows.append([event_gender, event_name] + percentile_values)
     # Build final DataFrame
     columns = ['Gender', 'Event'] + list(percentiles)
     final_df = pd.DataFrame(all_rows, columns=columns)
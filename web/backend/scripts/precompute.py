@@ -0,0 +1,213 @@
+"""
+Rebuild the stale precomputed prediction/qualifier artifacts.
+
+One entry point instead of running precompute_regional_predictions.py,
+precompute_combined_rankings.py, precompute_combined_results.py,
+precompute_state_qualifiers.py and precompute_state_predictions.py by hand.
+Each artifact reads either the sectional or the regional results plus the
+host registry (``ARTIFACT_INPUTS`` in precompute_manifest.py); none reads
+another artifact's output, so they build independently:
+
+    sectional results -> regional_predictions, combined_rankings
+    regional results  -> combined_results, state_qualifiers, state_predictions
+
+An artifact's fingerprint hashes the content hashes of the meets it reads
+(see ``_feeder_meet_signatures``) and the host registry. When that matches
+the fingerprint recorded in the manifest shared with
+precompute_incremental.py and the file still exists, the artifact is fresh
+and skipped. Stale artifacts are grouped per (year, gender), the groups run
+in a process pool writing into one staged version of the artifact store,
+and that version is published once all groups finish.
+
+Usage:
+    python precompute.py                      # latest season, both genders
+    python precompute.py --year 2025 --year 2026 --jobs 4
+    python precompute.py --only state_qualifiers --force
+    python precompute.py --dry-run
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend import create_app  # noqa: E402
+from backend.artifact_store import (  # noqa: E402
+    STATIC_DATA_DIR,
+    StagedVersion,
+    artifact_store,
+    publish_artifacts,
+    write_json_artifact,
+)
+from backend.queries import get_state_qualifiers  # noqa: E402
+from precompute_combined_rankings import build_combined_payload  # noqa: E402
+from precompute_combined_results import build_payload as build_combined_results  # noqa: E402
+from precompute_incremental import REGIONAL_DIR, STATE_DIR, latest_season  # noqa: E402
+from precompute_manifest import (  # noqa: E402
+    artifact_fingerprints,
+    artifact_key,
+    load_manifest,
+    meet_fingerprints,
+    save_manifest,
+    season_key,
+)
+from regional_predictions import get_regional_predictions  # noqa: E402
+from state_predictions import get_state_predictions  # noqa: E402
+
+GENDERS = ["Boys", "Girls"]
+
+# name -> output dir and builder; inputs are in precompute_manifest.ARTIFACT_INPUTS.
+ARTIFACTS = {
+    "regional_predictions": {
+        "dir": REGIONAL_DIR,
+        "build": lambda gender, year: get_regional_predictions(year, gender, top_n=None),
+    },
+    "combined_rankings": {
+        "dir": REGIONAL_DIR,
+        "build": build_combined_payload,
+    },
+    "combined_results": {
+        "dir": REGIONAL_DIR,
+        "build": build_combined_results,
+    },
+    "state_qualifiers": {
+        "dir": STATE_DIR,
+        "build": get_state_qualifiers,
+    },
+    "state_predictions": {
+        "dir": STATE_DIR,
+        "build": lambda gender, year: get_state_predictions(year, gender, top_n=None),
+    },
+}
+
+
+def artifact_names(names=None) -> list:
+    """Artifact names, limited to ``names`` when given."""
+    return [name for name in ARTIFACTS if names is None or name in names]
+
+
+def artifact_path(name: str, gender: str, year: int) -> str:
+    """Path relative to the artifact data root."""
+    return os.path.join(ARTIFACTS[name]["dir"], f"{name}_{year}_{gender.lower()}.json")
+
+
+def _published_path(relpath: str) -> str:
+    from config import Config
+
+    if not Config.ARTIFACT_STORE_PATH:
+        return os.path.join(STATIC_DATA_DIR, relpath)
+    return artifact_store().resolve(relpath)
+
+
+def stale_jobs(current: dict, names, manifest: dict, force: bool = False) -> list:
+    """
+    ``[(year, gender, [(name, fingerprint), ...])]`` for the artifacts that
+    need rebuilding, given ``{(year, gender): meet_fingerprints(...)}``.
+    """
+    jobs = []
+    for (year, gender), meets in current.items():
+        fingerprints = artifact_fingerprints(meets)
+        stale = [
+            (name, fingerprints[name])
+            for name in artifact_names(names)
+            if force
+            or manifest["artifacts"].get(artifact_key(name, gender, year)) != fingerprints[name]
+            or not os.path.exists(_published_path(artifact_path(name, gender, year)))
+        ]
+        if stale:
+            jobs.append((year, gender, stale))
+    return jobs
+
+
+def build_artifacts(year: int, gender: str, names: list, version_path: str) -> list:
+    """
+    Build ``names`` for one season/gender and write them under
+    ``version_path``. Returns the paths.
+    """
+    app = create_app()
+    version = StagedVersion(None, version_path)
+    paths = []
+    with app.app_context():
+        for name in names:
+            payload = ARTIFACTS[name]["build"](gender, year)
+            path = version.artifact_path(artifact_path(name, gender, year))
+            size = write_json_artifact(path, payload)
+            print(f"  Built {name} {year} {gender} -> {path} ({size:,} bytes)", flush=True)
+            paths.append(path)
+    return paths
+
+
+def main(years=None, genders=GENDERS, names=None, jobs=1, force=False, dry_run=False, app=None) -> int:
+    app = app or create_app()
+    manifest = load_manifest()
+    with app.app_context():
+        years = years or [latest_season()]
+        current = {(year, gender): meet_fingerprints(gender, year) for year in years for gender in genders}
+        plan = stale_jobs(current, names, manifest, force=force)
+
+    for year, gender in current:
+        stale = next((items for y, g, items in plan if (y, g) == (year, gender)), [])
+        fresh = [name for name in artifact_names(names) if name not in dict(stale)]
+        print(f"{year} {gender}: stale={[name for name, _ in stale]} fresh={fresh}")
+    if dry_run or not plan:
+        return 0
+
+    failures = 0
+    built = []
+    with publish_artifacts() as version:
+        if jobs <= 1 or len(plan) == 1:
+            for year, gender, stale in plan:
+                build_artifacts(year, gender, [name for name, _ in stale], version.path)
+                built.append((year, gender, stale))
+        else:
+            # spawn, not fork: each worker opens its own SQLite connections.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+                futures = {
+                    pool.submit(build_artifacts, year, gender, [name for name, _ in stale], version.path): (year, gender, stale)
+                    for year, gender, stale in plan
+                }
+                for future in as_completed(futures):
+                    year, gender, stale = futures[future]
+                    try:
+                        future.result()
+                    except Exception as exc:
+                        failures += 1
+                        print(f"  FAILED {year} {gender}: {exc}", flush=True)
+                        continue
+                    built.append((year, gender, stale))
+
+    # Failed groups keep the previous version's files and stay stale.
+    for year, gender, stale in built:
+        for name, fingerprint in stale:
+            manifest["artifacts"][artifact_key(name, gender, year)] = fingerprint
+    # Once every artifact of a season is fresh, the incremental run can start from here.
+    for (year, gender), meets in current.items():
+        fingerprints = artifact_fingerprints(meets)
+        if all(manifest["artifacts"].get(artifact_key(name, gender, year)) == fingerprints[name] for name in ARTIFACTS):
+            manifest["meets"][season_key(gender, year)] = meets
+    save_manifest(manifest)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--year", type=int, action="append", help="season year (repeatable; default latest)")
+    parser.add_argument("--gender", choices=GENDERS, action="append", help="limit to one gender (repeatable)")
+    parser.add_argument("--only", choices=list(ARTIFACTS), action="append", help="limit to one artifact (repeatable)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--force", action="store_true", help="rebuild even if fingerprints match")
+    parser.add_argument("--dry-run", action="store_true", help="report stale artifacts without building")
+    args = parser.parse_args()
+    sys.exit(main(
+        years=args.year,
+        genders=args.gender or GENDERS,
+        names=args.only,
+        jobs=args.jobs,
+        force=args.force,
+        dry_run=args.dry_run,
+    ))
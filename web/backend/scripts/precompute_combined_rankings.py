@@ -4,13 +4,13 @@ Precompute and save the Combined Regional Rankings as JSON.
 For each (year, gender), this assembles the unofficial regional qualifier list
 from all 8 regionals into a single per-event ranked list (best-to-worst),
 de-duplicates by athlete/school, and writes the result to a JSON file the API
-can serve quickly without hitting the database.
+can serve quickly without hitting the database. Every row also carries its
+simulated chance of advancing to state (see ``advancement_probabilities.py``).
 
 Run this after sectional results are updated.
 """
 import os
 import sys
-import json
 
 # Ensure 'backend' is importable when running this script directly
 HERE = os.path.dirname(os.path.abspath(__file__))
@@ -19,45 +19,40 @@ if WEB_DIR not in sys.path:
     sys.path.insert(0, WEB_DIR)
 
 from backend import create_app  # noqa: E402
-from backend.queries import get_regional_qualifiers  # noqa: E402
+from backend.queries import get_all_regional_qualifiers  # noqa: E402
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
+from advancement_probabilities import attach_advancement_probabilities  # noqa: E402
 
 
-OUTPUT_DIR = os.path.join(WEB_DIR, 'frontend', 'static', 'data', 'regional_predictions')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Relative to the artifact data root (see backend/artifact_store.py).
+OUTPUT_DIR = 'regional_predictions'
 
 YEARS = [2026]
 GENDERS = ["Boys", "Girls"]
 FIELD_EVENTS = {"High Jump", "Long Jump", "Triple Jump", "Shot Put", "Discus", "Pole Vault"}
 
 
-def build_combined_payload(gender: str, year: int) -> dict:
-    combined: dict[str, list[dict]] = {}
-    event_meta: dict[str, dict] = {}
-
-    for regional_num in range(1, 9):
-        try:
-            payload = get_regional_qualifiers(gender=gender, regional_num=regional_num, year=year)
-        except Exception as exc:
-            print(f"  WARN regional {regional_num}: {exc}")
+def _add_regional_rows(combined: dict, event_meta: dict, regional_num: int, payload: dict) -> None:
+    for event_block in payload.get('events', []):
+        event_name = event_block.get('event')
+        if not event_name:
             continue
-        for event_block in payload.get('events', []):
-            event_name = event_block.get('event')
-            if not event_name:
+        if event_name not in combined:
+            combined[event_name] = []
+            event_meta[event_name] = {
+                'event': event_name,
+                'event_type': event_block.get('event_type'),
+                'standard_mark': event_block.get('standard_mark'),
+            }
+        for row in event_block.get('qualifiers', []):
+            if row.get('is_placeholder'):
                 continue
-            if event_name not in combined:
-                combined[event_name] = []
-                event_meta[event_name] = {
-                    'event': event_name,
-                    'event_type': event_block.get('event_type'),
-                    'standard_mark': event_block.get('standard_mark'),
-                }
-            for row in event_block.get('qualifiers', []):
-                if row.get('is_placeholder'):
-                    continue
-                enriched = dict(row)
-                enriched['regional_num'] = regional_num
-                combined[event_name].append(enriched)
+            enriched = dict(row)
+            enriched['regional_num'] = regional_num
+            combined[event_name].append(enriched)
+
 
+def _rank_events(combined: dict, event_meta: dict) -> list:
     events_out = []
     for event_name, rows in combined.items():
         is_field = event_name in FIELD_EVENTS
@@ -65,10 +60,12 @@ def build_combined_payload(gender: str, year: int) -> dict:
         def sort_key(r, is_field=is_field):
             val = r.get('result2')
             if val is None:
-                return float('-inf') if is_field else float('inf')
-            return val
+                val = float('-inf') if is_field else float('inf')
+            # Regional number keeps ties in regional order, so a partial
+            # update ranks rows exactly like a full rebuild.
+            return (-val if is_field else val, r.get('regional_num') or 0)
 
-        sorted_rows = sorted(rows, key=sort_key, reverse=is_field)
+        sorted_rows = sorted(rows, key=sort_key)
         seen = set()
         unique_rows = []
         for r in sorted_rows:
@@ -85,31 +82,75 @@ def build_combined_payload(gender: str, year: int) -> dict:
             'standard_mark': meta.get('standard_mark'),
             'qualifiers': unique_rows,
         })
+    return events_out
+
+
+def build_combined_payload(gender: str, year: int) -> dict:
+    combined: dict[str, list[dict]] = {}
+    event_meta: dict[str, dict] = {}
+
+    # One bulk load of every feeder sectional instead of one query per
+    # event per regional.
+    try:
+        payloads = get_all_regional_qualifiers(gender=gender, year=year)
+    except Exception as exc:
+        print(f"  WARN regionals: {exc}")
+        payloads = {}
 
-    return {
+    for regional_num, payload in sorted(payloads.items()):
+        _add_regional_rows(combined, event_meta, regional_num, payload)
+
+    return attach_advancement_probabilities({
+        'context': {'gender': gender, 'year': year},
+        'events': _rank_events(combined, event_meta),
+    })
+
+
+def update_combined_payload(existing: dict, regional_payloads: dict, gender: str, year: int) -> dict:
+    """
+    Replace only the given regionals' rows in an existing combined payload.
+
+    ``regional_payloads`` maps regional_num to a fresh
+    ``get_regional_qualifiers`` payload; rows from every other regional are
+    kept from ``existing`` as-is.
+    """
+    combined: dict[str, list[dict]] = {}
+    event_meta: dict[str, dict] = {}
+    for event_block in existing.get('events', []):
+        event_name = event_block.get('event')
+        if not event_name:
+            continue
+        event_meta[event_name] = {
+            'event': event_name,
+            'event_type': event_block.get('event_type'),
+            'standard_mark': event_block.get('standard_mark'),
+        }
+        combined[event_name] = [
+            row for row in event_block.get('qualifiers', [])
+            if row.get('regional_num') not in regional_payloads
+        ]
+
+    for regional_num, payload in sorted(regional_payloads.items()):
+        _add_regional_rows(combined, event_meta, regional_num, payload)
+
+    return attach_advancement_probabilities({
         'context': {'gender': gender, 'year': year},
-        'events': events_out,
-    }
+        'events': _rank_events(combined, event_meta),
+    })
 
 
 def main(output_prefix: str = 'combined_rankings'):
     app = create_app()
-    with app.app_context():
+    with app.app_context(), publish_artifacts() as version:
         for year in YEARS:
             for gender in GENDERS:
                 print(f"Computing {output_prefix} for {year} {gender}...")
-                # Bypass lru_cache so we always recompute against fresh DB state.
-                target = get_regional_qualifiers
-                if hasattr(target, 'cache_clear'):
-                    target.cache_clear()
-
                 payload = build_combined_payload(gender, year)
-                out_path = os.path.join(
+                out_path = version.artifact_path(os.path.join(
                     OUTPUT_DIR,
                     f"{output_prefix}_{year}_{gender.lower()}.json",
-                )
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2)
+                ))
+                write_json_artifact(out_path, payload)
                 print(f"  Saved: {out_path}  (events={len(payload['events'])})")
 
 
@@ -12,7 +12,6 @@ Run after Regional meets are scraped.
 """
 import os
 import sys
-import json
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
@@ -25,12 +24,13 @@ from backend.queries import (  # noqa: E402
     _get_event_types_map,
     _regional_events_for_gender,
     get_state_standard_display,
-    meets_state_standard,
+    meets_state_standard_many,
 )
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
 
 
-OUTPUT_DIR = os.path.join(WEB_DIR, 'frontend', 'static', 'data', 'regional_predictions')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Relative to the artifact data root (see backend/artifact_store.py).
+OUTPUT_DIR = 'regional_predictions'
 
 YEARS = [2026]
 GENDERS = ["Boys", "Girls"]
@@ -102,9 +102,11 @@ def build_payload(gender: str, year: int) -> dict:
         is_relay = "Relay" in event_name
 
         rows = _fetch_regional_event_rows(event_name, gender, year)
+        met_flags = meets_state_standard_many(
+            [row.result2 for row in rows], gender, event_name, event_type, year=year
+        ).tolist()
         formatted = []
-        for row in rows:
-            met_standard = meets_state_standard(row.result2, gender, event_name, event_type, year=year)
+        for row, met_standard in zip(rows, met_flags):
             if is_relay:
                 formatted.append({
                     "event": event_name,
@@ -160,17 +162,16 @@ def build_payload(gender: str, year: int) -> dict:
 
 def main():
     app = create_app()
-    with app.app_context():
+    with app.app_context(), publish_artifacts() as version:
         for year in YEARS:
             for gender in GENDERS:
                 print(f"Computing combined regional results for {year} {gender}...")
                 payload = build_payload(gender, year)
-                out_path = os.path.join(
+                out_path = version.artifact_path(os.path.join(
                     OUTPUT_DIR,
                     f"combined_results_{year}_{gender.lower()}.json",
-                )
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2)
+                ))
+                write_json_artifact(out_path, payload)
                 total = sum(len(e['qualifiers']) for e in payload['events'])
                 print(f"  Saved: {out_path}  (events={len(payload['events'])}, rows={total})")
 
@@ -0,0 +1,187 @@
+"""
+Incrementally refresh the qualifier JSON artifacts after a meet loads.
+
+On meet night sectionals are scraped one at a time. Instead of rebuilding
+every regional and state artifact after each scrape, this compares the
+current fingerprint of every sectional and regional meet against the one
+recorded in the shared manifest (``precompute_manifest.py``, also kept by
+``precompute.py``) and follows the dependency chain
+(sectional -> regional -> state, see ``qualifier_dependents``):
+
+  - a changed sectional rebuilds only its regional's qualifier list, that
+    regional's rows in ``combined_rankings_*`` and its entry in
+    ``regional_predictions_*``;
+  - a changed regional rebuilds the state artifacts
+    (``state_qualifiers_*``, ``state_predictions_*``, ``combined_results_*``).
+
+Everything a run rebuilds is published as one new version of the artifact
+store (``backend/artifact_store.py``); readers switch over atomically.
+
+The first run (no manifest yet) and any host registry change rebuild
+everything. Pass ``--sectional`` / ``--regional`` to force specific meets
+regardless of the manifest.
+
+Usage:
+    python precompute_incremental.py                  # latest season loaded
+    python precompute_incremental.py --year 2025
+    python precompute_incremental.py --gender Boys --sectional 5 --sectional 6
+"""
+import argparse
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend import create_app, db  # noqa: E402
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
+from backend.models import Meet  # noqa: E402
+from backend.queries import (  # noqa: E402
+    get_regional_qualifiers,
+    get_state_qualifiers,
+    qualifier_dependents,
+)
+from precompute_combined_rankings import build_combined_payload, update_combined_payload  # noqa: E402
+from precompute_combined_results import build_payload as build_combined_results  # noqa: E402
+from precompute_manifest import (  # noqa: E402
+    artifact_fingerprints,
+    artifact_key,
+    changed_meets,
+    load_manifest,
+    meet_fingerprints,
+    save_manifest,
+    season_key,
+)
+from regional_predictions import get_regional_prediction, get_regional_predictions  # noqa: E402
+from state_predictions import get_state_predictions  # noqa: E402
+
+# Relative to the artifact data root (see backend/artifact_store.py).
+REGIONAL_DIR = 'regional_predictions'
+STATE_DIR = 'state_predictions'
+
+# Artifacts written by refresh_regionals / refresh_state.
+REGIONAL_ARTIFACTS = ("combined_rankings", "regional_predictions")
+STATE_ARTIFACTS = ("state_qualifiers", "state_predictions", "combined_results")
+
+GENDERS = ["Boys", "Girls"]
+
+
+def _load_json(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path, payload):
+    write_json_artifact(path, payload)
+    print(f"  Saved: {path}")
+
+
+def latest_season() -> int:
+    return db.session.query(db.func.max(Meet.year)).scalar()
+
+
+def refresh_regionals(version, gender: str, year: int, regional_nums: list, full: bool) -> None:
+    suffix = f"{year}_{gender.lower()}"
+
+    combined_path = version.artifact_path(os.path.join(REGIONAL_DIR, f"combined_rankings_{suffix}.json"))
+    existing = _load_json(combined_path)
+    if full or existing is None:
+        combined = build_combined_payload(gender, year)
+    else:
+        fresh = {num: get_regional_qualifiers(gender, num, year) for num in regional_nums}
+        combined = update_combined_payload(existing, fresh, gender, year)
+    _write_json(combined_path, combined)
+
+    predictions_path = version.artifact_path(os.path.join(REGIONAL_DIR, f"regional_predictions_{suffix}.json"))
+    existing = _load_json(predictions_path)
+    if full or existing is None:
+        predictions = get_regional_predictions(year, gender, top_n=None)
+    else:
+        by_regional = {entry["regional_num"]: entry for entry in existing}
+        for regional_num in regional_nums:
+            entry = get_regional_prediction(year, gender, regional_num)
+            if entry is None:
+                by_regional.pop(regional_num, None)
+            else:
+                by_regional[regional_num] = entry
+        predictions = [by_regional[num] for num in sorted(by_regional)]
+    _write_json(predictions_path, predictions)
+
+
+def refresh_state(version, gender: str, year: int) -> None:
+    suffix = f"{year}_{gender.lower()}"
+    for directory, filename, payload in (
+        (STATE_DIR, f"state_qualifiers_{suffix}.json", get_state_qualifiers(gender, year)),
+        (STATE_DIR, f"state_predictions_{suffix}.json", get_state_predictions(year, gender, top_n=None)),
+        (REGIONAL_DIR, f"combined_results_{suffix}.json", build_combined_results(gender, year)),
+    ):
+        _write_json(version.artifact_path(os.path.join(directory, filename)), payload)
+
+
+def main(years=None, genders=GENDERS, sectionals=None, regionals=None, app=None):
+    app = app or create_app()
+    manifest = load_manifest()
+
+    with app.app_context():
+        years = years or [latest_season()]
+        plan = []
+        for year in years:
+            for gender in genders:
+                key = season_key(gender, year)
+                previous = manifest["meets"].get(key)
+                current = meet_fingerprints(gender, year)
+
+                changed_sectionals = sorted(set(changed_meets(previous, current, "Sectional")) | set(sectionals or []))
+                changed_regionals = sorted(set(changed_meets(previous, current, "Regional")) | set(regionals or []))
+                regional_nums = qualifier_dependents("Sectional", changed_sectionals)["regionals"]
+                rebuild_state = qualifier_dependents("Regional", changed_regionals)["state"]
+                # Hosts show up in every artifact.
+                full = previous is None or previous.get("hosts") != current["hosts"]
+
+                print(
+                    f"{year} {gender}: sectionals changed={changed_sectionals} -> regionals {regional_nums}; "
+                    f"regionals changed={changed_regionals} -> state {'yes' if rebuild_state or full else 'no'}"
+                )
+                if regional_nums or rebuild_state or full:
+                    plan.append((year, gender, regional_nums, rebuild_state, full, previous, current))
+                manifest["meets"][key] = current
+
+        # One published version per run, and none at all when nothing changed.
+        if plan:
+            with publish_artifacts() as version:
+                for year, gender, regional_nums, rebuild_state, full, _previous, _current in plan:
+                    if regional_nums or full:
+                        refresh_regionals(version, gender, year, regional_nums, full)
+                    if rebuild_state or full:
+                        refresh_state(version, gender, year)
+
+    for year, gender, regional_nums, rebuild_state, full, previous, current in plan:
+        before = artifact_fingerprints(previous) if previous else {}
+        after = artifact_fingerprints(current)
+        rebuilt = (REGIONAL_ARTIFACTS if regional_nums or full else ()) + (STATE_ARTIFACTS if rebuild_state or full else ())
+        for name in rebuilt:
+            key = artifact_key(name, gender, year)
+            # A partial refresh is only as fresh as the file it patched.
+            if full or name in STATE_ARTIFACTS or manifest["artifacts"].get(key) == before.get(name):
+                manifest["artifacts"][key] = after[name]
+    save_manifest(manifest)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--gender", choices=GENDERS, action="append", help="limit to one gender (repeatable)")
+    parser.add_argument("--year", type=int, action="append", help="season year (repeatable; default latest)")
+    parser.add_argument("--sectional", type=int, action="append", help="force a sectional as changed")
+    parser.add_argument("--regional", type=int, action="append", help="force a regional as changed")
+    args = parser.parse_args()
+    main(
+        years=args.year,
+        genders=args.gender or GENDERS,
+        sectionals=args.sectional,
+        regionals=args.regional,
+    )
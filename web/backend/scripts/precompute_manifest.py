@@ -0,0 +1,109 @@
+"""
+Staleness manifest shared by precompute.py and precompute_incremental.py.
+
+One JSON file records, per season and gender, the content hash of every
+sectional and regional meet plus the host registry as of the last build,
+and per artifact the fingerprint it was last built from. Both scripts read
+and update the same file, so a full rebuild leaves nothing for the
+incremental run to redo and vice versa:
+
+    {"meets": {"2026_Boys": {"Sectional": {num: hash}, "Regional": {num: hash}, "hosts": hash}},
+     "artifacts": {"state_qualifiers:2026:Boys": hash}}
+"""
+import hashlib
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.queries import (  # noqa: E402
+    REGIONAL_SECTIONAL_GROUPS,
+    SECTIONAL_TO_REGIONAL,
+    _feeder_meet_signatures,
+    _host_registry_signature,
+)
+
+MANIFEST_PATH = os.path.join(WEB_DIR, 'data', 'precompute_manifest.json')
+
+# Bump to force every artifact to rebuild after a change to the build code.
+FINGERPRINT_VERSION = 3
+
+# Artifact name -> meet types its builder reads. Every artifact also shows
+# hosts, and none reads another artifact's output.
+ARTIFACT_INPUTS = {
+    "regional_predictions": ("Sectional",),
+    "combined_rankings": ("Sectional",),
+    "combined_results": ("Regional",),
+    "state_qualifiers": ("Regional",),
+    "state_predictions": ("Regional",),
+}
+
+
+def _sha1(value) -> str:
+    return hashlib.sha1(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def season_key(gender: str, year: int) -> str:
+    return f"{year}_{gender}"
+
+
+def artifact_key(name: str, gender: str, year: int) -> str:
+    return f"{name}:{year}:{gender}"
+
+
+def meet_fingerprints(gender: str, year: int) -> dict:
+    """
+    ``{"Sectional": {num: hash}, "Regional": {num: hash}, "hosts": hash}``
+    for the loaded meets and the host registry. Runs inside an app context.
+    """
+    fingerprints = {}
+    for meet_type, meet_nums in (
+        ("Sectional", tuple(sorted(SECTIONAL_TO_REGIONAL))),
+        ("Regional", tuple(sorted(REGIONAL_SECTIONAL_GROUPS))),
+    ):
+        signatures = _feeder_meet_signatures(gender, year, meet_nums, source_meet_type=meet_type)
+        fingerprints[meet_type] = {
+            str(meet_num): _sha1(signature) for meet_num, signature in signatures.items()
+        }
+    fingerprints["hosts"] = _sha1(_host_registry_signature(year, gender))
+    return fingerprints
+
+
+def changed_meets(previous: dict, current: dict, meet_type: str) -> list:
+    before = (previous or {}).get(meet_type, {})
+    after = current.get(meet_type, {})
+    return sorted(int(num) for num in set(before) | set(after) if before.get(num) != after.get(num))
+
+
+def artifact_fingerprints(meets: dict) -> dict:
+    """``{name: fingerprint}`` for every artifact, from ``meet_fingerprints`` output."""
+    return {
+        name: _sha1([
+            FINGERPRINT_VERSION,
+            name,
+            [_sha1(meets.get(meet_type, {})) for meet_type in inputs],
+            meets.get("hosts"),
+        ])
+        for name, inputs in ARTIFACT_INPUTS.items()
+    }
+
+
+def load_manifest() -> dict:
+    """The manifest, or an empty one when missing or in an older layout."""
+    data = {}
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    return {"meets": data.get("meets", {}), "artifacts": data.get("artifacts", {})}
+
+
+def save_manifest(manifest: dict) -> None:
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    tmp_path = f"{MANIFEST_PATH}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_PATH)
@@ -0,0 +1,50 @@
+"""
+Precompute and save statewide school power rankings as JSON.
+
+Writes school_rankings_{scope}_{gender}.json for the all-seasons scope and
+every season year, so /api/schools/rankings can answer without scanning the
+results tables. Each file records the ``qualifier_data_version()`` it was
+built from; the API only serves a file whose version is still current and
+otherwise computes the rankings live. Run this after sectional/regional/state
+results are updated.
+"""
+import os
+import sys
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend import create_app  # noqa: E402
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
+from backend.queries import qualifier_data_version  # noqa: E402
+from school_rankings import compute_school_rankings, get_available_ranking_years  # noqa: E402
+
+# Relative to the artifact data root (see backend/artifact_store.py).
+OUTPUT_DIR = 'school_rankings'
+
+GENDERS = ["Boys", "Girls"]
+
+
+def main():
+    app = create_app()
+    with app.app_context(), publish_artifacts() as version:
+        data_version = qualifier_data_version()
+        scopes = [None] + get_available_ranking_years()
+        for year in scopes:
+            scope = "all" if year is None else str(year)
+            print(f"Computing school power rankings for {scope}...")
+            rankings = compute_school_rankings(year=year)
+            for gender in GENDERS:
+                payload = {
+                    "context": {"gender": gender, "year": year},
+                    "data_version": data_version,
+                    "rows": rankings.get(gender, []),
+                }
+                out_path = version.artifact_path(os.path.join(OUTPUT_DIR, f"school_rankings_{scope}_{gender.lower()}.json"))
+                write_json_artifact(out_path, payload)
+                print(f"Saved: {out_path}  (schools={len(payload['rows'])})")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,20 +3,26 @@ Precompute and save state predictions for all years/genders as JSON.
 Run this after regional results are updated.
 """
 import os
-import json
+import sys
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
 from state_predictions import get_state_predictions
 
-OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '../../frontend/static/data/state_predictions')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Relative to the artifact data root (see backend/artifact_store.py).
+OUTPUT_DIR = 'state_predictions'
 
 YEARS = [2026]  # Add more years as needed
 GENDERS = ["Boys", "Girls"]
 
-for year in YEARS:
-    for gender in GENDERS:
-        print(f"Computing state predictions for {year} {gender}...")
-        preds = get_state_predictions(year, gender, top_n=None)
-        out_path = os.path.join(OUTPUT_DIR, f"state_predictions_{year}_{gender.lower()}.json")
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(preds, f, indent=2)
-        print(f"Saved: {out_path}  (ready={preds['ready']}, regionals_loaded={preds['regionals_loaded']})")
+with publish_artifacts() as version:
+    for year in YEARS:
+        for gender in GENDERS:
+            print(f"Computing state predictions for {year} {gender}...")
+            preds = get_state_predictions(year, gender, top_n=None)
+            out_path = version.artifact_path(os.path.join(OUTPUT_DIR, f"state_predictions_{year}_{gender.lower()}.json"))
+            write_json_artifact(out_path, preds)
+            print(f"Saved: {out_path}  (ready={preds['ready']}, regionals_loaded={preds['regionals_loaded']})")
@@ -8,7 +8,6 @@ Run after Regional meets are scraped.
 """
 import os
 import sys
-import json
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
@@ -17,26 +16,26 @@ if WEB_DIR not in sys.path:
 
 from backend import create_app, db  # noqa: E402
 from backend.queries import get_state_qualifiers  # noqa: E402
+from backend.artifact_store import publish_artifacts, write_json_artifact  # noqa: E402
 
-OUTPUT_DIR = os.path.join(WEB_DIR, 'frontend', 'static', 'data', 'state_predictions')
-os.makedirs(OUTPUT_DIR, exist_ok=True)
+# Relative to the artifact data root (see backend/artifact_store.py).
+OUTPUT_DIR = 'state_predictions'
 
 YEARS = [2026]
 GENDERS = ["Boys", "Girls"]
 
 def main():
     app = create_app()
-    with app.app_context():
+    with app.app_context(), publish_artifacts() as version:
         for year in YEARS:
             for gender in GENDERS:
                 print(f"Computing unofficial state qualifiers for {year} {gender}...")
                 payload = get_state_qualifiers(gender, year)
-                out_path = os.path.join(
+                out_path = version.artifact_path(os.path.join(
                     OUTPUT_DIR,
                     f"state_qualifiers_{year}_{gender.lower()}.json",
-                )
-                with open(out_path, "w", encoding="utf-8") as f:
-                    json.dump(payload, f, indent=2)
+                ))
+                write_json_artifact(out_path, payload)
                 total = sum(len(e['qualifiers']) for e in payload['events'])
                 print(f"  Saved: {out_path}  (events={len(payload['events'])}, rows={total})")
 
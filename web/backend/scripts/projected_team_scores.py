@@ -3,33 +3,11 @@ import pandas as pd
 
 from util.db_util import Database
 from util.const_util import CONST
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, TIE_AVERAGE, score_meet
 
 
 NOT_READY_MESSAGE = "Projected scores for the selected filters is not ready yet. Please check back later."
 
-REGIONAL_POINTS = {
-    1: 10,
-    2: 8,
-    3: 6,
-    4: 5,
-    5: 4,
-    6: 3,
-    7: 2,
-    8: 1,
-}
-
-STATE_POINTS = {
-    1: 10,
-    2: 8,
-    3: 7,
-    4: 6,
-    5: 5,
-    6: 4,
-    7: 3,
-    8: 2,
-    9: 1,
-}
-
 
 def get_available_projected_score_seasons(start_year=2023):
     current_year = datetime.now().year
@@ -53,39 +31,6 @@ def _get_feeder_meets_for_projection(meet_type, meet_num):
     return None
 
 
-def _is_track_like_event(event_name):
-    return event_name[0].isdigit()
-
-
-def _average_points_for_tie(start_place, tie_count, points_by_place):
-    total_points = 0
-    for offset in range(tie_count):
-        total_points += points_by_place.get(start_place + offset, 0)
-    return total_points / tie_count
-
-
-def _score_event(event_df, points_by_place, ascending):
-    scores = {}
-
-    sorted_event_df = event_df.sort_values(by="result2", ascending=ascending).copy()
-    sorted_event_df["place"] = sorted_event_df["result2"].rank(method="min", ascending=ascending).astype(int)
-    place_counts = sorted_event_df["place"].value_counts()
-
-    for _, row in sorted_event_df.iterrows():
-        school_id = int(row["school_id"])
-        place = int(row["place"])
-        tie_count = int(place_counts[place])
-        points = _average_points_for_tie(place, tie_count, points_by_place)
-        scores[school_id] = scores.get(school_id, 0) + points
-
-    return scores
-
-
-def _merge_scores(total_scores, partial_scores):
-    for school_id, score in partial_scores.items():
-        total_scores[school_id] = total_scores.get(school_id, 0) + score
-
-
 def _build_scores_dataframe(scores, db):
     if not scores:
         return _not_ready_df()
@@ -96,7 +41,8 @@ def _build_scores_dataframe(scores, db):
     if df.empty:
         return _not_ready_df()
     df["Place"] = df["Score"].rank(method="min", ascending=False).astype(int)
-    df["Team"] = df["school_id"].apply(db.get_school_name)
+    school_names = db.get_school_names(df["school_id"])
+    df["Team"] = df["school_id"].map(school_names)
     df["Score"] = df["Score"].round(2)
 
     result = df[["Place", "Team", "Score"]].sort_values(by=["Place", "Team"]).reset_index(drop=True)
@@ -134,53 +80,21 @@ def get_projected_team_scores(meet_type, year, gender, meet_num=None):
     points_by_place = REGIONAL_POINTS if meet_type == CONST.MEET_TYPE.REGIONAL else STATE_POINTS
 
     db = Database(CONST.DB_PATH)
-    individual_results = db.get_all_athlete_results()
-    relay_results = db.get_all_relay_results()
-
-    individual_filtered = individual_results[
-        (individual_results["meet_type"] == feeder_meet_type) &
-        (individual_results["meet_num"].isin(feeder_meet_nums)) &
-        (individual_results["year"] == year) &
-        (individual_results["gender"] == gender) &
-        (individual_results["result_type"] == CONST.RESULT_TYPE.FINAL) &
-        (individual_results["result2"] != 0) &
-        (individual_results["result2"] != 9999)
-    ]
-
-    relay_filtered = relay_results[
-        (relay_results["meet_type"] == feeder_meet_type) &
-        (relay_results["meet_num"].isin(feeder_meet_nums)) &
-        (relay_results["year"] == year) &
-        (relay_results["gender"] == gender) &
-        (relay_results["result2"] != 0) &
-        (relay_results["result2"] != 9999)
-    ]
+    individual_filtered = db.get_feeder_athlete_marks(
+        feeder_meet_type, feeder_meet_nums, year, gender, CONST.RESULT_TYPE.FINAL,
+    )
+    relay_filtered = db.get_feeder_relay_marks(feeder_meet_type, feeder_meet_nums, year, gender)
 
     if individual_filtered.empty and relay_filtered.empty:
         return _not_ready_df()
 
-    scores = {}
-
-    for event in individual_filtered["event"].dropna().unique():
-        event_df = individual_filtered[individual_filtered["event"] == event][["school_id", "result2"]]
-        if event_df.empty:
-            continue
-        partial_scores = _score_event(
-            event_df,
-            points_by_place=points_by_place,
-            ascending=_is_track_like_event(event),
-        )
-        _merge_scores(scores, partial_scores)
-
-    for event in relay_filtered["event"].dropna().unique():
-        event_df = relay_filtered[relay_filtered["event"] == event][["school_id", "result2"]]
-        if event_df.empty:
-            continue
-        partial_scores = _score_event(
-            event_df,
-            points_by_place=points_by_place,
-            ascending=_is_track_like_event(event),
-        )
-        _merge_scores(scores, partial_scores)
+    rows = pd.concat([individual_filtered, relay_filtered]).dropna(subset=["event"])
+    scores = score_meet(
+        rows["event"].to_numpy(),
+        rows["school_id"].to_numpy(),
+        rows["result2"].to_numpy(),
+        points_by_place,
+        tie_policy=TIE_AVERAGE,
+    )
 
     return _build_scores_dataframe(scores, db)
@@ -0,0 +1,87 @@
+"""
+Refresh the sectional/regional host registry from the IHSAA tournament pages.
+
+Scrapes the sectional and regional rounds for each year/gender and stores the
+hosts in the tournament_host table. API requests only read that table, so run
+this whenever IHSAA publishes or changes tournament sites (once a season is
+usually enough):
+
+    python refresh_tournament_hosts.py 2026
+
+A fetch that fails or parses to nothing leaves the existing rows for that
+year/gender/round untouched. Stored hosts bump the ingest counter, so cached
+qualifier payloads and status pick them up on the next request.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend import create_app, db  # noqa: E402
+from backend.models import TournamentHost  # noqa: E402
+from backend.queries import bump_ingest_counter  # noqa: E402
+from backend.util.ihsaa_hosts import (  # noqa: E402
+    IHSAA_BASE_URL,
+    PARSERS,
+    fetch_tournament_html,
+    tournament_url,
+)
+
+GENDERS = ["Boys", "Girls"]
+MEET_TYPES = ["Sectional", "Regional"]
+
+
+def refresh_hosts(year: int, gender: str, meet_type: str, base_url: str = IHSAA_BASE_URL) -> int:
+    """Scrape one round and replace its registry rows. Returns the number of hosts stored."""
+    url = tournament_url(year, gender, meet_type, base_url)
+    try:
+        html = fetch_tournament_html(year, gender, meet_type, base_url)
+    except Exception as exc:
+        print(f"  WARN {year} {gender} {meet_type}: fetch failed ({exc}); keeping existing hosts")
+        return 0
+
+    hosts = PARSERS[meet_type](html)
+    if not hosts:
+        print(f"  WARN {year} {gender} {meet_type}: no hosts found at {url}; keeping existing hosts")
+        return 0
+
+    refreshed_at = datetime.utcnow()
+    db.session.query(TournamentHost).filter_by(year=year, gender=gender, meet_type=meet_type).delete()
+    for meet_num, host in sorted(hosts.items()):
+        db.session.add(
+            TournamentHost(
+                year=year,
+                gender=gender,
+                meet_type=meet_type,
+                meet_num=meet_num,
+                host=host,
+                source_url=url,
+                refreshed_at=refreshed_at,
+            )
+        )
+    bump_ingest_counter()
+    db.session.commit()
+    return len(hosts)
+
+
+def main(years, base_url: str = IHSAA_BASE_URL, app=None):
+    app = app or create_app()
+    with app.app_context():
+        for year in years:
+            for gender in GENDERS:
+                for meet_type in MEET_TYPES:
+                    count = refresh_hosts(year, gender, meet_type, base_url)
+                    if count:
+                        print(f"  {year} {gender} {meet_type}: {count} hosts")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("years", type=int, nargs="+", help="championship season(s) to refresh, e.g. 2026")
+    args = parser.parse_args()
+    main(years=args.years)
@@ -7,49 +7,26 @@ from the four sectionals that feed each regional.
 This mirrors the scoring logic in ``projected_team_scores.py`` but reads
 directly from Track.db without joining on ``school_enrollment``, so it
 produces predictions even before the current-year enrollment rows have
-been loaded.
+been loaded. Ties on a mark are broken alphabetically by school name
+(``meet_scoring.TIE_SEQUENTIAL``).
 """
 
 import os
 import sqlite3
+import threading
 from collections import defaultdict
 
+from meet_scoring import REGIONAL_POINTS, TIE_SEQUENTIAL, rank_teams, score_meet
+from util.db_util import data_version
 
-REGIONAL_POINTS = {1: 10, 2: 8, 3: 6, 4: 5, 5: 4, 6: 3, 7: 2, 8: 1}
 
 _BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DB_PATH = os.path.join(_BASE_DIR, "data", "Track.db")
+NUM_REGIONALS = 8
 
-
-def _is_track_like_event(event_name):
-    return bool(event_name) and event_name[0].isdigit()
-
-
-def _score_event(rows, ascending):
-    """
-    rows is a list of (school_id, school_name, result2). Returns {school_id: points}.
-
-    Ties on the mark are broken alphabetically by school name and assigned
-    sequential places — matching how meets actually score (no half-points
-    awarded for tied marks; a real meet uses jump-off / countback, but we
-    don't have that data, so alphabetical is a stable deterministic stand-in).
-    """
-    cleaned = [
-        (sid, name or "", r)
-        for sid, name, r in rows
-        if r is not None and r not in (0, 9999)
-    ]
-    if not cleaned:
-        return {}
-    # Primary: result2 (best first), secondary: school name (alphabetical).
-    cleaned.sort(key=lambda x: (x[2] if ascending else -x[2], x[1]))
-
-    scores = defaultdict(float)
-    for place, (sid, _name, _value) in enumerate(cleaned, start=1):
-        pts = REGIONAL_POINTS.get(place, 0)
-        if pts:
-            scores[sid] += pts
-    return scores
+# Per-process projections of every regional: {(db_path, year, gender): (data version, season)}.
+_season_cache = {}
+_season_cache_lock = threading.Lock()
 
 
 def _feeder_sectional_nums(regional_num):
@@ -57,47 +34,57 @@ def _feeder_sectional_nums(regional_num):
     return list(range(start, start + 4))
 
 
-def _fetch_individual_rows(conn, year, gender, sectional_nums):
-    placeholders = ",".join("?" * len(sectional_nums))
-    sql = f"""
-        SELECT ar.event, s.school_id, s.school_name, ar.result2
+def _fetch_sectional_rows(conn, year, gender):
+    """
+    Every sectional result for a season in two queries.
+
+    Returns ``(present, individual, relays)``: the sectional numbers with at
+    least one athlete result, and the scoring rows ``(meet_num, event,
+    school_id, school_name, result2)`` for individual finals and relays.
+    """
+    present = set()
+    individual = []
+    for meet_num, event, school_id, school_name, result_type, result2 in conn.execute(
+        """
+        SELECT m.meet_num, ar.event, s.school_id, s.school_name, ar.result_type, ar.result2
         FROM athlete_result ar
-        JOIN athlete a ON ar.athlete_id = a.athlete_id
-        JOIN school s ON a.school_id = s.school_id
         JOIN meet m ON ar.meet_id = m.meet_id
+        LEFT JOIN athlete a ON ar.athlete_id = a.athlete_id
+        LEFT JOIN school s ON a.school_id = s.school_id
         WHERE m.year = ?
           AND m.gender = ?
           AND m.meet_type = 'Sectional'
-          AND m.meet_num IN ({placeholders})
-          AND ar.result_type = 'Final'
-          AND ar.result2 IS NOT NULL
-          AND ar.result2 NOT IN (0, 9999)
-    """
-    return conn.execute(sql, (year, gender, *sectional_nums)).fetchall()
-
-
-def _fetch_relay_rows(conn, year, gender, sectional_nums):
-    placeholders = ",".join("?" * len(sectional_nums))
-    sql = f"""
-        SELECT rr.event, s.school_id, s.school_name, rr.result2
+        """,
+        (year, gender),
+    ):
+        present.add(meet_num)
+        if (
+            school_id is not None
+            and result_type == "Final"
+            and result2 is not None
+            and result2 not in (0, 9999)
+        ):
+            individual.append((meet_num, event, school_id, school_name, result2))
+
+    relays = conn.execute(
+        """
+        SELECT m.meet_num, rr.event, s.school_id, s.school_name, rr.result2
         FROM relay_result rr
         JOIN school s ON rr.school_id = s.school_id
         JOIN meet m ON rr.meet_id = m.meet_id
         WHERE m.year = ?
           AND m.gender = ?
           AND m.meet_type = 'Sectional'
-          AND m.meet_num IN ({placeholders})
           AND rr.result2 IS NOT NULL
           AND rr.result2 NOT IN (0, 9999)
-    """
-    return conn.execute(sql, (year, gender, *sectional_nums)).fetchall()
-
+        """,
+        (year, gender),
+    ).fetchall()
+    return present, individual, relays
 
-def _project_regional(conn, year, gender, regional_num):
-    sectional_nums = _feeder_sectional_nums(regional_num)
-    individual = _fetch_individual_rows(conn, year, gender, sectional_nums)
-    relays = _fetch_relay_rows(conn, year, gender, sectional_nums)
 
+def _project_regional(individual, relays):
+    """Ranked ``{place, team, score}`` rows from one regional's feeder rows ``(event, school_id, school_name, result2)``."""
     if not individual and not relays:
         return []
 
@@ -105,36 +92,55 @@ def _project_regional(conn, year, gender, regional_num):
     for row in relays:
         school_names.setdefault(row[1], row[2])
 
-    by_event = defaultdict(list)
-    for event, sid, name, result2 in individual:
-        by_event[event].append((sid, name, result2))
-    for event, sid, name, result2 in relays:
-        by_event[event].append((sid, name, result2))
-
-    totals = defaultdict(float)
-    for event, rows in by_event.items():
-        event_scores = _score_event(rows, ascending=_is_track_like_event(event))
-        for sid, pts in event_scores.items():
-            totals[sid] += pts
-
-    ranked = sorted(
-        ((sid, round(pts, 2)) for sid, pts in totals.items() if pts > 0),
-        key=lambda x: (-x[1], school_names.get(x[0], "")),
-    )
-
-    output = []
-    last_score = None
-    last_place = 0
-    for idx, (sid, score) in enumerate(ranked, start=1):
-        if score != last_score:
-            last_place = idx
-            last_score = score
-        output.append({
-            "place": last_place,
-            "team": school_names.get(sid, f"School #{sid}"),
-            "score": score,
-        })
-    return output
+    events, school_ids, names, marks = zip(*(individual + relays))
+    totals = score_meet(events, school_ids, marks, REGIONAL_POINTS, tie_policy=TIE_SEQUENTIAL, names=names)
+
+    return rank_teams(totals, school_names)
+
+
+def _project_season(conn, year, gender):
+    """
+    ``{regional_num: rows}`` for every regional, from one load of all 32
+    sectionals. A regional maps to None while any of its feeders is missing;
+    the dict is empty when the season has no sectional results at all.
+    """
+    present, individual, relays = _fetch_sectional_rows(conn, year, gender)
+    if not present:
+        return {}
+
+    individual_by_meet = defaultdict(list)
+    for meet_num, *row in individual:
+        individual_by_meet[meet_num].append(tuple(row))
+    relays_by_meet = defaultdict(list)
+    for meet_num, *row in relays:
+        relays_by_meet[meet_num].append(tuple(row))
+
+    season = {}
+    for regional_num in range(1, NUM_REGIONALS + 1):
+        feeder_nums = _feeder_sectional_nums(regional_num)
+        if not present.issuperset(feeder_nums):
+            season[regional_num] = None
+            continue
+        season[regional_num] = _project_regional(
+            [row for num in feeder_nums for row in individual_by_meet[num]],
+            [row for num in feeder_nums for row in relays_by_meet[num]],
+        )
+    return season
+
+
+def _season_projection(conn, db_path, year, gender):
+    """``_project_season`` cached per process until the database's data version changes."""
+    key = (os.path.abspath(db_path), year, gender)
+    version = data_version(conn.cursor())
+    cached = _season_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _season_cache_lock:
+        cached = _season_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, _project_season(conn, year, gender))
+            _season_cache[key] = cached
+    return cached[1]
 
 
 def has_sectional_data(conn, year, gender):
@@ -149,6 +155,19 @@ def has_sectional_data(conn, year, gender):
     return bool(row and row[0])
 
 
+def _regional_entry(season, regional_num, top_n=None, hosts=None):
+    rows = season.get(regional_num)
+    if rows is None:
+        # Skip this regional if any feeder is missing
+        return None
+    rows = [dict(row) for row in (rows if top_n is None else rows[:top_n])]
+    return {
+        "regional_num": regional_num,
+        "host": (hosts or {}).get(regional_num),
+        "rows": rows,
+    }
+
+
 def get_regional_predictions(year, gender, top_n=10, hosts=None, db_path=None):
     """
     Compute projected regional team scores for all 8 regionals.
@@ -164,34 +183,35 @@ def get_regional_predictions(year, gender, top_n=10, hosts=None, db_path=None):
         [{"regional_num": 1, "host": "...", "rows": [...]}, ...]
     where ``rows`` is a list of ``{place, team, score}``.
     Returns an empty list if no sectional data exists for the year/gender.
+
+    All 32 sectionals are loaded in two queries and every regional is
+    projected at once; the projections are reused until the database's data
+    version changes, so repeat calls cost one version check.
+    """
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path)
+    try:
+        season = _season_projection(conn, db_path, year, gender)
+    finally:
+        conn.close()
+    results = []
+    for regional_num in sorted(season):
+        entry = _regional_entry(season, regional_num, top_n=top_n, hosts=hosts)
+        if entry is not None:
+            results.append(entry)
+    return results
+
+
+def get_regional_prediction(year, gender, regional_num, top_n=None, hosts=None, db_path=None):
+    """
+    Projected team scores for a single regional, in the same shape as one
+    entry of ``get_regional_predictions``. Returns None while any of its
+    feeder sectionals is missing.
     """
-    hosts = hosts or {}
-    conn = sqlite3.connect(db_path or DB_PATH)
+    db_path = db_path or DB_PATH
+    conn = sqlite3.connect(db_path)
     try:
-        if not has_sectional_data(conn, year, gender):
-            return []
-        results = []
-        for regional_num in range(1, 9):
-            feeder_nums = _feeder_sectional_nums(regional_num)
-            # Check if all four feeder sectionals have at least one result
-            placeholders = ",".join(["?"] * len(feeder_nums))
-            sql = f"""
-                SELECT DISTINCT m.meet_num FROM athlete_result ar
-                JOIN meet m ON ar.meet_id = m.meet_id
-                WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional' AND m.meet_num IN ({placeholders})
-            """
-            present = set(row[0] for row in conn.execute(sql, (year, gender, *feeder_nums)).fetchall())
-            if len(present) < 4:
-                # Skip this regional if any feeder is missing
-                continue
-            rows = _project_regional(conn, year, gender, regional_num)
-            if top_n is not None:
-                rows = rows[:top_n]
-            results.append({
-                "regional_num": regional_num,
-                "host": hosts.get(regional_num),
-                "rows": rows,
-            })
-        return results
+        season = _season_projection(conn, db_path, year, gender)
     finally:
         conn.close()
+    return _regional_entry(season, regional_num, top_n=top_n, hosts=hosts)
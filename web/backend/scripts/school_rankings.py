@@ -0,0 +1,242 @@
+"""
+School Power Rankings
+
+Ranks every school in the state at once by comparing each school's best
+mark per event against the statewide pool of season-best marks.
+
+The per-event percentile uses the same definition as the school dashboard
+(``_compute_school_percentiles`` in ``backend/queries.py``): the share of
+statewide athletes (or relay teams) that the school's best mark beats,
+capped at 99.9. All schools are scored in one vectorized pass over the
+season-best data instead of scanning the state once per school.
+
+The aggregate strength score is the mean of a school's event percentiles
+over every event contested by that gender, so an event without a mark
+counts as 0 and depth across the full event list is rewarded.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.queries import MIN_RECORDS_YEAR  # noqa: E402
+from util.db_util import data_version  # noqa: E402
+
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DB_PATH = os.path.join(_BASE_DIR, "data", "Track.db")
+
+# Per-process live rankings: {(db_path, year): (data version, rankings)}.
+_rankings_cache = {}
+_rankings_cache_lock = threading.Lock()
+
+
+def _fetch_individual_rows(conn, year=None):
+    sql = """
+        SELECT ar.athlete_id, ar.meet_id, ar.event, ar.result_type, ar.result2,
+               a.school_id, a.gender, e.event_type, m.year
+        FROM athlete_result ar
+        JOIN athlete a ON ar.athlete_id = a.athlete_id
+        JOIN meet m ON ar.meet_id = m.meet_id
+        JOIN event e ON ar.event = e.event
+        WHERE ar.result2 IS NOT NULL
+          AND e.event_type != 'Relay'
+          AND m.year >= ?
+    """
+    params = [MIN_RECORDS_YEAR]
+    if year is not None:
+        sql += " AND m.year = ?"
+        params.append(year)
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def _fetch_relay_rows(conn, year=None):
+    sql = """
+        SELECT rr.school_id, rr.event, rr.result2, m.gender, m.year
+        FROM relay_result rr
+        JOIN meet m ON rr.meet_id = m.meet_id
+        WHERE rr.result2 IS NOT NULL
+          AND m.year >= ?
+    """
+    params = [MIN_RECORDS_YEAR]
+    if year is not None:
+        sql += " AND m.year = ?"
+        params.append(year)
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def _individual_bests(df):
+    """
+    Collapse individual rows to one best mark per (gender, event, athlete).
+
+    Per meet the Final is preferred over the Prelim; the athlete's best is
+    then taken across meets (and seasons, when more than one is loaded).
+    Marks are returned as ``score`` where lower is always better (field
+    marks are negated) so one ``min`` serves every event.
+    """
+    if df.empty:
+        return pd.DataFrame(columns=["gender", "event", "athlete_id", "school_id", "score"])
+
+    df = df.assign(
+        score=np.where(df["event_type"] == "Field", -df["result2"], df["result2"]),
+        type_rank=np.where(df["result_type"] == "Final", 0, np.where(df["result_type"] == "Prelim", 1, 2)),
+    )
+    per_meet = (
+        df.sort_values("type_rank", kind="stable")
+        .drop_duplicates(["athlete_id", "event", "meet_id"])
+    )
+    return (
+        per_meet.groupby(["gender", "event", "athlete_id"], as_index=False)
+        .agg(score=("score", "min"), school_id=("school_id", "first"))
+    )
+
+
+def _relay_bests(df):
+    """One best relay mark per (gender, event, school)."""
+    if df.empty:
+        return pd.DataFrame(columns=["gender", "event", "school_id", "score"])
+    return (
+        df.groupby(["gender", "event", "school_id"], as_index=False)
+        .agg(score=("result2", "min"))
+    )
+
+
+def _school_event_percentiles(pool, school_bests):
+    """
+    Percentile of each school's best mark within the statewide pool.
+
+    ``pool`` has one row per competitor (gender, event, score) and
+    ``school_bests`` one row per (gender, event, school_id, score). The
+    count of pool marks at least as good as the school's mark comes from a
+    searchsorted against each event's sorted pool.
+    """
+    if school_bests.empty:
+        return school_bests.assign(state_percentile=pd.Series(dtype=float), total_marks=pd.Series(dtype=int))
+
+    school_bests = school_bests.sort_values(["gender", "event"]).reset_index(drop=True)
+    rank = np.zeros(len(school_bests), dtype=np.int64)
+    total = np.zeros(len(school_bests), dtype=np.int64)
+
+    pool_groups = {key: np.sort(group.to_numpy()) for key, group in pool.groupby(["gender", "event"])["score"]}
+    for key, index in school_bests.groupby(["gender", "event"]).indices.items():
+        marks = pool_groups.get(key)
+        if marks is None or not len(marks):
+            continue
+        rank[index] = np.searchsorted(marks, school_bests["score"].to_numpy()[index], side="right")
+        total[index] = len(marks)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percentile = np.round((1 - rank / total) * 100, 1)
+    percentile = np.clip(np.nan_to_num(percentile, nan=0.0), 0, 99.9)
+
+    return school_bests.assign(state_percentile=percentile, rank=rank, total_marks=total)
+
+
+def compute_school_rankings(year=None, db_path=None):
+    """
+    Compute power rankings for every school and gender in one pass.
+
+    Args:
+        year: season year, or None for all seasons since MIN_RECORDS_YEAR
+            (each athlete's and relay team's best across those seasons).
+        db_path: override path to Track.db.
+
+    Returns a dict keyed by gender:
+        {"Boys": [{rank, school_id, school, strength_score,
+                   events_ranked, events: {event: percentile}}, ...],
+         "Girls": [...]}
+    sorted by strength score, best first.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        individual = _fetch_individual_rows(conn, year)
+        relays = _fetch_relay_rows(conn, year)
+        school_names = dict(conn.execute("SELECT school_id, school_name FROM school").fetchall())
+    finally:
+        conn.close()
+
+    athlete_bests = _individual_bests(individual)
+    indiv_school_bests = (
+        athlete_bests.groupby(["gender", "event", "school_id"], as_index=False)
+        .agg(score=("score", "min"))
+    )
+    relay_bests = _relay_bests(relays)
+
+    scored = pd.concat(
+        [
+            _school_event_percentiles(athlete_bests[["gender", "event", "score"]], indiv_school_bests),
+            _school_event_percentiles(relay_bests[["gender", "event", "score"]], relay_bests),
+        ],
+        ignore_index=True,
+    )
+
+    rankings = {}
+    for gender, gender_rows in scored.groupby("gender"):
+        events_contested = gender_rows["event"].nunique()
+        totals = (
+            gender_rows.groupby("school_id")
+            .agg(percentile_sum=("state_percentile", "sum"), events_ranked=("event", "nunique"))
+            .reset_index()
+        )
+        totals["strength_score"] = (totals["percentile_sum"] / events_contested).round(1)
+        totals["school"] = totals["school_id"].map(lambda sid: school_names.get(sid, f"School #{sid}"))
+        totals = totals.sort_values(["strength_score", "school"], ascending=[False, True]).reset_index(drop=True)
+        totals["rank"] = totals["strength_score"].rank(method="min", ascending=False).astype(int)
+
+        event_map = {
+            sid: dict(zip(group["event"], group["state_percentile"].round(1)))
+            for sid, group in gender_rows.groupby("school_id")
+        }
+        rankings[gender] = [
+            {
+                "rank": int(row.rank),
+                "school_id": int(row.school_id),
+                "school": row.school,
+                "strength_score": float(row.strength_score),
+                "events_ranked": int(row.events_ranked),
+                "events": {event: float(value) for event, value in event_map.get(row.school_id, {}).items()},
+            }
+            for row in totals.itertuples(index=False)
+        ]
+
+    return rankings
+
+
+def get_school_rankings(year=None, db_path=None):
+    """``compute_school_rankings`` cached per process until the database's data version changes."""
+    db_path = db_path or DB_PATH
+    key = (os.path.abspath(db_path), year)
+    conn = sqlite3.connect(db_path)
+    try:
+        version = data_version(conn.cursor())
+    finally:
+        conn.close()
+    cached = _rankings_cache.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    with _rankings_cache_lock:
+        cached = _rankings_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, compute_school_rankings(year=year, db_path=db_path))
+            _rankings_cache[key] = cached
+    return cached[1]
+
+
+def get_available_ranking_years(db_path=None):
+    conn = sqlite3.connect(db_path or DB_PATH)
+    try:
+        rows = conn.execute(
+            "SELECT DISTINCT year FROM meet WHERE year >= ? ORDER BY year DESC",
+            (MIN_RECORDS_YEAR,),
+        ).fetchall()
+    finally:
+        conn.close()
+    return [int(row[0]) for row in rows if row[0] is not None]
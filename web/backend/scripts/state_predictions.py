@@ -11,44 +11,16 @@ year/gender instead of one list per regional.
 
 import os
 import sqlite3
-from collections import defaultdict
+
+from meet_scoring import STATE_POINTS, TIE_SEQUENTIAL, rank_teams, score_meet
 
 
-STATE_POINTS = {1: 10, 2: 8, 3: 7, 4: 6, 5: 5, 6: 4, 7: 3, 8: 2, 9: 1}
 NUM_REGIONALS = 8
 
 _BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 DB_PATH = os.path.join(_BASE_DIR, "data", "Track.db")
 
 
-def _is_track_like_event(event_name):
-    return bool(event_name) and event_name[0].isdigit()
-
-
-def _score_event(rows, ascending):
-    """
-    rows is a list of (school_id, school_name, result2). Returns {school_id: points}.
-
-    Ties on the mark are broken alphabetically by school name and assigned
-    sequential places (matches the convention used by regional_predictions).
-    """
-    cleaned = [
-        (sid, name or "", r)
-        for sid, name, r in rows
-        if r is not None and r not in (0, 9999)
-    ]
-    if not cleaned:
-        return {}
-    cleaned.sort(key=lambda x: (x[2] if ascending else -x[2], x[1]))
-
-    scores = defaultdict(float)
-    for place, (sid, _name, _value) in enumerate(cleaned, start=1):
-        pts = STATE_POINTS.get(place, 0)
-        if pts:
-            scores[sid] += pts
-    return scores
-
-
 def _fetch_individual_rows(conn, year, gender):
     sql = """
         SELECT ar.event, s.school_id, s.school_name, ar.result2
@@ -102,36 +74,10 @@ def _project_state(conn, year, gender):
     for row in relays:
         school_names.setdefault(row[1], row[2])
 
-    by_event = defaultdict(list)
-    for event, sid, name, result2 in individual:
-        by_event[event].append((sid, name, result2))
-    for event, sid, name, result2 in relays:
-        by_event[event].append((sid, name, result2))
-
-    totals = defaultdict(float)
-    for event, rows in by_event.items():
-        event_scores = _score_event(rows, ascending=_is_track_like_event(event))
-        for sid, pts in event_scores.items():
-            totals[sid] += pts
-
-    ranked = sorted(
-        ((sid, round(pts, 2)) for sid, pts in totals.items() if pts > 0),
-        key=lambda x: (-x[1], school_names.get(x[0], "")),
-    )
-
-    output = []
-    last_score = None
-    last_place = 0
-    for idx, (sid, score) in enumerate(ranked, start=1):
-        if score != last_score:
-            last_place = idx
-            last_score = score
-        output.append({
-            "place": last_place,
-            "team": school_names.get(sid, f"School #{sid}"),
-            "score": score,
-        })
-    return output
+    events, school_ids, names, marks = zip(*(individual + relays))
+    totals = score_meet(events, school_ids, marks, STATE_POINTS, tie_policy=TIE_SEQUENTIAL, names=names)
+
+    return rank_teams(totals, school_names)
 
 
 def get_state_predictions(year, gender, top_n=None, db_path=None):
@@ -0,0 +1,79 @@
+"""
+Test the regional advancement-probability estimates.
+Run from backend/scripts directory: python test_advancement_probabilities.py
+
+With the variance switched off the simulated regional finals replay the
+feeder marks, so the probabilities must collapse to the deterministic
+answer: top-3 by mark within the regional field, and met_standard. With it
+on, each field hands out exactly three top-3 finishes per simulation, and an
+incremental combined-rankings update must match a full rebuild.
+"""
+
+import copy
+import os
+import sys
+import time
+from collections import defaultdict
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend import create_app  # noqa: E402
+from backend.queries import get_all_regional_qualifiers  # noqa: E402
+from advancement_probabilities import attach_advancement_probabilities  # noqa: E402
+from precompute_combined_rankings import build_combined_payload, update_combined_payload  # noqa: E402
+
+YEAR = 2025
+PROBABILITY_KEYS = ("top3_probability", "standard_probability", "advance_probability")
+
+
+def fields(payload):
+    by_field = defaultdict(list)
+    for event_block in payload["events"]:
+        for row in event_block["qualifiers"]:
+            if row["advance_probability"] is not None:
+                by_field[(row["regional_num"], event_block["event"], event_block["event_type"])].append(row)
+    return by_field
+
+
+app = create_app()
+with app.app_context():
+    for gender in ("Boys", "Girls"):
+        print("=" * 70)
+        print(f"{YEAR} {gender}: combined rankings with advancement probabilities")
+        print("=" * 70)
+        start = time.perf_counter()
+        payload = build_combined_payload(gender, YEAR)
+        print(f"  built in {time.perf_counter() - start:.2f}s")
+        by_field = fields(payload)
+        rows = [row for field_rows in by_field.values() for row in field_rows]
+        assert rows, "expected scored rows"
+        for row in rows:
+            assert all(0 <= row[key] <= 1 for key in PROBABILITY_KEYS)
+            assert row["advance_probability"] >= max(row["top3_probability"], row["standard_probability"])
+        for (regional_num, event, _event_type), field_rows in by_field.items():
+            expected = min(3, len(field_rows))
+            assert abs(sum(row["top3_probability"] for row in field_rows) - expected) < 1e-3, (regional_num, event)
+        print(f"  {len(rows)} rows in {len(by_field)} regional fields OK")
+
+        deterministic = attach_advancement_probabilities(copy.deepcopy(payload), n_sims=5, variance_scale=0)
+        for (regional_num, event, event_type), field_rows in fields(deterministic).items():
+            marks = sorted((row["result2"] for row in field_rows), reverse=event_type == "Field")
+            cutoff = marks[min(3, len(marks)) - 1]
+            for row in field_rows:
+                in_top3 = row["result2"] >= cutoff if event_type == "Field" else row["result2"] <= cutoff
+                assert row["top3_probability"] == float(in_top3), (regional_num, event, row)
+                assert row["standard_probability"] == float(row["met_standard"]), (regional_num, event, row)
+        print("  zero variance reproduces top-3 by mark and met_standard")
+
+        fresh = {1: get_all_regional_qualifiers(gender=gender, year=YEAR)[1]}
+        updated = update_combined_payload(payload, fresh, gender, YEAR)
+        assert updated == payload, "incremental update should match the full rebuild"
+        print("  incremental update matches full rebuild")
+
+    example = max(rows, key=lambda row: 0.5 - abs(row["advance_probability"] - 0.5))
+    print(f"\nClosest call: {example.get('name') or example['school']} ({example['event']}, "
+          f"regional {example['regional_num']}) advances {100 * example['advance_probability']:.1f}%")
+
+print("\nAll advancement probability checks passed.")
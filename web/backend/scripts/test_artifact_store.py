@@ -0,0 +1,152 @@
+"""
+Test the versioned artifact store and the API's hot reload of new versions.
+Run from backend/scripts directory: python test_artifact_store.py
+
+Seeds a temp frontend/static/data tree, publishes two versions, checks the
+API switches to each one without a restart, that a failed publish leaves the
+current version untouched, and that rollback restores the previous set.
+Then checks that an overlapping run waits for the store lock and keeps both
+runs' artifacts, and that without the lock a publish over a newer version
+is refused.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import Config  # noqa: E402
+from backend import create_app  # noqa: E402
+from backend import artifact_store as artifact_store_module  # noqa: E402
+from backend.artifact_store import ArtifactStore, artifact_store, main as store_main, write_json_artifact  # noqa: E402
+
+URL = '/api/state-qualifiers?gender=Boys&year=2026'
+RELPATH = os.path.join('state_predictions', 'state_qualifiers_2026_boys.json')
+
+
+def payload(label):
+    return {"context": {"gender": "Boys", "year": 2026, "label": label}, "events": []}
+
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    store_root = os.path.join(tmp_dir, 'artifact_store')
+    seed_dir = os.path.join(tmp_dir, 'frontend', 'static', 'data')
+
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp_dir, 'Track.db')}"
+        QUALIFIER_CACHE_PATH = ''
+        ARTIFACT_STORE_PATH = store_root
+
+    app = create_app(TestConfig)
+    app.root_path = os.path.join(tmp_dir, 'backend')
+    client = app.test_client()
+    store = artifact_store(store_root, seed_dir=seed_dir)
+
+    def served_label():
+        return client.get(URL).get_json()["context"]["label"]
+
+    print("=" * 70)
+    print("Seed files are served until a version is published")
+    print("=" * 70)
+    write_json_artifact(os.path.join(seed_dir, RELPATH), payload("seed"))
+    write_json_artifact(os.path.join(seed_dir, 'school_rankings', 'school_rankings_all_boys.json'), {"rows": []})
+    assert store.current_version() is None and served_label() == "seed"
+    print("  served:", served_label())
+
+    print("\nPublishing swaps every reader to the new version")
+    with store.publish() as version:
+        version.write_json(RELPATH, payload("v1"))
+    first = store.current_version()
+    assert served_label() == "v1"
+    # Untouched artifacts are carried into the new version, so the set is complete.
+    assert os.path.exists(os.path.join(store.version_dir(first), 'school_rankings', 'school_rankings_all_boys.json'))
+    with open(os.path.join(seed_dir, RELPATH), encoding="utf-8") as f:
+        assert '"seed"' in f.read(), "publishing must not modify the seed files"
+    print("  version:", first, "served:", served_label())
+
+    with store.publish() as version:
+        version.write_json(RELPATH, payload("v2"))
+    second = store.current_version()
+    assert second != first and served_label() == "v2"
+    print("  version:", second, "served:", served_label())
+
+    print("\nA failed run publishes nothing")
+    try:
+        with store.publish() as version:
+            version.write_json(RELPATH, payload("broken"))
+            raise RuntimeError("precompute crashed")
+    except RuntimeError:
+        pass
+    assert store.current_version() == second and served_label() == "v2"
+    assert not [name for name in os.listdir(store.versions_dir) if name.startswith(".staging")]
+    print("  still serving:", served_label())
+
+    print("\nRollback restores the previous version")
+    store_main(["--root", store_root, "rollback"])
+    assert store.current_version() == first and served_label() == "v1"
+    print("  served:", served_label())
+
+    store.activate(second)
+    assert served_label() == "v2"
+    assert store.prune(keep=1) == [first] and store.list_versions() == [second]
+    print("  re-activated", second, "and pruned", first)
+
+    print("\nAn overlapping run waits for the lock and keeps both runs' artifacts")
+    # A second instance on the same root stands in for another precompute process.
+    other = ArtifactStore(store_root, seed_dir=seed_dir, keep=1)
+    first_staged = threading.Event()
+    release_first = threading.Event()
+    second_staged = threading.Event()
+
+    def first_run():
+        with store.publish() as version:
+            version.write_json('first.json', {"run": 1})
+            first_staged.set()
+            release_first.wait(10)
+
+    def second_run():
+        first_staged.wait(10)
+        with other.publish() as version:
+            second_staged.set()
+            version.write_json('second.json', {"run": 2})
+
+    runs = [threading.Thread(target=first_run), threading.Thread(target=second_run)]
+    for run in runs:
+        run.start()
+    first_staged.wait(10)
+    time.sleep(0.3)
+    assert not second_staged.is_set(), "second run staged while the first held the store"
+    release_first.set()
+    for run in runs:
+        run.join(10)
+    current = store.current_version()
+    assert current == other.current_version() and store.list_versions() == [current], store.list_versions()
+    for relpath in ('first.json', 'second.json', RELPATH):
+        assert os.path.exists(os.path.join(store.version_dir(current), relpath)), relpath
+    print("  published", current, "with first.json and second.json; older versions pruned")
+
+    print("\nWithout the lock, publishing over a newer version is refused")
+    base = store.current_version()
+    with mock.patch.object(artifact_store_module, "fcntl", None):
+        try:
+            with store.publish() as version:
+                version.write_json('stale.json', {"run": "stale"})
+                with other.publish() as newer:
+                    newer.write_json('newer.json', {"run": "newer"})
+        except ValueError as exc:
+            print("  refused:", exc)
+        else:
+            raise AssertionError("a publish over a newer version must fail")
+    newer_id = store.current_version()
+    assert newer_id != base and os.path.exists(os.path.join(store.version_dir(newer_id), 'newer.json'))
+    assert not os.path.exists(os.path.join(store.version_dir(newer_id), 'stale.json'))
+    assert not [name for name in os.listdir(store.versions_dir) if name.startswith(".staging")]
+    print("  still serving", newer_id)
+
+print("\nAll artifact store checks passed.")
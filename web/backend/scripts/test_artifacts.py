@@ -0,0 +1,114 @@
+"""
+Test the in-memory artifact service behind the precomputed JSON endpoints.
+Run from backend/scripts directory: python test_artifacts.py
+
+Writes a state_qualifiers artifact (with its .gz/.br sidecars) into a temp
+static root, then checks the API serves the encoded bytes, negotiates the
+columnar/msgpack formats, answers 304 to a matching ETag / Last-Modified and
+reloads once the file changes on disk.
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+import time
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import Config  # noqa: E402
+from backend import create_app  # noqa: E402
+from backend.artifact_store import write_json_artifact  # noqa: E402
+from backend.artifacts import artifact_cache, brotli  # noqa: E402
+from backend.util.artifact_format import MIMETYPES, from_columnar, msgpack  # noqa: E402
+
+URL = '/api/state-qualifiers?gender=Boys&year=2026'
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp_dir, 'Track.db')}"
+        QUALIFIER_CACHE_PATH = ''
+        ARTIFACT_STORE_PATH = ''
+
+    app = create_app(TestConfig)
+    # artifact_path() resolves <root_path>/../frontend/static/data
+    app.root_path = os.path.join(tmp_dir, 'backend')
+    artifact_file = os.path.join(tmp_dir, 'frontend', 'static', 'data', 'state_predictions', 'state_qualifiers_2026_boys.json')
+    qualifiers = [
+        {"event": "100 Meters", "name": "A. Runner", "school": "Carmel", "result2": 10.71, "place": 1},
+        {"event": "100 Meters", "name": "B. Runner", "school": "Carmel", "result2": 10.84, "place": 2},
+    ]
+    payload = {"context": {"gender": "Boys", "year": 2026}, "events": [{"event": "100 Meters", "qualifiers": qualifiers}]}
+    write_json_artifact(artifact_file, payload)
+    client = app.test_client()
+
+    print("=" * 70)
+    print("Identity, gzip and brotli responses")
+    print("=" * 70)
+    plain = client.get(URL)
+    assert plain.status_code == 200 and plain.get_json() == payload, plain.status_code
+    assert "Content-Encoding" not in plain.headers
+    etag = plain.headers["ETag"]
+    print("  identity:", plain.status_code, etag, len(plain.data), "bytes")
+
+    gzipped = client.get(URL, headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(gzipped.data)) == payload
+    assert gzipped.headers["Vary"] == "Accept, Accept-Encoding"
+    print("  gzip:", len(gzipped.data), "bytes")
+
+    preferred = client.get(URL, headers={"Accept-Encoding": "gzip, br"})
+    expected = "br" if brotli is not None else "gzip"
+    assert preferred.headers["Content-Encoding"] == expected, preferred.headers
+    print("  gzip, br ->", preferred.headers["Content-Encoding"])
+
+    print("\nConditional requests")
+    not_modified = client.get(URL, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304 and not not_modified.data
+    since = client.get(URL, headers={"If-Modified-Since": plain.headers["Last-Modified"]})
+    assert since.status_code == 304
+    print("  If-None-Match ->", not_modified.status_code, "| If-Modified-Since ->", since.status_code)
+
+    print("\nCompact formats")
+    columnar = client.get(URL + "&format=columnar")
+    assert columnar.mimetype == MIMETYPES["columnar"]
+    assert from_columnar(json.loads(columnar.data)) == payload
+    assert columnar.headers["ETag"] != etag
+    print("  format=columnar:", len(columnar.data), "bytes,", columnar.headers["ETag"])
+
+    accepted = client.get(URL, headers={"Accept": MIMETYPES["msgpack"]})
+    if msgpack is not None:
+        assert accepted.mimetype == MIMETYPES["msgpack"]
+        assert from_columnar(msgpack.unpackb(accepted.data, raw=False)) == payload
+    else:
+        assert accepted.mimetype == MIMETYPES["json"] and accepted.get_json() == payload
+    print("  Accept: application/msgpack ->", accepted.mimetype)
+
+    bad = client.get(URL + "&format=xml")
+    assert bad.status_code == 400 and "format must be one of" in bad.get_json()["error"]
+    print("  format=xml ->", bad.status_code)
+
+    print("\nCached bytes are reused until the file changes")
+    first = artifact_cache.get(artifact_file)
+    assert artifact_cache.get(artifact_file) is first
+
+    time.sleep(0.01)
+    payload["events"].append({"event": "200 Meters", "qualifiers": []})
+    write_json_artifact(artifact_file, payload)
+    refreshed = client.get(URL, headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+    assert refreshed.status_code == 200 and refreshed.headers["ETag"] != etag
+    assert len(json.loads(gzip.decompress(refreshed.data))["events"]) == 2
+    print("  new ETag:", refreshed.headers["ETag"])
+
+    print("\nStale sidecar is ignored in favour of the new JSON")
+    time.sleep(0.01)
+    with open(artifact_file, "w", encoding="utf-8") as f:
+        json.dump({"context": {}, "events": []}, f)
+    stale = client.get(URL, headers={"Accept-Encoding": "gzip"})
+    assert json.loads(gzip.decompress(stale.data))["events"] == []
+    print("  gzip body matches the rewritten JSON")
+
+print("\nAll artifact checks passed.")
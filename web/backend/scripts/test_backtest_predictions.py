@@ -0,0 +1,115 @@
+"""
+Checks for the prediction backtesting harness.
+Run from backend/scripts directory: python test_backtest_predictions.py
+
+backtest_predictions replaced compare_regional_predictions.py (2026 Girls
+only, one meet scored per query, twice per meet). The reference below is
+that script's per-meet scorer; the season-at-once actual scores must agree
+with it for every regional and state meet in Track.db. Also checks the
+metrics on hand-built rankings and that a parallel run matches a serial one.
+"""
+
+import sqlite3
+import time
+
+from backtest_predictions import actual_scores, meet_metrics, run_backtest
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, TIE_AVERAGE, rank_teams, score_meet
+from regional_predictions import DB_PATH
+
+
+def reference_score_meet(conn, meet_id, points_by_place):
+    """compare_regional_predictions._score_meet: one meet, individual finals + relays."""
+    indiv = conn.execute(
+        """
+        SELECT ar.event, e.event_type, a.school_id, ar.result2
+        FROM athlete_result ar
+        JOIN athlete a ON ar.athlete_id = a.athlete_id
+        JOIN event   e ON ar.event = e.event
+        WHERE ar.meet_id = ?
+          AND ar.result_type = 'Final'
+          AND ar.result2 IS NOT NULL
+        """,
+        (meet_id,),
+    ).fetchall()
+    relays = conn.execute(
+        """
+        SELECT rr.event, 'Relay' AS event_type, rr.school_id, rr.result2
+        FROM relay_result rr
+        WHERE rr.meet_id = ?
+          AND rr.result2 IS NOT NULL
+        """,
+        (meet_id,),
+    ).fetchall()
+    rows = indiv + relays
+    if not rows:
+        return {}
+    events, etypes, school_ids, marks = zip(*rows)
+    scores = score_meet(
+        events, school_ids, marks, points_by_place,
+        tie_policy=TIE_AVERAGE, ascending=[etype != "Field" for etype in etypes],
+    )
+    return {sid: pts for sid, pts in scores.items() if pts > 0}
+
+
+def main():
+    print("=" * 70)
+    print("Actual scores vs the per-meet reference")
+    print("=" * 70)
+    conn = sqlite3.connect(DB_PATH)
+    school_names = dict(conn.execute("SELECT school_id, school_name FROM school").fetchall())
+    meets = conn.execute(
+        "SELECT meet_id, year, gender, meet_type, meet_num FROM meet WHERE meet_type IN ('Regional', 'State')"
+    ).fetchall()
+    checked = 0
+    start = time.perf_counter()
+    for meet_id, year, gender, meet_type, meet_num in meets:
+        points = REGIONAL_POINTS if meet_type == "Regional" else STATE_POINTS
+        expected = rank_teams(reference_score_meet(conn, meet_id, points), school_names)
+        season = actual_scores(conn, DB_PATH, year, gender, meet_type)
+        actual = season.get(meet_num, {"rows": []})["rows"]
+        assert actual == expected, f"{year} {gender} {meet_type} {meet_num}"
+        checked += 1
+    print(f"  {checked} meets OK in {time.perf_counter() - start:.3f}s")
+    assert actual_scores(conn, DB_PATH, 2025, "Boys", "State") is actual_scores(conn, DB_PATH, 2025, "Boys", "State")
+    print("  repeat lookups served from the cache")
+    conn.close()
+
+    print("\n" + "=" * 70)
+    print("Metrics")
+    print("=" * 70)
+    rows = [{"place": i + 1, "team": team, "score": score}
+            for i, (team, score) in enumerate([("A", 50.0), ("B", 40.0), ("C", 30.0), ("D", 20.0), ("E", 10.0)])]
+    reversed_rows = [dict(row, score=60.0 - row["score"]) for row in reversed(rows)]
+    assert meet_metrics(rows, rows, top_k=3) == {
+        "top_k_overlap": 1.0, "winner_hit": True, "rank_correlation": 1.0, "score_mae": 0.0,
+    }
+    flipped = meet_metrics(rows, reversed_rows, top_k=2)
+    assert flipped["top_k_overlap"] == 0.0 and not flipped["winner_hit"] and flipped["rank_correlation"] == -1.0
+    # A team projected but never scoring counts as 0 on the actual side.
+    partial = meet_metrics(rows, rows[:4], top_k=5)
+    assert partial["top_k_overlap"] == 0.8 and partial["score_mae"] == 2.0
+    assert meet_metrics([], [], top_k=5)["rank_correlation"] is None
+    print("  overlap, winner, rank correlation and MAE OK")
+
+    print("\n" + "=" * 70)
+    print("Parallel run == serial run")
+    print("=" * 70)
+    start = time.perf_counter()
+    serial = run_backtest(jobs=1)
+    serial_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = run_backtest(jobs=4)
+    parallel_seconds = time.perf_counter() - start
+    assert serial == parallel
+    stages = {record["stage"] for record in serial["meets"]}
+    assert stages == {"Regional", "State"}, stages
+    assert serial["summary"]["stages"]["Regional"]["meets"] == sum(
+        1 for record in serial["meets"] if record["stage"] == "Regional"
+    )
+    print(f"  {len(serial['meets'])} meets; serial {serial_seconds:.2f}s, 4 workers {parallel_seconds:.2f}s")
+
+    print("\nAll backtest checks passed.")
+
+
+if __name__ == "__main__":
+    main()
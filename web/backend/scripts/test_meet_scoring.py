@@ -0,0 +1,179 @@
+"""
+Parity check for the shared meet-scoring engine.
+Run from backend/scripts directory: python test_meet_scoring.py
+
+meet_scoring replaced four per-event Python loops. The references below are
+those loops: the sequential/alphabetical scorer from regional_predictions and
+state_predictions, the rank("min") + averaged-tie scorer from
+projected_team_scores, and the tie-group walk from the old
+compare_regional_predictions script.
+Each must agree with the engine on hand-built ties and on every finals meet
+in Track.db.
+"""
+
+import sqlite3
+import time
+from collections import defaultdict
+
+import pandas as pd
+
+from meet_scoring import (
+    REGIONAL_POINTS,
+    STATE_POINTS,
+    TIE_AVERAGE,
+    TIE_SEQUENTIAL,
+    is_track_like_event,
+    place_rows,
+    score_meet,
+)
+from regional_predictions import DB_PATH
+
+
+def reference_sequential(rows, points_by_place):
+    """rows: (event, school_id, school_name, result2)."""
+    by_event = defaultdict(list)
+    for event, sid, name, mark in rows:
+        by_event[event].append((sid, name or "", mark))
+    totals = defaultdict(float)
+    for event, entries in by_event.items():
+        ascending = is_track_like_event(event)
+        entries.sort(key=lambda x: (x[2] if ascending else -x[2], x[1]))
+        for place, (sid, _name, _mark) in enumerate(entries, start=1):
+            totals[sid] += points_by_place.get(place, 0)
+    return totals
+
+
+def reference_rank_average(rows, points_by_place):
+    """projected_team_scores: pandas rank('min') per event, averaged points."""
+    df = pd.DataFrame(rows, columns=["event", "school_id", "school_name", "result2"])
+    totals = defaultdict(float)
+    for event in df["event"].unique():
+        ascending = is_track_like_event(event)
+        event_df = df[df["event"] == event].sort_values(by="result2", ascending=ascending).copy()
+        event_df["place"] = event_df["result2"].rank(method="min", ascending=ascending).astype(int)
+        place_counts = event_df["place"].value_counts()
+        for _, row in event_df.iterrows():
+            place, tie_count = int(row["place"]), int(place_counts[int(row["place"])])
+            pts = sum(points_by_place.get(place + i, 0) for i in range(tie_count)) / tie_count
+            totals[int(row["school_id"])] += pts
+    return totals
+
+
+def reference_tie_walk(rows, points_by_place):
+    """Old compare_regional_predictions: walk tie groups until the last scoring place."""
+    by_event = defaultdict(list)
+    for event, sid, _name, mark in rows:
+        by_event[event].append((sid, mark))
+    totals = defaultdict(float)
+    last_place = max(points_by_place)
+    for event, entries in by_event.items():
+        entries.sort(key=lambda x: x[1], reverse=not is_track_like_event(event))
+        i, place = 0, 1
+        while i < len(entries) and place <= last_place:
+            j = i + 1
+            while j < len(entries) and entries[j][1] == entries[i][1]:
+                j += 1
+            pts = sum(points_by_place.get(place + k, 0) for k in range(j - i)) / (j - i)
+            for sid, _mark in entries[i:j]:
+                totals[sid] += pts
+            place += j - i
+            i = j
+    return totals
+
+
+def engine(rows, points_by_place, tie_policy):
+    events, school_ids, names, marks = zip(*rows)
+    return score_meet(events, school_ids, marks, points_by_place, tie_policy=tie_policy, names=names)
+
+
+def assert_same(expected, actual, label):
+    expected = {sid: pts for sid, pts in expected.items() if pts}
+    actual = {sid: pts for sid, pts in actual.items() if pts}
+    assert expected.keys() == actual.keys(), f"{label}: schools differ"
+    for sid, pts in expected.items():
+        assert abs(pts - actual[sid]) < 1e-9, f"{label}: school {sid} {pts} != {actual[sid]}"
+
+
+print("=" * 70)
+print("Hand-built ties")
+print("=" * 70)
+tie_rows = [
+    ("100 Meters", 1, "Carmel", 10.9),
+    ("100 Meters", 2, "Ben Davis", 10.9),
+    ("100 Meters", 3, "Avon", 11.2),
+    ("High Jump", 1, "Carmel", 74.0),
+    ("High Jump", 3, "Avon", 74.0),
+    ("High Jump", 2, "Ben Davis", 72.0),
+] + [("Shot Put", 10 + i, f"School {i:02d}", 600.0 - (i // 3)) for i in range(11)]
+
+places, points = place_rows(
+    [r[0] for r in tie_rows], [r[3] for r in tie_rows], REGIONAL_POINTS,
+    tie_policy=TIE_SEQUENTIAL, names=[r[2] for r in tie_rows],
+)
+# Ties broken alphabetically: Ben Davis wins the 100, Avon the high jump (higher is better).
+assert list(places[:6]) == [2, 1, 3, 2, 1, 3] and list(points[:6]) == [8, 10, 6, 8, 10, 6]
+places, points = place_rows(
+    [r[0] for r in tie_rows], [r[3] for r in tie_rows], REGIONAL_POINTS, tie_policy=TIE_AVERAGE,
+)
+assert list(places[:6]) == [1, 1, 3, 1, 1, 3] and list(points[:6]) == [9, 9, 6, 9, 9, 6]
+# Shot put: groups of 3 at places 1, 4, 7, 10; the 7th-place tie spans 7-9 -> (2 + 1 + 0) / 3.
+assert list(places[6:]) == [1, 1, 1, 4, 4, 4, 7, 7, 7, 10, 10]
+assert list(points[6:12]) == [8, 8, 8, 4, 4, 4] and abs(points[12] - 1.0) < 1e-12 and points[15] == 0
+for points_by_place in (REGIONAL_POINTS, STATE_POINTS):
+    assert_same(reference_sequential(tie_rows, points_by_place), engine(tie_rows, points_by_place, TIE_SEQUENTIAL), "sequential")
+    assert_same(reference_rank_average(tie_rows, points_by_place), engine(tie_rows, points_by_place, TIE_AVERAGE), "rank-average")
+    assert_same(reference_tie_walk(tie_rows, points_by_place), engine(tie_rows, points_by_place, TIE_AVERAGE), "tie-walk")
+print("  sequential, rank-average and tie-walk references agree")
+
+print("\n" + "=" * 70)
+print("Every sectional/regional finals meet in Track.db")
+print("=" * 70)
+conn = sqlite3.connect(DB_PATH)
+meet_rows = defaultdict(list)
+for meet_id, event, sid, name, mark in conn.execute(
+    """
+    SELECT ar.meet_id, ar.event, s.school_id, s.school_name, ar.result2
+    FROM athlete_result ar
+    JOIN athlete a ON ar.athlete_id = a.athlete_id
+    JOIN school s ON a.school_id = s.school_id
+    JOIN meet m ON ar.meet_id = m.meet_id
+    WHERE m.meet_type IN ('Sectional', 'Regional') AND ar.result_type = 'Final'
+      AND ar.result2 IS NOT NULL AND ar.result2 NOT IN (0, 9999)
+    UNION ALL
+    SELECT rr.meet_id, rr.event, s.school_id, s.school_name, rr.result2
+    FROM relay_result rr
+    JOIN school s ON rr.school_id = s.school_id
+    JOIN meet m ON rr.meet_id = m.meet_id
+    WHERE m.meet_type IN ('Sectional', 'Regional')
+      AND rr.result2 IS NOT NULL AND rr.result2 NOT IN (0, 9999)
+    """
+):
+    meet_rows[meet_id].append((event, sid, name, mark))
+conn.close()
+
+timings = defaultdict(float)
+for meet_id, rows in meet_rows.items():
+    for points_by_place in (REGIONAL_POINTS, STATE_POINTS):
+        start = time.perf_counter()
+        expected_sequential = reference_sequential(rows, points_by_place)
+        timings["reference sequential"] += time.perf_counter() - start
+        start = time.perf_counter()
+        expected_average = reference_rank_average(rows, points_by_place)
+        timings["reference rank-average"] += time.perf_counter() - start
+        expected_walk = reference_tie_walk(rows, points_by_place)
+
+        start = time.perf_counter()
+        actual_sequential = engine(rows, points_by_place, TIE_SEQUENTIAL)
+        timings["engine sequential"] += time.perf_counter() - start
+        start = time.perf_counter()
+        actual_average = engine(rows, points_by_place, TIE_AVERAGE)
+        timings["engine average"] += time.perf_counter() - start
+
+        assert_same(expected_sequential, actual_sequential, f"meet {meet_id} sequential")
+        assert_same(expected_average, actual_average, f"meet {meet_id} rank-average")
+        assert_same(expected_walk, actual_average, f"meet {meet_id} tie-walk")
+print(f"  {len(meet_rows)} meets x 2 points tables OK")
+for label, seconds in timings.items():
+    print(f"  {label:<24} {seconds:7.3f}s")
+
+print("\nAll meet scoring parity checks passed.")
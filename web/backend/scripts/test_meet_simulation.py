@@ -0,0 +1,81 @@
+"""
+Test the Monte Carlo regional/state simulator.
+Run from backend/scripts directory: python test_meet_simulation.py
+
+Checks that batched scoring matches score_meet run by run, that with the
+variance switched off every simulated meet reproduces the deterministic
+regional/state predictions, and that a fixed seed gives the same answer
+regardless of the number of worker processes.
+"""
+
+import time
+
+import numpy as np
+
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, score_meet, score_simulations
+from meet_simulation import simulate_regional, simulate_regionals, simulate_state
+from regional_predictions import get_regional_predictions
+from state_predictions import get_state_predictions
+
+YEAR = 2025
+
+
+def main():
+    print("=" * 70)
+    print("Batched scoring matches score_meet for every run")
+    print("=" * 70)
+    rng = np.random.default_rng(1)
+    events = np.repeat(["100 Meters", "High Jump", "4 x 400 Relay", "Shot Put"], 12)
+    school_ids = rng.integers(1, 10, len(events))
+    marks = rng.uniform(10, 20, (200, len(events)))
+    for points_by_place in (REGIONAL_POINTS, STATE_POINTS):
+        teams, totals = score_simulations(events, school_ids, marks, points_by_place)
+        for run in range(len(marks)):
+            expected = score_meet(events, school_ids, marks[run], points_by_place)
+            assert np.allclose(totals[run], [expected[int(sid)] for sid in teams])
+        assert np.allclose(totals.sum(axis=1), 4 * sum(points_by_place.values()))
+    print("  200 runs x 2 points tables OK")
+
+    print("\n" + "=" * 70)
+    print(f"Zero variance reproduces the {YEAR} deterministic predictions")
+    print("=" * 70)
+    for gender in ("Boys", "Girls"):
+        deterministic = {entry["regional_num"]: entry for entry in get_regional_predictions(YEAR, gender, top_n=None)}
+        simulated = simulate_regionals(YEAR, gender, n_sims=3, variance_scale=0)
+        assert sorted(deterministic) == [entry["regional_num"] for entry in simulated]
+        for entry in simulated:
+            expected = {row["team"]: row["score"] for row in deterministic[entry["regional_num"]]["rows"]}
+            actual = {row["team"]: row["mean_score"] for row in entry["rows"]}
+            assert actual == expected, f"{gender} regional {entry['regional_num']}"
+        state = simulate_state(YEAR, gender, n_sims=3, variance_scale=0)
+        expected = {row["team"]: row["score"] for row in get_state_predictions(YEAR, gender)["rows"]}
+        assert state["ready"] and {row["team"]: row["mean_score"] for row in state["rows"]} == expected
+        print(f"  {gender}: {len(simulated)} regionals + state OK")
+
+    print("\n" + "=" * 70)
+    print("Seeded runs are reproducible across worker counts")
+    print("=" * 70)
+    start = time.perf_counter()
+    serial = simulate_regionals(YEAR, "Girls", n_sims=2000, seed=11)
+    serial_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = simulate_regionals(YEAR, "Girls", n_sims=2000, seed=11, jobs=2)
+    parallel_seconds = time.perf_counter() - start
+    assert serial == parallel
+    assert simulate_regional(YEAR, "Girls", 1, n_sims=2000, seed=12)["rows"] != serial[0]["rows"]
+    print(f"  8 regionals x 2000 sims: serial {serial_seconds:.2f}s, 2 workers {parallel_seconds:.2f}s")
+
+    for entry in serial:
+        rows = entry["rows"]
+        assert abs(sum(row["win_probability"] for row in rows) - 1) < 1e-3
+        assert all(row["p10"] <= row["p50"] <= row["p90"] for row in rows)
+    top = serial[0]["rows"][0]
+    print(f"  Regional 1 favourite: {top['team']} wins {100 * top['win_probability']:.1f}% "
+          f"(p10-p90 {top['p10']:.0f}-{top['p90']:.0f})")
+
+    print("\nAll meet simulation checks passed.")
+
+
+# The worker-count check spawns processes, which re-import this module.
+if __name__ == '__main__':
+    main()
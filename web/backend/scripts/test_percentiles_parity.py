@@ -0,0 +1,102 @@
+"""
+Parity check for get_percentiles against the original per-cell implementation.
+Run from backend/scripts directory: python test_percentiles_parity.py
+
+get_percentiles now filters the shared results snapshot once and computes
+every (gender, event) cell with a single groupby and grouped quantile. The
+reference below is the original loop: full athlete/relay joins, one mask,
+groupby and quantile per cell. Both must agree on every scenario from
+test_percentiles.py.
+"""
+
+import pandas as pd
+
+from percentiles import convert_back, get_percentiles
+from util.const_util import CONST
+from util.db_util import Database
+
+ALL_EVENTS = (
+    CONST.EVENT.E100, CONST.EVENT.E200, CONST.EVENT.E400, CONST.EVENT.E800, CONST.EVENT.E1600, CONST.EVENT.E3200,
+    CONST.EVENT.E110H, CONST.EVENT.E300H,
+    CONST.EVENT.E400R, CONST.EVENT.E1600R, CONST.EVENT.E3200R,
+    CONST.EVENT.EHJ, CONST.EVENT.ELJ, CONST.EVENT.EDT, CONST.EVENT.ESP, CONST.EVENT.EPV,
+)
+
+db = Database(CONST.DB_PATH)
+df = db.get_all_athlete_results()
+df_relay = db.get_all_relay_results()
+
+
+def reference_percentiles(events=None, genders=None, percentiles=(25, 50, 75), years=None, meet_types=None, grade_levels=None):
+    gender_list = list(genders) if genders is not None else [CONST.GENDER.GIRLS, CONST.GENDER.BOYS]
+    event_list = list(events) if events is not None else list(ALL_EVENTS)
+    percentile_decimals = [p / 100.0 for p in percentiles]
+
+    all_rows = []
+    sample_counts = {}
+    for event_gender in gender_list:
+        for event_name in event_list:
+            current_event = event_name
+            if event_gender == CONST.GENDER.GIRLS and event_name == CONST.EVENT.E110H:
+                current_event = CONST.EVENT.E100H
+            df_source = df_relay if CONST.EVENT_TYPE.RELAY in current_event else df
+            conditions = (
+                (df_source.event == current_event) &
+                (df_source.gender == event_gender) &
+                (df_source.result2 != 0) &
+                (df_source.result2 != 9999)
+            )
+            if meet_types is not None:
+                conditions &= df_source.meet_type.isin(meet_types)
+            if years is not None:
+                conditions &= df_source.year.isin(years)
+            if grade_levels is not None and CONST.EVENT_TYPE.RELAY not in current_event:
+                conditions &= df_source.grade.isin(grade_levels)
+            df2 = df_source[conditions]
+            if df2.empty:
+                continue
+            if current_event[0].isdigit():
+                event_type = CONST.EVENT_TYPE.TRACK
+                key = 'school_id' if CONST.EVENT_TYPE.RELAY in current_event else 'athlete_id'
+                best_per_athlete = df2.groupby(key)['result2'].min()
+                df3 = best_per_athlete.quantile([1 - x for x in percentile_decimals])
+            else:
+                event_type = CONST.EVENT_TYPE.FIELD
+                best_per_athlete = df2.groupby('athlete_id')['result2'].max()
+                df3 = best_per_athlete.quantile(percentile_decimals)
+            sample_counts[(event_gender, current_event)] = len(best_per_athlete)
+            all_rows.append(
+                [event_gender, current_event] + [convert_back(event_type, df3.iloc[i]) for i in range(len(percentiles))]
+            )
+
+    final_df = pd.DataFrame(all_rows, columns=['Gender', 'Event'] + list(percentiles))
+    final_df['Gender_sort'] = final_df['Gender'].apply(lambda g: 0 if g == CONST.GENDER.BOYS else 1)
+    final_df = final_df.sort_values(['Gender_sort', 'Event']).drop(columns=['Gender_sort']).reset_index(drop=True)
+    final_df['sample_count'] = final_df.apply(lambda row: sample_counts.get((row['Gender'], row['Event']), 0), axis=1)
+    return final_df
+
+
+SCENARIOS = [
+    dict(events=('100 Meters', '200 Meters', '400 Meters'), genders=('Girls',), percentiles=(25, 50, 75)),
+    dict(events=('100 Meters', 'High Jump'), percentiles=(50, 75, 95)),
+    dict(events=('100 Meters', '200 Meters'), genders=('Boys',), years=(2024,), meet_types=('Sectional',)),
+    dict(meet_types=('Sectional',)),
+    dict(meet_types=('Sectional',), years=(2023, 2024)),
+    dict(),
+    dict(events=('110 Hurdles', '4 x 400 Relay', 'Shot Put'), percentiles=(10, 90)),
+    dict(events=('1600 Meters',), genders=('Boys',), grade_levels=('SR',), years=(1999,)),
+] + [
+    dict(events=('400 Meters', '1600 Meters'), genders=('Boys',), meet_types=('Sectional',), grade_levels=(grade,))
+    for grade in ('FR', 'SO', 'JR', 'SR')
+]
+
+print("=" * 70)
+print("get_percentiles vs. per-cell reference")
+print("=" * 70)
+for scenario in SCENARIOS:
+    expected = reference_percentiles(**scenario)
+    actual = get_percentiles(**scenario)
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+    print(f"  {len(actual):>2} rows  OK  {scenario}")
+
+print("\nAll percentile parity checks passed.")
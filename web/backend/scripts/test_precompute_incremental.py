@@ -0,0 +1,150 @@
+"""
+Partial vs full rebuild check for the incremental precompute.
+Run from backend/scripts directory: python test_precompute_incremental.py
+
+Builds combined_rankings_* and regional_predictions_* in full, then
+changes one sectional mark (committed the way the loaders do, with an
+ingest bump). The manifest diff must flag only that sectional, and
+refresh_regionals on the old files for its regional alone
+(update_combined_payload plus per-regional get_regional_prediction) must
+write the same JSON as a full rebuild. Then checks that precompute.py sees
+an incremental run's artifacts as fresh through the shared manifest, and
+that a host registry change makes both scripts rebuild everything. Runs
+against a temp copy of Track.db and a temp artifact store.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from sqlalchemy import text  # noqa: E402
+
+from config import DATABASE_PATH, Config  # noqa: E402
+from backend import create_app, db  # noqa: E402
+from backend.artifact_store import StagedVersion  # noqa: E402
+from backend.models import TournamentHost  # noqa: E402
+from backend.queries import SECTIONAL_TO_REGIONAL, bump_ingest_counter, qualifier_dependents  # noqa: E402
+import precompute  # noqa: E402
+import precompute_incremental  # noqa: E402
+import precompute_manifest  # noqa: E402
+import regional_predictions  # noqa: E402
+import state_predictions  # noqa: E402
+from precompute_incremental import REGIONAL_DIR, latest_season, refresh_regionals  # noqa: E402
+from precompute_manifest import changed_meets, load_manifest, meet_fingerprints  # noqa: E402
+
+GENDER = "Girls"
+SECTIONAL = 5
+
+
+def _artifacts(version, year):
+    suffix = f"{year}_{GENDER.lower()}"
+    payloads = {}
+    for name in ("combined_rankings", "regional_predictions"):
+        with open(version.artifact_path(os.path.join(REGIONAL_DIR, f"{name}_{suffix}.json")), encoding="utf-8") as f:
+            payloads[name] = json.load(f)
+    return payloads
+
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy2(DATABASE_PATH, db_path)
+
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        QUALIFIER_CACHE_PATH = os.path.join(tmp_dir, "qualifier_cache.db")
+        ARTIFACT_STORE_PATH = ''
+
+    app = create_app(TestConfig)
+    # The prediction modules open Track.db themselves rather than through the app.
+    with app.app_context(), \
+            mock.patch.object(regional_predictions, "DB_PATH", db_path), \
+            mock.patch.object(state_predictions, "DB_PATH", db_path):
+        year = latest_season()
+        print("=" * 70)
+        print(f"{year} {GENDER}: sectional {SECTIONAL} changes after a full build")
+        print("=" * 70)
+        before = StagedVersion(None, os.path.join(tmp_dir, "before"))
+        refresh_regionals(before, GENDER, year, [], full=True)
+        previous = meet_fingerprints(GENDER, year)
+
+        meet_id, athlete_id, event, result_type, result2 = db.session.execute(
+            text(
+                "SELECT ar.meet_id, ar.athlete_id, ar.event, ar.result_type, ar.result2 "
+                "FROM athlete_result ar JOIN meet m ON m.meet_id = ar.meet_id "
+                "WHERE m.meet_type = 'Sectional' AND m.year = :year AND m.gender = :gender "
+                "AND m.meet_num = :num AND ar.event = '1600 Meters' ORDER BY ar.place LIMIT 1"
+            ),
+            {"year": year, "gender": GENDER, "num": SECTIONAL},
+        ).one()
+        faster = round(result2 - 20.0, 2)
+        db.session.execute(
+            text(
+                "UPDATE athlete_result SET result2 = :mark, result = :display "
+                "WHERE meet_id = :mid AND athlete_id = :aid AND event = :event AND result_type = :rtype"
+            ),
+            {
+                "mark": faster, "display": f"{int(faster // 60)}:{faster % 60:05.2f}",
+                "mid": meet_id, "aid": athlete_id, "event": event, "rtype": result_type,
+            },
+        )
+        db.session.execute(text(
+            "INSERT INTO ingest_state (key, counter) VALUES ('results', 1) "
+            "ON CONFLICT(key) DO UPDATE SET counter = counter + 1"
+        ))
+        db.session.commit()
+        print(f"  athlete {athlete_id} {event}: {result2} -> {faster}")
+
+        current = meet_fingerprints(GENDER, year)
+        changed = changed_meets(previous, current, "Sectional")
+        assert changed == [SECTIONAL], changed
+        assert changed_meets(previous, current, "Regional") == []
+        regional_nums = qualifier_dependents("Sectional", changed)["regionals"]
+        assert regional_nums == [SECTIONAL_TO_REGIONAL[SECTIONAL]], regional_nums
+        print(f"  manifest diff: sectionals {changed} -> regionals {regional_nums}")
+
+        partial = StagedVersion(None, os.path.join(tmp_dir, "partial"))
+        shutil.copytree(before.path, partial.path)
+        refresh_regionals(partial, GENDER, year, regional_nums, full=False)
+        full = StagedVersion(None, os.path.join(tmp_dir, "full"))
+        refresh_regionals(full, GENDER, year, [], full=True)
+
+        old, updated, rebuilt = _artifacts(before, year), _artifacts(partial, year), _artifacts(full, year)
+        for name in rebuilt:
+            assert updated[name] == rebuilt[name], f"{name}: partial update differs from a full rebuild"
+            assert updated[name] != old[name], f"{name}: the changed mark did not reach the artifact"
+        print(f"  partial refresh of regional {regional_nums[0]} == full rebuild "
+              f"({', '.join(sorted(rebuilt))})")
+
+        print("\n" + "=" * 70)
+        print("One manifest for precompute.py and precompute_incremental.py")
+        print("=" * 70)
+        with mock.patch.object(precompute_manifest, "MANIFEST_PATH", os.path.join(tmp_dir, "manifest.json")), \
+                mock.patch.object(Config, "ARTIFACT_STORE_PATH", os.path.join(tmp_dir, "store")):
+
+            def stale_names():
+                current = {(year, GENDER): meet_fingerprints(GENDER, year)}
+                return [name for _y, _g, stale in precompute.stale_jobs(current, None, load_manifest())
+                        for name, _fingerprint in stale]
+
+            precompute_incremental.main(years=[year], genders=[GENDER], app=app)
+            assert stale_names() == [], stale_names()
+            print("  after an incremental run precompute.py finds nothing stale")
+
+            db.session.add(TournamentHost(year=year, gender=GENDER, meet_type="Sectional", meet_num=SECTIONAL, host="Moved"))
+            bump_ingest_counter()
+            db.session.commit()
+            with app.app_context():  # registry lookups are memoized per app context
+                assert sorted(stale_names()) == sorted(precompute.ARTIFACTS), stale_names()
+                precompute_incremental.main(years=[year], genders=[GENDER], app=app)
+                assert stale_names() == [], stale_names()
+            print("  a host registry change makes every artifact stale; the incremental run rebuilds them all")
+        db.session.remove()
+
+print("\nAll incremental precompute checks passed.")
@@ -0,0 +1,82 @@
+"""
+Parity check for the feeder-meet queries behind get_projected_team_scores.
+Run from backend/scripts directory: python test_projected_team_scores_parity.py
+
+The projection used to load the full athlete/relay joins and filter them in
+pandas. get_feeder_athlete_marks / get_feeder_relay_marks push that filter
+into SQL; both must return the same rows for every regional and state
+projection, and get_school_names must agree with get_school_name.
+"""
+
+import time
+
+import pandas as pd
+
+from projected_team_scores import _get_feeder_meets_for_projection
+from util.const_util import CONST
+from util.db_util import Database
+
+COLUMNS = ["event", "school_id", "result2"]
+
+
+def _sorted(df):
+    return df[COLUMNS].sort_values(COLUMNS).reset_index(drop=True)
+
+
+db = Database(CONST.DB_PATH)
+start = time.perf_counter()
+individual_results = db.get_all_athlete_results()
+relay_results = db.get_all_relay_results()
+full_load = time.perf_counter() - start
+
+print("=" * 70)
+print("Feeder queries vs. filtered full joins")
+print("=" * 70)
+pushdown = 0.0
+checked = 0
+for year in (2024, 2025, 2026):
+    for gender in CONST.GENDER.ALL:
+        projections = [(CONST.MEET_TYPE.REGIONAL, n) for n in range(1, 9)] + [(CONST.MEET_TYPE.STATE, None)]
+        for meet_type, meet_num in projections:
+            feeder_meet_type, feeder_meet_nums = _get_feeder_meets_for_projection(meet_type, meet_num)
+            expected_individual = individual_results[
+                (individual_results["meet_type"] == feeder_meet_type) &
+                (individual_results["meet_num"].isin(feeder_meet_nums)) &
+                (individual_results["year"] == year) &
+                (individual_results["gender"] == gender) &
+                (individual_results["result_type"] == CONST.RESULT_TYPE.FINAL) &
+                (individual_results["result2"] != 0) &
+                (individual_results["result2"] != 9999)
+            ]
+            expected_relay = relay_results[
+                (relay_results["meet_type"] == feeder_meet_type) &
+                (relay_results["meet_num"].isin(feeder_meet_nums)) &
+                (relay_results["year"] == year) &
+                (relay_results["gender"] == gender) &
+                (relay_results["result2"] != 0) &
+                (relay_results["result2"] != 9999)
+            ]
+
+            start = time.perf_counter()
+            individual = db.get_feeder_athlete_marks(
+                feeder_meet_type, feeder_meet_nums, year, gender, CONST.RESULT_TYPE.FINAL,
+            )
+            relay = db.get_feeder_relay_marks(feeder_meet_type, feeder_meet_nums, year, gender)
+            pushdown += time.perf_counter() - start
+
+            pd.testing.assert_frame_equal(_sorted(individual), _sorted(expected_individual), check_dtype=False)
+            pd.testing.assert_frame_equal(_sorted(relay), _sorted(expected_relay), check_dtype=False)
+            checked += 1
+print(f"  {checked} projections OK")
+print(f"  full joins loaded once: {full_load:.3f}s   all feeder queries: {pushdown:.3f}s")
+
+print("\n" + "=" * 70)
+print("Bulk school-name map")
+print("=" * 70)
+school_ids = sorted(individual_results["school_id"].unique())[:50]
+names = db.get_school_names(school_ids)
+assert names == {int(sid): db.get_school_name(int(sid)) for sid in school_ids}
+assert db.get_school_names([]) == {}
+print(f"  {len(names)} names match get_school_name")
+
+print("\nAll projected team score parity checks passed.")
@@ -0,0 +1,133 @@
+"""
+Test the tournament host refresh against a local stub of the IHSAA site.
+Run from backend/scripts directory: python test_refresh_tournament_hosts.py
+
+Serves canned tournament pages from a throwaway HTTP server, refreshes a
+temporary database from it, and checks that the request-path helpers read
+the stored hosts without going to the network, and that a refresh moves
+the data version the cached status is keyed on.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import Config  # noqa: E402
+from backend import create_app, db  # noqa: E402
+from backend.models import TournamentHost  # noqa: E402
+from backend.queries import (  # noqa: E402
+    _display_sectional_host,
+    _ihsaa_regional_hosts,
+    get_regional_qualifiers_status,
+    qualifier_data_version,
+)
+import refresh_tournament_hosts  # noqa: E402
+
+
+SECTIONAL_PAGE = """
+<html><body>
+<p>1. Chesterton 5 pm CT Tickets <a href="https://in.milesplit.com/meets/1/results">Results</a>
+   Schools: Chesterton, Valparaiso</p>
+<p>2. Hobart (2) Tickets <a href="https://in.milesplit.com/meets/2/results">Results</a>
+   Schools: Hobart, Portage</p>
+<p>40. Out of range <a href="https://in.milesplit.com/meets/40/results">Results</a> Schools: x</p>
+<p>Not a tournament row</p>
+</body></html>
+"""
+
+REGIONAL_PAGE = """
+<html><body>
+<p>1. Valparaiso 6:30 pm Tickets <a href="https://in.milesplit.com/meets/9/results">Results</a>
+   Sectional Host: Chesterton, Hobart</p>
+<p>2. Warsaw Community &amp; Friends Tickets <a href="https://in.milesplit.com/meets/10/results">Results</a>
+   Sectional Host: Elkhart</p>
+</body></html>
+"""
+
+requests_seen = []
+
+
+class StubIhsaaHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        requests_seen.append(self.path)
+        round_name = parse_qs(parsed.query).get("round", [""])[0]
+        if "/boys/" not in parsed.path:
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = {"sectionals": SECTIONAL_PAGE, "regionals": REGIONAL_PAGE}.get(round_name, "")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, format, *args):
+        pass
+
+
+server = HTTPServer(("127.0.0.1", 0), StubIhsaaHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp_dir, 'Track.db')}"
+
+    app = create_app(TestConfig)
+
+    print("=" * 70)
+    print("Refresh against stub server (Girls pages return 404)")
+    print("=" * 70)
+    refresh_tournament_hosts.main(years=[2026], base_url=base_url, app=app)
+    assert any("2025-26-tournament?round=sectionals" in path for path in requests_seen), requests_seen
+
+    with app.app_context():
+        rows = db.session.query(TournamentHost).order_by(
+            TournamentHost.meet_type, TournamentHost.meet_num
+        ).all()
+        stored = {(r.gender, r.meet_type, r.meet_num): r.host for r in rows}
+        print(stored)
+        assert stored == {
+            ("Boys", "Regional", 1): "Valparaiso",
+            ("Boys", "Regional", 2): "Warsaw Community & Friends",
+            ("Boys", "Sectional", 1): "Chesterton",
+            ("Boys", "Sectional", 2): "Hobart",
+        }, stored
+
+        print("\nRequest-path helpers read the registry")
+        assert _ihsaa_regional_hosts(2026, "Boys") == {1: "Valparaiso", 2: "Warsaw Community & Friends"}
+        assert _display_sectional_host("IHSAA Sectional 2", 2, 2026, "Boys") == "Hobart"
+        assert _display_sectional_host(None, 5, 2026, "Boys") == "Sectional 5"
+        assert _ihsaa_regional_hosts(2026, "Girls") == {}
+
+    print("\nA refresh reaches a running app on its next request")
+    with app.test_request_context():
+        assert _ihsaa_regional_hosts(2026, "Boys")[2] == "Warsaw Community & Friends"
+        status_before = get_regional_qualifiers_status("Boys", 2026)
+    REGIONAL_PAGE = REGIONAL_PAGE.replace("Warsaw Community &amp; Friends", "Elkhart")
+    refresh_tournament_hosts.main(years=[2026], base_url=base_url, app=app)
+    with app.test_request_context():
+        assert _ihsaa_regional_hosts(2026, "Boys") == {1: "Valparaiso", 2: "Elkhart"}
+        status_after = get_regional_qualifiers_status("Boys", 2026)
+        assert status_after["data_version"] != status_before["data_version"], "refresh must bump the ingest counter"
+        refreshed_version = qualifier_data_version()
+    print(f"  data_version: {status_before['data_version']} -> {status_after['data_version']}")
+
+    print("\nA failed refresh keeps existing hosts")
+    server.shutdown()
+    server.server_close()
+    refresh_tournament_hosts.main(years=[2026], base_url=base_url, app=app)
+    with app.app_context():
+        assert _ihsaa_regional_hosts(2026, "Boys") == {1: "Valparaiso", 2: "Elkhart"}
+        assert qualifier_data_version() == refreshed_version
+        db.engine.dispose()
+
+print("\nAll tournament host registry checks passed.")
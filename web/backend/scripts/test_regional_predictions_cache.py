@@ -0,0 +1,147 @@
+"""
+Test the single-load, per-data-version cached regional predictions.
+Run from backend/scripts directory: python test_regional_predictions_cache.py
+
+get_regional_predictions used to run a DISTINCT feeder check plus two
+finals queries per regional. It now loads all 32 sectionals in two queries,
+projects every regional at once and caches the result per data version.
+This compares it against the original per-regional queries for every
+season, counts the statements a cold and a warm call execute, and checks a
+new meet invalidates the cache.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
+
+import regional_predictions
+from regional_predictions import (
+    DB_PATH,
+    _feeder_sectional_nums,
+    _project_regional,
+    get_regional_prediction,
+    get_regional_predictions,
+    has_sectional_data,
+)
+
+
+def reference_predictions(year, gender, top_n=None, hosts=None):
+    """The original path: per-regional feeder check and finals queries."""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        if not has_sectional_data(conn, year, gender):
+            return []
+        results = []
+        for regional_num in range(1, 9):
+            nums = _feeder_sectional_nums(regional_num)
+            placeholders = ",".join("?" * len(nums))
+            present = {row[0] for row in conn.execute(
+                f"""SELECT DISTINCT m.meet_num FROM athlete_result ar JOIN meet m ON ar.meet_id = m.meet_id
+                    WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional' AND m.meet_num IN ({placeholders})""",
+                (year, gender, *nums),
+            )}
+            if len(present) < 4:
+                continue
+            individual = conn.execute(
+                f"""SELECT ar.event, s.school_id, s.school_name, ar.result2 FROM athlete_result ar
+                    JOIN athlete a ON ar.athlete_id = a.athlete_id JOIN school s ON a.school_id = s.school_id
+                    JOIN meet m ON ar.meet_id = m.meet_id
+                    WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional' AND m.meet_num IN ({placeholders})
+                      AND ar.result_type = 'Final' AND ar.result2 IS NOT NULL AND ar.result2 NOT IN (0, 9999)""",
+                (year, gender, *nums),
+            ).fetchall()
+            relays = conn.execute(
+                f"""SELECT rr.event, s.school_id, s.school_name, rr.result2 FROM relay_result rr
+                    JOIN school s ON rr.school_id = s.school_id JOIN meet m ON rr.meet_id = m.meet_id
+                    WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional' AND m.meet_num IN ({placeholders})
+                      AND rr.result2 IS NOT NULL AND rr.result2 NOT IN (0, 9999)""",
+                (year, gender, *nums),
+            ).fetchall()
+            rows = _project_regional(individual, relays)
+            results.append({
+                "regional_num": regional_num,
+                "host": (hosts or {}).get(regional_num),
+                "rows": rows if top_n is None else rows[:top_n],
+            })
+        return results
+    finally:
+        conn.close()
+
+
+@contextmanager
+def count_statements():
+    """Count the SQL statements run on connections opened inside the block."""
+    statements = []
+    connect = sqlite3.connect
+
+    def traced_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+
+    sqlite3.connect = traced_connect
+    try:
+        yield statements
+    finally:
+        sqlite3.connect = connect
+
+
+print("=" * 70)
+print("Single-load predictions vs. per-regional queries")
+print("=" * 70)
+hosts = {num: f"Host {num}" for num in range(1, 9)}
+for year in (2023, 2024, 2025, 2026, 1999):
+    for gender in ("Boys", "Girls"):
+        for top_n in (None, 10):
+            expected = reference_predictions(year, gender, top_n=top_n, hosts=hosts)
+            assert get_regional_predictions(year, gender, top_n=top_n, hosts=hosts) == expected, (year, gender, top_n)
+        reference = {entry["regional_num"]: entry for entry in reference_predictions(year, gender)}
+        for regional_num in range(1, 9):
+            assert get_regional_prediction(year, gender, regional_num) == reference.get(regional_num), (year, gender, regional_num)
+        print(f"  {year} {gender}: {len(reference)} regionals OK")
+
+print("\n" + "=" * 70)
+print("Statements per call")
+print("=" * 70)
+regional_predictions._season_cache.clear()
+start = time.perf_counter()
+with count_statements() as cold:
+    get_regional_predictions(2025, "Boys")
+cold_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+with count_statements() as warm:
+    predictions = get_regional_predictions(2025, "Boys")
+warm_ms = (time.perf_counter() - start) * 1000
+print(f"  cold: {len(cold)} statements, {cold_ms:.1f} ms   warm: {len(warm)} statements, {warm_ms:.1f} ms")
+assert len(cold) <= 4 and len(warm) <= 2
+
+# Callers may edit what they get back without touching the cache.
+predictions[0]["rows"][0]["team"] = "Edited"
+assert get_regional_predictions(2025, "Boys")[0]["rows"][0]["team"] != "Edited"
+
+print("\n" + "=" * 70)
+print("A new meet invalidates the cache")
+print("=" * 70)
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy(DB_PATH, db_path)
+    before = get_regional_predictions(2026, "Boys", top_n=None, db_path=db_path)
+    conn = sqlite3.connect(db_path)
+    # Move sectional 1's results to a new meet row; regional 1 loses a feeder.
+    conn.execute("INSERT INTO meet (host, meet_type, meet_num, year, gender) VALUES ('Test', 'Sectional', 99, 2026, 'Boys')")
+    new_meet_id = conn.execute("SELECT MAX(meet_id) FROM meet").fetchone()[0]
+    conn.execute(
+        "UPDATE athlete_result SET meet_id = ? WHERE meet_id = "
+        "(SELECT meet_id FROM meet WHERE year = 2026 AND gender = 'Boys' AND meet_type = 'Sectional' AND meet_num = 1)",
+        (new_meet_id,),
+    )
+    conn.commit()
+    conn.close()
+    after = get_regional_predictions(2026, "Boys", top_n=None, db_path=db_path)
+    assert any(e["regional_num"] == 1 for e in before) and not any(e["regional_num"] == 1 for e in after)
+    print(f"  regionals before: {[e['regional_num'] for e in before]}  after: {[e['regional_num'] for e in after]}")
+
+print("\nAll regional prediction cache checks passed.")
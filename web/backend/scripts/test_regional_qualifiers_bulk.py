@@ -0,0 +1,184 @@
+"""
+Parity check for the bulk regional/state qualifier path.
+Run from backend/scripts directory: python test_regional_qualifiers_bulk.py
+
+get_all_regional_qualifiers / get_state_qualifiers load every feeder result
+in two queries and partition them in memory. This compares each event's
+qualifier list against the original per-event query path
+(_compute_event_qualifiers without preloaded rows) for every regional,
+both genders, and the state meet. Then checks that a failing feeder
+load only drops its own regional, and that cached payloads are served
+without reading the result tables and are rebuilt after an ingest or a
+host registry change (against a temp copy of Track.db).
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from sqlalchemy import event, text  # noqa: E402
+
+from config import DATABASE_PATH, Config  # noqa: E402
+from backend import create_app, db  # noqa: E402
+from backend import queries  # noqa: E402
+from backend.models import TournamentHost  # noqa: E402
+from backend.queries import (  # noqa: E402
+    CURRENT_QUALIFIER_YEAR,
+    REGIONAL_SECTIONAL_GROUPS,
+    _compute_event_qualifiers,
+    _compute_regional_qualifiers,
+    _regional_group_status,
+    _state_target_field_size,
+    get_all_regional_qualifiers,
+    get_regional_qualifiers,
+    get_state_qualifiers,
+)
+
+
+def _strip_generated_at(payload):
+    context = {k: v for k, v in payload["context"].items() if k != "generated_at"}
+    return {**payload, "context": context}
+
+
+app = create_app()
+with app.app_context():
+    year = CURRENT_QUALIFIER_YEAR
+    checked_events = 0
+
+    for gender in ("Boys", "Girls"):
+        print("=" * 70)
+        print(f"{year} {gender}: regional qualifiers")
+        print("=" * 70)
+        bulk = get_all_regional_qualifiers(gender, year)
+        status_map = {row["regional_num"]: row for row in _regional_group_status(year, gender)["regionals"]}
+        assert sorted(bulk) == sorted(REGIONAL_SECTIONAL_GROUPS), "every regional should be returned"
+
+        for regional_num, payload in sorted(bulk.items()):
+            single = _compute_regional_qualifiers(gender, regional_num, year)
+            assert _strip_generated_at(single) == _strip_generated_at(payload), (
+                f"Regional {regional_num}: bulk payload differs from the single-regional path"
+            )
+
+            context = payload["context"]
+            feeders = REGIONAL_SECTIONAL_GROUPS[regional_num]
+            if context["status"] != "ready":
+                feeders = tuple(set(feeders).intersection(status_map[regional_num]["loaded_sectionals"]))
+
+            for event_block in payload["events"]:
+                expected = _compute_event_qualifiers(event_block["event"], gender, year, feeders)
+                assert event_block["qualifiers"] == expected, (
+                    f"Regional {regional_num} {event_block['event']}: bulk rows differ from per-event query"
+                )
+                checked_events += 1
+            print(f"  Regional {regional_num}: {context['status']:<8} events={len(payload['events'])}  OK")
+
+        print(f"\n{year} {gender}: state qualifiers")
+        state = get_state_qualifiers(gender, year)
+        regional_nums = tuple(sorted(REGIONAL_SECTIONAL_GROUPS.keys()))
+        for event_block in state["events"]:
+            expected = _compute_event_qualifiers(
+                event_block["event"],
+                gender,
+                year,
+                regional_nums,
+                source_meet_type="Regional",
+                target_field_size=_state_target_field_size(year),
+            )
+            assert event_block["qualifiers"] == expected, (
+                f"State {event_block['event']}: bulk rows differ from per-event query"
+            )
+            checked_events += 1
+        print(f"  State: {state['context']['status']:<8} events={len(state['events'])}  OK\n")
+
+    print(f"All {checked_events} event lists match the per-event query path.")
+
+    print("\n" + "=" * 70)
+    print("A failing feeder load drops only its regional")
+    print("=" * 70)
+    app.config["QUALIFIER_CACHE_PATH"] = ""  # force every regional through the loader
+    gender = "Boys"
+    expected = get_all_regional_qualifiers(gender, year)
+    broken_feeders = set(REGIONAL_SECTIONAL_GROUPS[3])
+    real_fetch = queries._fetch_qualifier_rows_by_event
+
+    def failing_fetch(gender, year, feeder_meet_nums, source_meet_type="Sectional"):
+        if broken_feeders & set(feeder_meet_nums):
+            raise RuntimeError("simulated feeder failure")
+        return real_fetch(gender, year, feeder_meet_nums, source_meet_type)
+
+    with mock.patch.object(queries, "_fetch_qualifier_rows_by_event", failing_fetch):
+        partial = get_all_regional_qualifiers(gender, year)
+    assert sorted(partial) == [num for num in sorted(expected) if num != 3], sorted(partial)
+    for regional_num, payload in partial.items():
+        assert _strip_generated_at(payload) == _strip_generated_at(expected[regional_num]), regional_num
+    print(f"  Regional 3 left out; the other {len(partial)} regionals unchanged")
+
+
+print("\n" + "=" * 70)
+print("Cache hits skip the result tables; ingests and host changes invalidate")
+print("=" * 70)
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy2(DATABASE_PATH, db_path)
+
+    class CacheConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        QUALIFIER_CACHE_PATH = os.path.join(tmp_dir, "qualifier_cache.db")
+        ARTIFACT_STORE_PATH = ''
+
+    cache_app = create_app(CacheConfig)
+    with cache_app.app_context():
+        year = CURRENT_QUALIFIER_YEAR
+        gender = "Girls"
+        first = get_regional_qualifiers(gender, 1, year)
+
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", record)
+        try:
+            assert get_regional_qualifiers(gender, 1, year) == first
+            assert sorted(get_all_regional_qualifiers(gender, year)) == sorted(REGIONAL_SECTIONAL_GROUPS)
+            get_state_qualifiers(gender, year)
+            statements.clear()
+            get_all_regional_qualifiers(gender, year)
+            get_state_qualifiers(gender, year)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", record)
+        result_reads = [sql for sql in statements if "athlete_result" in sql or "relay_result" in sql]
+        assert not result_reads, result_reads
+        print(f"  warm bulk + state lookups: {len(statements)} queries, none on the result tables")
+
+        # A renamed athlete, committed the way the loaders do (row + ingest counter).
+        qualifier = first["events"][0]["qualifiers"][0]
+        db.session.execute(
+            text("UPDATE athlete SET first = 'Renamed' WHERE athlete_id = :aid"),
+            {"aid": qualifier["athlete_id"]},
+        )
+        db.session.execute(text(
+            "INSERT INTO ingest_state (key, counter) VALUES ('results', 1) "
+            "ON CONFLICT(key) DO UPDATE SET counter = counter + 1"
+        ))
+        db.session.commit()
+        renamed = get_regional_qualifiers(gender, 1, year)["events"][0]["qualifiers"][0]
+        assert renamed["athlete_id"] == qualifier["athlete_id"] and "Renamed" in renamed["name"], renamed
+        print(f"  rename after ingest: {qualifier['name']!r} -> {renamed['name']!r}")
+
+        before = queries._qualifier_fingerprint(gender, year)
+        db.session.add(TournamentHost(year=year, gender=gender, meet_type="Regional", meet_num=99, host="New Host"))
+        db.session.commit()
+        with cache_app.app_context():  # registry lookups are memoized per app context
+            after = queries._qualifier_fingerprint(gender, year)
+        assert after != before, "a host registry change must invalidate the cached payloads"
+        print("  host registry change -> new fingerprint")
+        db.session.remove()
+
+print("\nAll qualifier cache checks passed.")
@@ -0,0 +1,126 @@
+"""
+Parity check for the statewide school power rankings.
+Run from backend/scripts directory: python test_school_rankings.py
+
+compute_school_rankings scores every school in one vectorized pass. Each
+school's per-event percentile must equal the school dashboard's
+_compute_school_percentiles for the same scope, checked for a sample of
+schools in the all-seasons scope and every season. Also checks the cached
+live fallback, the /api/schools/rankings year validation, and that the
+route serves a precomputed file only while its data version is current
+(against a temp copy of Track.db and a temp artifact store).
+"""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from unittest import mock
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import DATABASE_PATH, Config  # noqa: E402
+from backend import create_app, db  # noqa: E402
+from backend.queries import _compute_school_percentiles, bump_ingest_counter  # noqa: E402
+import precompute_school_rankings  # noqa: E402
+from school_rankings import compute_school_rankings, get_available_ranking_years, get_school_rankings  # noqa: E402
+
+
+class TestConfig(Config):
+    QUALIFIER_CACHE_PATH = ''
+    ARTIFACT_STORE_PATH = ''
+
+
+app = create_app(TestConfig)
+years = get_available_ranking_years()
+
+print("=" * 70)
+print("Per-event percentiles == school dashboard")
+print("=" * 70)
+rng = random.Random(5)
+checked_rows = 0
+start = time.perf_counter()
+with app.app_context():
+    for year in [None] + years:
+        rankings = compute_school_rankings(year=year)
+        by_school = {
+            (gender, row["school_id"]): row for gender, rows in rankings.items() for row in rows
+        }
+        school_ids = sorted({school_id for _gender, school_id in by_school})
+        for school_id in rng.sample(school_ids, 10):
+            for dashboard_row in _compute_school_percentiles(school_id, year):
+                ranked = by_school[(dashboard_row["gender"], school_id)]
+                actual = ranked["events"][dashboard_row["event"]]
+                assert actual == dashboard_row["state_percentile"], (
+                    year, school_id, dashboard_row["gender"], dashboard_row["event"],
+                    actual, dashboard_row["state_percentile"],
+                )
+                checked_rows += 1
+        for gender, rows in rankings.items():
+            assert [row["rank"] for row in rows] == sorted(row["rank"] for row in rows), (year, gender)
+assert checked_rows
+print(f"  {checked_rows} school/event percentiles OK across {len(years) + 1} scopes "
+      f"in {time.perf_counter() - start:.1f}s")
+
+print("\n" + "=" * 70)
+print("Live fallback cache and /api/schools/rankings")
+print("=" * 70)
+year = years[0]
+start = time.perf_counter()
+first = get_school_rankings(year=year)
+cold = time.perf_counter() - start
+start = time.perf_counter()
+assert get_school_rankings(year=year) is first
+warm = time.perf_counter() - start
+print(f"  live rankings for {year}: {cold * 1000:.0f} ms cold, {warm * 1000:.1f} ms cached")
+
+client = app.test_client()
+response = client.get("/api/schools/rankings", query_string={"gender": "Girls", "year": year})
+assert response.status_code == 200, response.status_code
+assert response.get_json()["rows"], "expected ranked schools"
+missing_year = min(years) - 1
+assert client.get("/api/schools/rankings", query_string={"year": missing_year}).status_code == 404
+assert client.get("/api/schools/rankings", query_string={"year": 1999}).status_code == 400
+assert client.get("/api/schools/rankings", query_string={"gender": "Coed"}).status_code == 400
+print(f"  {year} served; {missing_year} -> 404, 1999 and Coed -> 400")
+
+print("\n" + "=" * 70)
+print("Precomputed files are served only while current")
+print("=" * 70)
+with tempfile.TemporaryDirectory() as tmp_dir:
+    db_path = os.path.join(tmp_dir, "Track.db")
+    shutil.copy2(DATABASE_PATH, db_path)
+
+    class StoreConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{db_path}"
+        QUALIFIER_CACHE_PATH = ''
+        ARTIFACT_STORE_PATH = os.path.join(tmp_dir, "store")
+
+    store_app = create_app(StoreConfig)
+    with mock.patch.object(precompute_school_rankings, "create_app", lambda: store_app), \
+            mock.patch.object(Config, "ARTIFACT_STORE_PATH", StoreConfig.ARTIFACT_STORE_PATH):
+        precompute_school_rankings.main()
+
+    client = store_app.test_client()
+    query = {"gender": "Boys", "year": year}
+    response = client.get("/api/schools/rankings", query_string=query)
+    assert response.status_code == 200, response.status_code
+    assert "Last-Modified" in response.headers, "expected the precomputed file"
+    precomputed = response.get_json()
+    assert precomputed["rows"] == get_school_rankings(year=year)["Boys"]
+
+    with store_app.app_context():
+        bump_ingest_counter()
+        db.session.commit()
+    response = client.get("/api/schools/rankings", query_string=query)
+    assert response.status_code == 200, response.status_code
+    assert "Last-Modified" not in response.headers, "stale file served after an ingest"
+    assert response.get_json()["rows"] == precomputed["rows"]
+    print(f"  {year} Boys: file served at its data version, live rankings after an ingest bump")
+
+
+print("\nAll school ranking checks passed.")
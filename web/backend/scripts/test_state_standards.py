@@ -0,0 +1,112 @@
+"""
+Parity check for the compiled state standard table.
+Run from backend/scripts directory: python test_state_standards.py
+
+standards_util parses every standard once into _STATE_STANDARD_TABLE and
+compares whole columns of marks with meets_state_standard_many. The
+references below are the per-row functions it replaced, which parsed the
+display string on every call. For every season, gender and event (relays,
+the other gender's hurdles and unknown events included) the table entry
+must match the reference threshold and direction, and the vectorized check
+must agree with the per-row one mark by mark.
+"""
+
+import math
+import os
+import sys
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.util import standards_util  # noqa: E402
+from backend.util.standards_util import (  # noqa: E402
+    CONVERSION,
+    get_state_standard_entry,
+    meets_state_standard,
+    meets_state_standard_many,
+)
+from util.const_util import CONST  # noqa: E402
+
+EVENTS = [event for group in CONST.EVENT.ALL_BOYS_EVENTS + [CONST.EVENT.ALL_GIRLS_HURDLES] for event in group]
+UNKNOWN_EVENTS = ["Javelin", "Shott Put", "4 x 200 Relay", ""]
+YEARS = sorted(standards_util._STATE_STANDARD_VALUES) + [None, 1999, "2025", "soon"]
+GENDERS = ["Boys", "Girls", " girls ", "Coed", None]
+
+
+def reference_standard(gender, event_name, year=None):
+    """get_state_standard before the table: parse the display string per call."""
+    year_values = standards_util._STATE_STANDARD_VALUES.get(standards_util._resolve_standard_year(year), {})
+    clean_gender = (gender or "").strip().title()
+    if clean_gender not in year_values:
+        return None
+    raw_value = year_values[clean_gender].get(event_name)
+    if raw_value is None:
+        return None
+    if standards_util._is_field_event(event_name):
+        return CONVERSION.distance_to_inches(raw_value)
+    return CONVERSION.time_to_seconds(raw_value)
+
+
+def reference_meets(result2, gender, event_name, event_type, year=None):
+    standard = reference_standard(gender, event_name, year=year)
+    if standard is None:
+        return False
+    if event_type == "Field":
+        return result2 >= standard
+    return result2 <= standard
+
+
+def event_type_of(event_name):
+    if event_name in CONST.EVENT.ALL_FIELD:
+        return "Field"
+    return "Relay" if "Relay" in event_name else "Track"
+
+
+def sample_marks(standard):
+    """Marks on, just either side of and well away from ``standard``, plus a missing one."""
+    base = standard if standard is not None else 60.0
+    return [base, base - 0.01, base + 0.01, base * 0.8, base * 1.2, 1.0, 10000.0, math.nan]
+
+
+print("=" * 70)
+print("Table entries == per-call parse")
+print("=" * 70)
+entries = with_standard = 0
+for year in YEARS:
+    for gender in GENDERS:
+        for event_name in EVENTS + UNKNOWN_EVENTS:
+            expected = reference_standard(gender, event_name, year=year)
+            entry = get_state_standard_entry(gender, event_name, year=year)
+            if expected is None:
+                assert entry is None, (year, gender, event_name, entry)
+            else:
+                assert entry == (expected, event_type_of(event_name) != "Field"), (year, gender, event_name, entry)
+                with_standard += 1
+            entries += 1
+assert with_standard
+print(f"  {entries} lookups, {with_standard} with a standard")
+
+print("\n" + "=" * 70)
+print("meets_state_standard_many == per-row meets_state_standard")
+print("=" * 70)
+checked = 0
+for year in YEARS:
+    for gender in GENDERS:
+        for event_name in EVENTS + UNKNOWN_EVENTS:
+            marks = sample_marks(reference_standard(gender, event_name, year=year))
+            for event_type in (event_type_of(event_name), "Field", "Track"):
+                expected = [reference_meets(mark, gender, event_name, event_type, year=year) for mark in marks]
+                assert [meets_state_standard(mark, gender, event_name, event_type, year=year) for mark in marks] == expected
+                actual = meets_state_standard_many(marks, gender, event_name, event_type, year=year)
+                assert actual.tolist() == expected, (year, gender, event_name, event_type, marks, actual)
+                checked += len(marks)
+            # Without event_type the compiled direction must match the event's own type.
+            expected = [reference_meets(mark, gender, event_name, event_type_of(event_name), year=year) for mark in marks]
+            assert meets_state_standard_many(marks, gender, event_name, year=year).tolist() == expected
+            checked += len(marks)
+assert meets_state_standard_many([], "Boys", "100 Meters", "Track").shape == (0,)
+print(f"  {checked} marks agree across {len(YEARS)} years, {len(GENDERS)} genders, "
+      f"{len(EVENTS)} events and {len(UNKNOWN_EVENTS)} unknown events")
+
+print("\nAll state standard checks passed.")
@@ -0,0 +1,150 @@
+"""
+Test the qualifier status SSE stream against a temporary database.
+Run from backend/scripts directory: python test_status_stream.py
+
+Opens two streams, checks both get the initial status event, then loads a
+sectional meet and bumps the ingest counter and checks both streams are
+pushed the new status, built once by the shared notifier. Checks that
+streams past STATUS_STREAM_MAX get a 503 and a closed stream frees its
+slot, that /status answers 304 for a current ETag, and that the
+per-process status cache stays bounded whatever years are requested.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import Config  # noqa: E402
+from backend import create_app, db  # noqa: E402
+from backend.models import IngestState, Meet  # noqa: E402
+from backend import queries, status_stream  # noqa: E402
+from backend.status_stream import status_notifier  # noqa: E402
+
+
+def read_event(chunks):
+    """Return the next ``status`` event payload, skipping keepalive comments."""
+    for chunk in chunks:
+        text = chunk.decode("utf-8") if isinstance(chunk, bytes) else chunk
+        if text.startswith("event: status"):
+            data_line = next(line for line in text.splitlines() if line.startswith("data: "))
+            return json.loads(data_line[len("data: "):])
+    raise AssertionError("stream ended without a status event")
+
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp_dir, 'Track.db')}"
+        QUALIFIER_CACHE_PATH = ''
+        STATUS_STREAM_MAX = 2
+
+    app = create_app(TestConfig)
+    status_notifier.poll_interval = 0.1
+    client = app.test_client()
+
+    print("=" * 70)
+    print("Bad parameters are rejected before streaming")
+    print("=" * 70)
+    response = client.get('/api/regional-qualifiers/status/stream?gender=Coed')
+    assert response.status_code == 400, response.status_code
+    print("  gender=Coed ->", response.status_code)
+
+    print("\nInitial status event on connect")
+    responses = [
+        client.get('/api/regional-qualifiers/status/stream?gender=Boys&year=2026', buffered=False)
+        for _ in range(2)
+    ]
+    streams = [iter(response.response) for response in responses]
+    initial = [read_event(stream) for stream in streams]
+    assert all(payload["completed_sectionals"] == 0 for payload in initial), initial
+    print("  completed_sectionals:", [payload["completed_sectionals"] for payload in initial])
+
+    print("\nIngest pushes one build to every open stream")
+    while status_notifier.version is None:  # let the notifier record the starting version
+        time.sleep(0.01)
+    key = ("get_regional_qualifiers_status", "Boys", 2026)
+    entry = status_notifier._subscribers[key]
+    assert entry["streams"] == 2, entry
+    builds = []
+    real_build = entry["build"]
+
+    def counting_build():
+        builds.append(key)
+        return real_build()
+
+    entry["build"] = counting_build
+    pushed = [None, None]
+
+    def wait_for_push(index):
+        pushed[index] = read_event(streams[index])
+
+    readers = [threading.Thread(target=wait_for_push, args=(i,), daemon=True) for i in range(2)]
+    for reader in readers:
+        reader.start()
+
+    with app.app_context():
+        db.session.add(Meet(host="Chesterton", meet_type="Sectional", meet_num=1, gender="Boys", year=2026))
+        db.session.add(IngestState(key="results", counter=1))
+        db.session.commit()
+
+    for reader in readers:
+        reader.join(timeout=10)
+    assert all(payload is not None for payload in pushed), "stream was not notified"
+    assert all(payload["completed_sectionals"] == 1 for payload in pushed), pushed
+    assert pushed[0]["data_version"] != initial[0]["data_version"]
+    assert builds == [key], builds
+    print("  completed_sectionals:", [payload["completed_sectionals"] for payload in pushed])
+    print("  data_version:", initial[0]["data_version"], "->", pushed[0]["data_version"])
+    print("  status builds for 2 streams:", len(builds))
+
+    print("\nStreams past the cap are refused; closing one frees its slot")
+    refused = client.get('/api/regional-qualifiers/status/stream?gender=Girls&year=2026')
+    assert refused.status_code == 503, refused.status_code
+    responses[1].close()
+    assert status_notifier.open_streams == 1, status_notifier.open_streams
+    assert status_notifier._subscribers[key]["streams"] == 1
+    print("  third stream ->", refused.status_code, "| after close, open streams:", status_notifier.open_streams)
+
+    print("\nStatus polls are conditional on the data version")
+    status = client.get('/api/regional-qualifiers/status?gender=Boys&year=2026')
+    assert status.status_code == 200 and status.headers["ETag"] == f'"{pushed[0]["data_version"]}"', status.headers
+    not_modified = client.get(
+        '/api/regional-qualifiers/status?gender=Boys&year=2026',
+        headers={'If-None-Match': status.headers["ETag"]},
+    )
+    assert not_modified.status_code == 304 and not not_modified.data, not_modified.status_code
+    print("  If-None-Match", status.headers["ETag"], "->", not_modified.status_code)
+
+    print("\nReconnecting with Last-Event-ID skips the unchanged status")
+    status_notifier.poll_interval = 60
+    status_stream.KEEPALIVE_SECONDS = 0.2
+    response = client.get(
+        '/api/regional-qualifiers/status/stream?gender=Boys&year=2026',
+        headers={'Last-Event-ID': pushed[0]["data_version"]},
+        buffered=False,
+    )
+    first_chunk = next(iter(response.response))
+    assert not first_chunk.decode("utf-8").startswith("event: status"), first_chunk
+    print("  first chunk:", first_chunk.decode("utf-8").strip() or "(empty)")
+    for open_response in (responses[0], response):
+        open_response.close()
+    assert status_notifier.open_streams == 0 and not status_notifier._subscribers
+
+    print("\nThe status cache keeps only the most recently used years")
+    for year in range(2000, 2000 + queries._STATUS_CACHE_SIZE + 20):
+        assert client.get(f'/api/regional-qualifiers/status?gender=Girls&year={year}').status_code == 200
+    assert client.get('/api/regional-qualifiers/status?gender=Boys&year=2026').status_code == 200
+    assert len(queries._STATUS_CACHE) == queries._STATUS_CACHE_SIZE, len(queries._STATUS_CACHE)
+    assert next(reversed(queries._STATUS_CACHE)) == ("regional", "Boys", 2026)
+    print(f"  {queries._STATUS_CACHE_SIZE + 21} keys requested -> {len(queries._STATUS_CACHE)} cached")
+
+    with app.app_context():
+        db.engine.dispose()
+
+print("\nAll status stream checks passed.")
@@ -0,0 +1,231 @@
+"""
+Checks for the incremental what-if scorer.
+Run from backend/scripts directory: python test_what_if.py
+
+what_if keeps each projected meet placed in memory and only re-places the
+events a scenario touches. A scenario with no changes must reproduce the
+regional/state predictions, and random scenarios (edited marks, scratches,
+added entries) must match a full rescore of the edited entry list with
+meet_scoring. Finishes with the /api/what-if endpoints.
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+WEB_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from config import Config  # noqa: E402
+from backend import create_app  # noqa: E402
+from meet_scoring import TIE_SEQUENTIAL, rank_teams, score_meet  # noqa: E402
+from meet_simulation import _fetch_entries  # noqa: E402
+from regional_predictions import DB_PATH, _feeder_sectional_nums, get_regional_prediction  # noqa: E402
+from state_predictions import get_state_predictions  # noqa: E402
+from what_if import get_what_if_meet, parse_mark, what_if  # noqa: E402
+
+
+def strip_ids(rows):
+    return [{key: row[key] for key in ("place", "team", "score")} for row in rows]
+
+
+def full_rescore(entries, points_by_place, changes, school_names):
+    """Apply ``changes`` to the raw entry list and score the whole meet again."""
+    entries = list(entries)
+    for change in changes:
+        event = change["event"]
+        if change.get("athlete_id") is not None:
+            entrant = ("athlete", change["athlete_id"])
+        elif "Relay" in event:
+            entrant = ("relay", change["school_id"])
+        else:
+            entrant = ("added", change.get("name"))
+        if change["action"] in ("mark", "scratch"):
+            index = next(i for i, row in enumerate(entries) if row[0] == event and row[3] == entrant)
+            _event, sid, name, _entrant, _mark = entries.pop(index)
+            if change["action"] == "mark":
+                entries.append((event, sid, name, entrant, parse_mark(event, change["mark"])))
+        else:
+            sid = change["school_id"]
+            entries.append((event, sid, school_names[sid], entrant, parse_mark(event, change["mark"])))
+    events, school_ids, names, _entrants, marks = zip(*entries)
+    totals = score_meet(events, school_ids, marks, points_by_place, tie_policy=TIE_SEQUENTIAL, names=names)
+    return rank_teams(totals, school_names)
+
+
+def random_changes(meet, rng, count):
+    changes = []
+    used = set()
+    for _ in range(count):
+        event = rng.choice(meet.events)
+        entries = [row for row in meet.event_rows(event) if (event, row["athlete_id"], row["school_id"]) not in used]
+        action = rng.choice(("mark", "scratch", "add"))
+        if action == "add":
+            school_id = rng.choice(sorted(meet.school_names))
+            if "Relay" in event:
+                if any(row["school_id"] == school_id for row in meet.event_rows(event)):
+                    continue
+                used.add((event, None, school_id))
+            mark = rng.choice(entries)["result2"] if entries else 100.0
+            changes.append({"action": "add", "event": event, "school_id": school_id,
+                            "mark": round(mark * rng.uniform(0.97, 1.03), 2), "name": f"Added {len(changes)}"})
+            continue
+        if not entries:
+            continue
+        target = rng.choice(entries)
+        used.add((event, target["athlete_id"], target["school_id"]))
+        change = {"action": action, "event": event}
+        if target["athlete_id"] is not None:
+            change["athlete_id"] = target["athlete_id"]
+        else:
+            change["school_id"] = target["school_id"]
+        if action == "mark":
+            # Sometimes copy another entry's mark exactly to exercise the alphabetical tie-break.
+            other = rng.choice(entries)["result2"]
+            change["mark"] = other if rng.random() < 0.3 else round(target["result2"] * rng.uniform(0.95, 1.05), 2)
+        changes.append(change)
+    return changes
+
+
+print("=" * 70)
+print("Marks")
+print("=" * 70)
+assert parse_mark("1600 Meters", "4:21.50") == 261.5
+assert parse_mark("Shot Put", "48' 6\"") == 582.0
+assert parse_mark("100 Meters", 10.9) == 10.9 and parse_mark("100 Meters", "10.90") == 10.9
+for bad in (None, True, "fast", 0, -3):
+    try:
+        parse_mark("100 Meters", bad)
+    except ValueError:
+        continue
+    raise AssertionError(f"accepted {bad!r}")
+print("  numeric, formatted and invalid marks OK")
+
+conn = sqlite3.connect(DB_PATH)
+years = [row[0] for row in conn.execute("SELECT DISTINCT year FROM meet ORDER BY year")]
+
+print("\n" + "=" * 70)
+print("No changes == predictions; random scenarios == full rescore")
+print("=" * 70)
+rng = random.Random(7)
+meets_checked = scenarios = 0
+incremental_seconds = full_seconds = 0.0
+for year in years:
+    for gender in ("Boys", "Girls"):
+        targets = [("Regional", num) for num in range(1, 9)] + [("State", None)]
+        for meet_type, regional_num in targets:
+            meet = get_what_if_meet(meet_type, year, gender, regional_num=regional_num)
+            if meet_type == "Regional":
+                predicted = get_regional_prediction(year, gender, regional_num)
+                if predicted is None:
+                    assert meet is None
+                    continue
+                expected_rows = predicted["rows"]
+                entries = _fetch_entries(conn, year, gender, "Sectional", _feeder_sectional_nums(regional_num))
+            else:
+                predicted = get_state_predictions(year, gender)
+                if not predicted["ready"]:
+                    assert meet is None
+                    continue
+                expected_rows = predicted["rows"]
+                entries = _fetch_entries(conn, year, gender, "Regional")
+            assert strip_ids(meet.rows) == expected_rows, f"{year} {gender} {meet_type} {regional_num} baseline"
+            assert what_if(meet_type, year, gender, [], regional_num=regional_num)["rows"] == [
+                dict(row, delta=0.0) for row in meet.rows
+            ]
+            meets_checked += 1
+
+            for _ in range(15):
+                changes = random_changes(meet, rng, rng.randint(1, 6))
+                start = time.perf_counter()
+                result = meet.rescore(changes)
+                incremental_seconds += time.perf_counter() - start
+                start = time.perf_counter()
+                expected = full_rescore(entries, meet.points_by_place, changes, meet.school_names)
+                full_seconds += time.perf_counter() - start
+                assert strip_ids(result["rows"]) == expected, f"{year} {gender} {meet_type} {regional_num}: {changes}"
+                assert set(result["events"]) == {change["event"] for change in changes}
+                scenarios += 1
+conn.close()
+assert meets_checked and scenarios
+print(f"  {meets_checked} meets, {scenarios} scenarios OK")
+print(f"  incremental {incremental_seconds / scenarios * 1000:.3f} ms/scenario, "
+      f"full rescore {full_seconds / scenarios * 1000:.3f} ms/scenario")
+
+print("\n" + "=" * 70)
+print("Bad changes")
+print("=" * 70)
+meet = next(
+    get_what_if_meet("Regional", year, gender, regional_num=num)
+    for year in reversed(years) for gender in ("Boys", "Girls") for num in range(1, 9)
+    if get_what_if_meet("Regional", year, gender, regional_num=num) is not None
+)
+event = next(event for event in meet.events if "Relay" not in event)
+athlete_id = meet.event_rows(event)[0]["athlete_id"]
+school_id = meet.event_rows(event)[0]["school_id"]
+other_hurdles = "100 Hurdles" if meet.gender == "Boys" else "110 Hurdles"
+for changes in (
+    [{"action": "teleport", "event": event, "athlete_id": athlete_id}],
+    [{"action": "scratch", "athlete_id": athlete_id}],
+    [{"action": "scratch", "event": "Javelin", "athlete_id": athlete_id}],
+    [{"action": "scratch", "event": event, "athlete_id": -1}],
+    [{"action": "mark", "event": event, "athlete_id": athlete_id, "mark": "soon"}],
+    [{"action": "add", "event": event, "athlete_id": athlete_id, "mark": 11.0}],
+    [{"action": "add", "event": event, "school_id": -1, "mark": 11.0}],
+    [{"action": "add", "event": "Shott Put", "school_id": school_id, "mark": "48' 6\""}],
+    [{"action": "add", "event": other_hurdles, "school_id": school_id, "mark": 15.0}],
+    [{"action": "scratch", "event": event, "athlete_id": athlete_id}] * 2,
+):
+    try:
+        meet.rescore(changes)
+    except ValueError as exc:
+        print(f"  rejected: {exc}")
+        continue
+    raise AssertionError(f"accepted {changes}")
+assert strip_ids(meet.rescore([])["rows"]) == strip_ids(meet.rows), "base meet was modified"
+
+print("\n" + "=" * 70)
+print("/api/what-if")
+print("=" * 70)
+with tempfile.TemporaryDirectory() as tmp_dir:
+    class TestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp_dir, 'Track.db')}"
+        QUALIFIER_CACHE_PATH = ''
+        ARTIFACT_STORE_PATH = ''
+
+    client = create_app(TestConfig).test_client()
+    year, gender, regional_num = next(
+        (year, gender, num)
+        for year in reversed(years) for gender in ("Boys", "Girls") for num in range(1, 9)
+        if get_what_if_meet("Regional", year, gender, regional_num=num) is not None
+    )
+    query = {"meet": "Regional", "year": year, "gender": gender, "regional_num": regional_num}
+    listing = client.get("/api/what-if", query_string=query)
+    assert listing.status_code == 200, listing.status_code
+    listing = listing.get_json()
+    winner = listing["events"][0]["entries"][0]
+    key = {"athlete_id": winner["athlete_id"]} if winner["athlete_id"] else {"school_id": winner["school_id"]}
+    changes = [dict(action="scratch", event=listing["events"][0]["event"], **key)]
+    response = client.post("/api/what-if", json=dict(query, changes=changes))
+    assert response.status_code == 200, response.status_code
+    body = response.get_json()
+    assert body["baseline"] == listing["rows"]
+    assert list(body["events"]) == [listing["events"][0]["event"]]
+    remaining = body["events"][listing["events"][0]["event"]]
+    assert len(remaining) == len(listing["events"][0]["entries"]) - 1
+    assert all((row["athlete_id"], row["school_id"]) != (winner["athlete_id"], winner["school_id"]) for row in remaining)
+    print(f"  GET {len(listing['events'])} events, POST scratch -> {body['rows'][0]}")
+
+    assert client.get("/api/what-if", query_string=dict(query, gender="Coed")).status_code == 400
+    assert client.get("/api/what-if", query_string={"meet": "Regional", "year": year}).status_code == 400
+    assert client.get("/api/what-if", query_string=dict(query, regional_num=9)).status_code == 400
+    assert client.post("/api/what-if", json=dict(query, changes={"a": 1})).status_code == 400
+    assert client.post("/api/what-if", json=dict(query, changes=[{"action": "scratch"}])).status_code == 400
+    assert client.post("/api/what-if", json=[1, 2]).status_code == 400
+    print("  validation errors return 400")
+
+print("\nAll what-if checks passed.")
@@ -2,6 +2,19 @@ import sqlite3
 import pandas as pd
 from util.conversion_util import Conversion
 from decimal import Decimal, ROUND_HALF_UP, ROUND_DOWN
+
+
+def data_version(cursor):
+	# Changes whenever meets are loaded: max(meet_id), meet count and the loaders' ingest counter.
+	# Module-level so scripts holding a plain sqlite3 connection can key caches on it too.
+	max_meet_id, meet_count = cursor.execute("SELECT MAX(meet_id), COUNT(meet_id) FROM meet").fetchone()
+	try:
+		row = cursor.execute("SELECT counter FROM ingest_state WHERE key = 'results'").fetchone()
+	except sqlite3.OperationalError:
+		row = None
+	counter = row[0] if row else 0
+	return f"{max_meet_id or 0}.{meet_count or 0}.{counter or 0}"
+
 	
 class Database:
 	def __init__(self, db_path):
@@ -68,6 +81,59 @@ class Database:
 		df = pd.read_sql_query(query, self.conn)       
 		return df
 	
+	def get_athlete_result_marks(self):
+		# Only the columns the percentile report groups on, with empty/DNF marks (0, 9999) dropped.
+		query = "select athlete_result.athlete_id, athlete.gender, event, grade, result2, meet_type, meet.year \
+		from athlete_result \
+		inner join athlete on athlete_result.athlete_id = athlete.athlete_id \
+		inner join school on athlete.school_id = school.school_id \
+		inner join meet on meet.meet_id = athlete_result.meet_id \
+		inner join school_enrollment on athlete.school_id = school_enrollment.school_id and meet.year = school_enrollment.year \
+		where result2 is null or result2 not in (0, 9999)"
+		df = pd.read_sql_query(query, self.conn)
+		return df
+	
+	def get_relay_result_marks(self):
+		query = "select relay_result.school_id, meet.gender, event, result2, meet_type, meet.year \
+		from relay_result \
+		inner join school on relay_result.school_id = school.school_id \
+		inner join meet on meet.meet_id = relay_result.meet_id \
+		inner join school_enrollment on relay_result.school_id = school_enrollment.school_id and meet.year = school_enrollment.year \
+		where result2 is null or result2 not in (0, 9999)"
+		df = pd.read_sql_query(query, self.conn)
+		return df
+	
+	def get_feeder_athlete_marks(self, meet_type, meet_nums, year, gender, result_type):
+		# Same joins as get_all_athlete_results, narrowed in SQL to one projection's feeder meets.
+		placeholders = ",".join("?" * len(meet_nums))
+		query = f"select event, school.school_id, result2 \
+		from athlete_result \
+		inner join athlete on athlete_result.athlete_id = athlete.athlete_id \
+		inner join school on athlete.school_id = school.school_id \
+		inner join meet on meet.meet_id = athlete_result.meet_id \
+		inner join school_enrollment on athlete.school_id = school_enrollment.school_id and meet.year = school_enrollment.year \
+		where meet_type = ? and meet_num in ({placeholders}) and meet.year = ? and athlete.gender = ? and result_type = ? \
+		and (result2 is null or result2 not in (0, 9999))"
+		parameters = (meet_type, *meet_nums, year, gender, result_type)
+		df = pd.read_sql_query(query, self.conn, params=parameters)
+		return df
+	
+	def get_feeder_relay_marks(self, meet_type, meet_nums, year, gender):
+		placeholders = ",".join("?" * len(meet_nums))
+		query = f"select event, school.school_id, result2 \
+		from relay_result \
+		inner join school on relay_result.school_id = school.school_id \
+		inner join meet on meet.meet_id = relay_result.meet_id \
+		inner join school_enrollment on relay_result.school_id = school_enrollment.school_id and meet.year = school_enrollment.year \
+		where meet_type = ? and meet_num in ({placeholders}) and meet.year = ? and gender = ? \
+		and (result2 is null or result2 not in (0, 9999))"
+		parameters = (meet_type, *meet_nums, year, gender)
+		df = pd.read_sql_query(query, self.conn, params=parameters)
+		return df
+	
+	def get_data_version(self):
+		return data_version(self.cursor)
+	
 	def get_athlete_result(self, athlete_id, meet_id, event, result_type):
 		query = "select * from athlete_result where athlete_id = ? and meet_id = ? and event = ? and result_type = ?"
 		parameters = (athlete_id, meet_id, event, result_type)
@@ -193,6 +259,15 @@ class Database:
 		else:
 			return df.iloc[0,0]
 	
+	def get_school_names(self, school_ids):
+		# One query for a batch of ids instead of a get_school_name call per school.
+		school_ids = [int(school_id) for school_id in school_ids]
+		if not school_ids:
+			return {}
+		placeholders = ",".join("?" * len(school_ids))
+		query = f"SELECT school_id, school_name from school where school_id in ({placeholders})"
+		return dict(self.cursor.execute(query, school_ids).fetchall())
+	
 	def get_latitude(self, school_id):
 		query = "SELECT latitude FROM school where school_id = ?"
 		parameters = (school_id, )
@@ -0,0 +1,334 @@
+"""
+What-If Scoring
+
+Interactive re-scoring of a projected regional or state meet. The projected
+meet (the same feeder finals ``regional_predictions`` / ``state_predictions``
+score) is placed once and kept in memory per process: every event's entries
+in scored order plus each event's points per team. A scenario -- edited
+marks, scratches, added entries -- only re-places the events it touches and
+adjusts the team totals by the difference, so a request costs a few sorted
+inserts instead of a full meet rescore.
+
+Scoring follows the predictions: ``meet_scoring.TIE_SEQUENTIAL`` with ties
+broken alphabetically by school name, so a scenario with no changes returns
+exactly the predicted standings.
+
+A change is a dict:
+    {"action": "mark", "event": "1600 Meters", "athlete_id": 12, "mark": "4:21.50"}
+    {"action": "scratch", "event": "4 x 400 Relay", "school_id": 7}
+    {"action": "add", "event": "Shot Put", "school_id": 7, "mark": "48' 6\\"", "name": "J. Doe"}
+
+Individual entries are addressed by ``athlete_id`` and relays by
+``school_id``. Marks are seconds / inches, or strings such as "4:21.50" and
+"48' 6\\"". Added entries must belong to a school already in the meet and
+may open an event nobody entered, but only one of the gender's events.
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from bisect import insort
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WEB_DIR = os.path.abspath(os.path.join(HERE, '..', '..'))
+if WEB_DIR not in sys.path:
+    sys.path.insert(0, WEB_DIR)
+
+from backend.util.conversion_util import Conversion  # noqa: E402
+from meet_scoring import REGIONAL_POINTS, STATE_POINTS, is_track_like_event, rank_teams  # noqa: E402
+from meet_simulation import _fetch_entries  # noqa: E402
+from regional_predictions import DB_PATH, _feeder_sectional_nums  # noqa: E402
+from state_predictions import NUM_REGIONALS, _present_regionals  # noqa: E402
+from util.const_util import CONST  # noqa: E402
+from util.db_util import data_version  # noqa: E402
+
+MEET_TYPES = ("Regional", "State")
+ACTIONS = ("mark", "scratch", "add")
+
+# Events an "add" may open, per gender.
+GENDER_EVENTS = {
+    CONST.GENDER.BOYS: frozenset(event for group in CONST.EVENT.ALL_BOYS_EVENTS for event in group),
+    CONST.GENDER.GIRLS: frozenset(event for group in CONST.EVENT.ALL_GIRLS_EVENTS for event in group),
+}
+
+# Per-process base meets: {(db_path, meet_type, year, gender, regional_num): (data version, meet)}.
+_meet_cache = {}
+_meet_cache_lock = threading.Lock()
+
+
+def _entry(event, school_id, school_name, entrant, mark):
+    """Sortable entry: (signed mark, school name, school_id, entrant, mark)."""
+    signed = mark if is_track_like_event(event) else -mark
+    return (signed, school_name or "", school_id, entrant, mark)
+
+
+def _sort_key(entry):
+    return entry[:2]
+
+
+def parse_mark(event, value):
+    """Seconds / inches from a number or a formatted time or distance."""
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid mark for {event}: {value!r}")
+    if isinstance(value, (int, float)):
+        mark = float(value)
+    elif isinstance(value, str):
+        try:
+            mark = float(value)
+        except ValueError:
+            if is_track_like_event(event):
+                mark = Conversion.time_to_seconds(value)
+            else:
+                mark = Conversion.distance_to_inches(value)
+    else:
+        raise ValueError(f"Invalid mark for {event}: {value!r}")
+    if not mark > 0:
+        raise ValueError(f"Invalid mark for {event}: {value!r}")
+    return mark
+
+
+class WhatIfMeet:
+    """
+    A projected meet placed once, re-scored per scenario.
+
+    ``entries`` are ``(event, school_id, school_name, entrant, result2)``
+    rows as returned by ``meet_simulation._fetch_entries``; ``gender``
+    decides which uncontested events an added entry may open. The instance
+    is never modified by ``rescore``, so one cached meet serves every request.
+    """
+
+    def __init__(self, entries, points_by_place, gender, athlete_names=None):
+        if gender not in GENDER_EVENTS:
+            raise ValueError(f"gender must be one of {', '.join(GENDER_EVENTS)}")
+        self.gender = gender
+        self.points_by_place = dict(points_by_place)
+        self.athlete_names = athlete_names or {}
+        self.school_names = {}
+        by_event = defaultdict(list)
+        for event, school_id, school_name, entrant, mark in entries:
+            self.school_names.setdefault(school_id, school_name)
+            by_event[event].append(_entry(event, school_id, school_name, entrant, mark))
+
+        self._events = {}
+        self._event_points = {}
+        self.totals = defaultdict(float)
+        for event, rows in by_event.items():
+            rows.sort(key=_sort_key)
+            self._events[event] = rows
+            self._event_points[event] = self._score_event(rows)
+            for school_id, pts in self._event_points[event].items():
+                self.totals[school_id] += pts
+        self.rows = rank_teams(self.totals, self.school_names, include_school_id=True)
+
+    def _score_event(self, rows):
+        """``{school_id: points}`` for one event's entries in scored order."""
+        points = defaultdict(float)
+        for place, row in enumerate(rows, start=1):
+            pts = self.points_by_place.get(place)
+            if pts is None:
+                break
+            points[row[2]] += pts
+        return points
+
+    @property
+    def events(self):
+        return sorted(self._events)
+
+    def event_rows(self, event, rows=None):
+        """Scored entries of one event as ``{place, entrant, athlete_id, name, school_id, team, result2, points}``."""
+        rows = self._events.get(event, []) if rows is None else rows
+        output = []
+        for place, (_signed, _name, school_id, entrant, mark) in enumerate(rows, start=1):
+            kind, entrant_id = entrant
+            name = None
+            if kind == "athlete":
+                name = self.athlete_names.get(entrant_id)
+            elif kind == "added":
+                name = entrant_id
+            output.append({
+                "place": place,
+                "entrant": kind,
+                "athlete_id": entrant_id if kind == "athlete" else None,
+                "name": name,
+                "school_id": school_id,
+                "team": self.school_names.get(school_id, f"School #{school_id}"),
+                "result2": mark,
+                "points": self.points_by_place.get(place, 0),
+            })
+        return output
+
+    def _entrant(self, event, change, adding=False):
+        athlete_id = change.get("athlete_id")
+        if athlete_id is not None:
+            return ("athlete", int(athlete_id))
+        if "Relay" in event:
+            if change.get("school_id") is None:
+                raise ValueError(f"school_id is required for {event}")
+            return ("relay", int(change["school_id"]))
+        if adding:
+            return ("added", change.get("name") or "Added entry")
+        raise ValueError(f"athlete_id is required for {event}")
+
+    def _apply(self, rows, event, change):
+        """Apply one change to ``rows`` (a private copy of the event's entries)."""
+        action = change.get("action")
+        if action not in ACTIONS:
+            raise ValueError(f"action must be one of {', '.join(ACTIONS)}")
+        entrant = self._entrant(event, change, adding=action == "add")
+
+        index = next((i for i, row in enumerate(rows) if row[3] == entrant and entrant[0] != "added"), None)
+        if action == "add":
+            if index is not None:
+                raise ValueError(f"{entrant[0]} {entrant[1]} is already entered in {event}")
+            school_id = change.get("school_id")
+            if school_id is None and entrant[0] == "athlete":
+                # An athlete already in another event keeps their school.
+                school_id = next(
+                    (row[2] for entries in self._events.values() for row in entries if row[3] == entrant),
+                    None,
+                )
+            if school_id is None or int(school_id) not in self.school_names:
+                raise ValueError("school_id must be a school entered in this meet")
+            school_id = int(school_id)
+        else:
+            if index is None:
+                raise ValueError(f"{entrant[0]} {entrant[1]} is not entered in {event}")
+            school_id = rows.pop(index)[2]
+            if action == "scratch":
+                return
+
+        mark = parse_mark(event, change.get("mark"))
+        insort(rows, _entry(event, school_id, self.school_names[school_id], entrant, mark), key=_sort_key)
+
+    def rescore(self, changes):
+        """
+        Team standings after ``changes``.
+
+        Returns ``{"rows": [...], "events": {event: [...]}}``: ranked
+        ``{place, team, score, school_id, delta}`` rows, ``delta`` being the change from
+        the projected score, and the re-placed entries of every touched event.
+        Raises ValueError for a malformed change.
+        """
+        touched = {}
+        for change in changes:
+            if not isinstance(change, dict):
+                raise ValueError("each change must be an object")
+            event = change.get("event")
+            if not event:
+                raise ValueError("event is required for every change")
+            if event not in touched:
+                if event not in self._events:
+                    if change.get("action") != "add":
+                        raise ValueError(f"{event} is not contested in this meet")
+                    if event not in GENDER_EVENTS[self.gender]:
+                        raise ValueError(f"{event} is not a {self.gender} event")
+                touched[event] = list(self._events.get(event, []))
+            self._apply(touched[event], event, change)
+
+        totals = dict(self.totals)
+        for event, rows in touched.items():
+            for school_id, pts in self._event_points.get(event, {}).items():
+                totals[school_id] -= pts
+            for school_id, pts in self._score_event(rows).items():
+                totals[school_id] = totals.get(school_id, 0.0) + pts
+
+        rows = rank_teams(totals, self.school_names, include_school_id=True)
+        for row in rows:
+            row["delta"] = round(totals[row["school_id"]] - self.totals.get(row["school_id"], 0.0), 2)
+        return {
+            "rows": rows,
+            "events": {event: self.event_rows(event, entries) for event, entries in touched.items()},
+        }
+
+
+def _athlete_names(conn, entries):
+    athlete_ids = sorted({entrant[1] for _e, _s, _n, entrant, _m in entries if entrant[0] == "athlete"})
+    names = {}
+    for start in range(0, len(athlete_ids), 500):
+        chunk = athlete_ids[start:start + 500]
+        for athlete_id, first, last in conn.execute(
+            f"SELECT athlete_id, first, last FROM athlete WHERE athlete_id IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ):
+            names[athlete_id] = " ".join(part for part in (first, last) if part)
+    return names
+
+
+def _load_meet(conn, meet_type, year, gender, regional_num):
+    """The base ``WhatIfMeet``, or None while a feeder meet is missing."""
+    if meet_type == "Regional":
+        feeder_nums = _feeder_sectional_nums(regional_num)
+        present = {
+            row[0] for row in conn.execute(
+                f"""
+                SELECT DISTINCT m.meet_num FROM athlete_result ar
+                JOIN meet m ON ar.meet_id = m.meet_id
+                WHERE m.year = ? AND m.gender = ? AND m.meet_type = 'Sectional'
+                  AND m.meet_num IN ({','.join('?' * len(feeder_nums))})
+                """,
+                (year, gender, *feeder_nums),
+            )
+        }
+        if len(present) < len(feeder_nums):
+            return None
+        entries = _fetch_entries(conn, year, gender, "Sectional", feeder_nums)
+        points_by_place = REGIONAL_POINTS
+    else:
+        if len(_present_regionals(conn, year, gender) & set(range(1, NUM_REGIONALS + 1))) < NUM_REGIONALS:
+            return None
+        entries = _fetch_entries(conn, year, gender, "Regional")
+        points_by_place = STATE_POINTS
+    return WhatIfMeet(entries, points_by_place, gender, athlete_names=_athlete_names(conn, entries))
+
+
+def get_what_if_meet(meet_type, year, gender, regional_num=None, db_path=None):
+    """
+    The cached base meet for a regional (``regional_num`` 1-8) or the state
+    meet, rebuilt when the database's data version changes. Returns None
+    while a feeder meet is missing.
+    """
+    if meet_type not in MEET_TYPES:
+        raise ValueError(f"meet must be one of {', '.join(MEET_TYPES)}")
+    if meet_type == "Regional":
+        if regional_num not in range(1, NUM_REGIONALS + 1):
+            raise ValueError(f"regional_num must be between 1 and {NUM_REGIONALS}")
+    else:
+        regional_num = None
+
+    db_path = db_path or DB_PATH
+    key = (os.path.abspath(db_path), meet_type, year, gender, regional_num)
+    conn = sqlite3.connect(db_path)
+    try:
+        version = data_version(conn.cursor())
+        cached = _meet_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        with _meet_cache_lock:
+            cached = _meet_cache.get(key)
+            if cached is None or cached[0] != version:
+                cached = (version, _load_meet(conn, meet_type, year, gender, regional_num))
+                _meet_cache[key] = cached
+    finally:
+        conn.close()
+    return cached[1]
+
+
+def what_if(meet_type, year, gender, changes, regional_num=None, db_path=None):
+    """
+    Re-score a projected meet under ``changes`` (see module docstring).
+
+    Returns ``{"context", "baseline", "rows", "events"}`` (the projected
+    standings, the scenario standings and the touched events), or None
+    while a feeder meet is missing. Raises ValueError for bad input.
+    """
+    meet = get_what_if_meet(meet_type, year, gender, regional_num=regional_num, db_path=db_path)
+    if meet is None:
+        return None
+    result = meet.rescore(changes)
+    return {
+        "context": {"meet": meet_type, "year": year, "gender": gender, "regional_num": regional_num},
+        "baseline": [dict(row) for row in meet.rows],
+        **result,
+    }
@@ -0,0 +1,173 @@
+"""Server-Sent Events for qualifier status changes.
+
+One ``StatusNotifier`` per process watches ``qualifier_data_version()`` from a
+single background thread. When the version moves it builds the status payload
+once for every (kind, gender, year) with a stream open and broadcasts it, so
+the database sees one cheap version check per interval plus one build per
+change, no matter how many tabs are open.
+
+The app runs on sync (threaded) WSGI workers, where every open stream holds a
+worker thread until the tab closes. Streams are therefore capped per process
+(``STATUS_STREAM_MAX``); past the cap the stream endpoint answers 503 and the
+pages fall back to conditional polling of the cached ``/status`` endpoint,
+which answers 304 while the data version is unchanged. Lifting the cap means
+serving the stream routes from an async worker (gevent/eventlet) instead.
+"""
+
+import json
+import logging
+import threading
+import time
+
+logger = logging.getLogger("trackinsights.status_stream")
+
+POLL_INTERVAL_SECONDS = 2.0
+KEEPALIVE_SECONDS = 15.0
+MAX_STREAMS = 8
+
+
+class StatusNotifier:
+    def __init__(self, poll_interval: float = POLL_INTERVAL_SECONDS):
+        self.poll_interval = poll_interval
+        self.version = None
+        self.generation = 0
+        self.open_streams = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._app = None
+        # key -> {"build": callable, "streams": count} for every key with a stream open.
+        self._subscribers = {}
+        # key -> payload built for the current generation.
+        self._payloads = {}
+
+    def start(self, app) -> None:
+        """Start the watcher thread once per process (no-op if already running)."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._app = app
+            self._thread = threading.Thread(target=self._run, name="qualifier-status-notifier", daemon=True)
+            self._thread.start()
+
+    # -- stream slots -------------------------------------------------------
+
+    def acquire_stream(self, max_streams: int) -> bool:
+        """Reserve one of ``max_streams`` stream slots; False when all are taken."""
+        with self._condition:
+            if self.open_streams >= max_streams:
+                return False
+            self.open_streams += 1
+            return True
+
+    def release_stream(self) -> None:
+        with self._condition:
+            self.open_streams = max(self.open_streams - 1, 0)
+
+    # -- subscriptions ------------------------------------------------------
+
+    def subscribe(self, key, build) -> int:
+        """Register a stream for ``key``; returns the generation to wait on."""
+        with self._condition:
+            entry = self._subscribers.setdefault(key, {"build": build, "streams": 0})
+            entry["streams"] += 1
+            return self.generation
+
+    def unsubscribe(self, key) -> None:
+        with self._condition:
+            entry = self._subscribers.get(key)
+            if entry is None:
+                return
+            entry["streams"] -= 1
+            if entry["streams"] <= 0:
+                del self._subscribers[key]
+                self._payloads.pop(key, None)
+
+    def payload(self, key):
+        """The payload broadcast for ``key`` at the current generation, if any."""
+        with self._condition:
+            return self._payloads.get(key)
+
+    # -- watcher ------------------------------------------------------------
+
+    def _current_version(self):
+        from .queries import qualifier_data_version
+
+        with self._app.app_context():
+            return qualifier_data_version()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                version = self._current_version()
+            except Exception as exc:
+                logger.warning(f"Status notifier version check failed: {exc}")
+                version = self.version
+            if version != self.version:
+                self.publish(version)
+            time.sleep(self.poll_interval)
+
+    def publish(self, version) -> None:
+        """Build each subscribed key's payload once and wake every stream."""
+        with self._condition:
+            builds = {key: entry["build"] for key, entry in self._subscribers.items()}
+        payloads = {}
+        if builds:
+            with self._app.app_context():
+                for key, build in builds.items():
+                    try:
+                        payloads[key] = build()
+                    except Exception as exc:
+                        logger.warning(f"Status build for {key} failed: {exc}")
+        with self._condition:
+            self.version = version
+            self._payloads = payloads
+            self.generation += 1
+            self._condition.notify_all()
+
+    def wait(self, generation: int, timeout: float) -> int:
+        """Block until the generation moves past ``generation`` or ``timeout`` elapses."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.generation != generation, timeout=timeout)
+            return self.generation
+
+
+status_notifier = StatusNotifier()
+
+
+def _format_event(payload: dict) -> str:
+    return f"event: status\nid: {payload.get('data_version', '')}\ndata: {json.dumps(payload)}\n\n"
+
+
+def status_event_stream(app, key, build_status, last_event_id=None, keepalive: float = None):
+    """
+    Yield SSE messages for one client.
+
+    ``build_status`` returns the current status payload for ``key`` (the
+    cached ``get_*_qualifiers_status`` result). It is called once on connect,
+    where an event is sent unless the client's ``Last-Event-ID`` already
+    matches; later events are the notifier's broadcast payloads. Comment
+    lines keep proxies from closing idle connections.
+    """
+    keepalive = keepalive or KEEPALIVE_SECONDS
+    status_notifier.start(app)
+    generation = status_notifier.subscribe(key, build_status)
+    try:
+        last_sent = last_event_id
+        with app.app_context():
+            payload = build_status()
+        if payload.get("data_version") != last_sent:
+            last_sent = payload.get("data_version")
+            yield _format_event(payload)
+
+        while True:
+            next_generation = status_notifier.wait(generation, timeout=keepalive)
+            if next_generation == generation:
+                yield ": keepalive\n\n"
+                continue
+            generation = next_generation
+            payload = status_notifier.payload(key)
+            if payload is not None and payload.get("data_version") != last_sent:
+                last_sent = payload.get("data_version")
+                yield _format_event(payload)
+    finally:
+        status_notifier.unsubscribe(key)
@@ -0,0 +1,119 @@
+"""Compact encodings for the precomputed JSON artifacts.
+
+The artifacts are mostly lists of row dicts (``events[].qualifiers``,
+``rows``) that repeat the same keys and many of the same strings (event,
+event_type, school, sectional_host) on every row. ``to_columnar`` rewrites
+every such list as a table of columns, with string columns stored as indexes
+into one dictionary shared by the whole document::
+
+    {"format": "columnar-v1",
+     "strings": ["100 Meters", "Track", ...],
+     "data": {"events": {"$columns": ["event", "place", ...],
+                         "$strings": ["event"],
+                         "$values": [[0, 0, 0], [1, 2, 3]]}, ...}}
+
+``from_columnar`` restores the original payload. ``msgpack`` (optional) packs
+the columnar document into MessagePack for clients that can read it.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import msgpack
+except ImportError:  # optional: only the JSON formats are offered without it
+    msgpack = None
+
+COLUMNAR_FORMAT = "columnar-v1"
+FORMATS = ("json", "columnar", "msgpack")
+MIMETYPES = {
+    "json": "application/json",
+    "columnar": "application/vnd.trackinsights.columnar+json",
+    "msgpack": "application/msgpack",
+}
+
+
+def _is_table(value: Any) -> bool:
+    if not isinstance(value, list) or not value or not all(isinstance(row, dict) for row in value):
+        return False
+    keys = value[0].keys()
+    return bool(keys) and all(row.keys() == keys for row in value)
+
+
+def to_columnar(payload: Any) -> dict:
+    """Encode ``payload`` as a columnar document with a shared string dictionary."""
+    strings: list = []
+    string_ids: dict = {}
+
+    def intern(text: str) -> int:
+        index = string_ids.get(text)
+        if index is None:
+            index = string_ids[text] = len(strings)
+            strings.append(text)
+        return index
+
+    def encode(value: Any) -> Any:
+        if _is_table(value):
+            columns = list(value[0].keys())
+            string_columns = []
+            values = []
+            for column in columns:
+                cells = [row[column] for row in value]
+                if all(isinstance(cell, str) for cell in cells):
+                    string_columns.append(column)
+                    values.append([intern(cell) for cell in cells])
+                else:
+                    values.append([encode(cell) for cell in cells])
+            return {"$columns": columns, "$strings": string_columns, "$values": values}
+        if isinstance(value, dict):
+            return {key: encode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [encode(item) for item in value]
+        return value
+
+    data = encode(payload)
+    return {"format": COLUMNAR_FORMAT, "strings": strings, "data": data}
+
+
+def from_columnar(document: dict) -> Any:
+    """Inverse of ``to_columnar``."""
+    if document.get("format") != COLUMNAR_FORMAT:
+        raise ValueError(f"Unsupported artifact format: {document.get('format')!r}")
+    strings = document["strings"]
+
+    def decode(value: Any) -> Any:
+        if isinstance(value, dict):
+            if "$columns" in value:
+                string_columns = set(value["$strings"])
+                columns = []
+                for column, cells in zip(value["$columns"], value["$values"]):
+                    if column in string_columns:
+                        columns.append([strings[index] for index in cells])
+                    else:
+                        columns.append([decode(cell) for cell in cells])
+                return [dict(zip(value["$columns"], row)) for row in zip(*columns)]
+            return {key: decode(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [decode(item) for item in value]
+        return value
+
+    return decode(document["data"])
+
+
+def encode_payload(payload: Any, fmt: str) -> bytes:
+    """Serialize ``payload`` in one of ``FORMATS`` (minified for the JSON ones)."""
+    if fmt == "json":
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    if fmt == "columnar":
+        return json.dumps(to_columnar(payload), separators=(",", ":")).encode("utf-8")
+    if fmt == "msgpack":
+        if msgpack is None:
+            raise ValueError("msgpack format requires the msgpack package")
+        return msgpack.packb(to_columnar(payload), use_bin_type=True)
+    raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+
+
+def available_formats() -> tuple:
+    return FORMATS if msgpack is not None else FORMATS[:2]
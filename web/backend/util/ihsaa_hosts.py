@@ -0,0 +1,82 @@
+"""Fetch and parse sectional/regional hosts from the IHSAA tournament pages.
+
+Only the offline refresh command (``scripts/refresh_tournament_hosts.py``)
+talks to ihsaa.org. Request handlers read the persisted ``tournament_host``
+table instead.
+"""
+
+import html as html_lib
+import re
+from typing import Dict
+from urllib.request import Request, urlopen
+
+IHSAA_BASE_URL = "https://www.ihsaa.org"
+ROUNDS = {"Sectional": "sectionals", "Regional": "regionals"}
+
+
+def tournament_url(year: int, gender: str, meet_type: str, base_url: str = IHSAA_BASE_URL) -> str:
+    gender_slug = "boys" if str(gender).strip().lower() == "boys" else "girls"
+    parsed_year = int(year)
+    season_slug = f"{parsed_year - 1}-{parsed_year % 100:02d}"
+    return (
+        f"{base_url.rstrip('/')}/sports/{gender_slug}/track-field/"
+        f"{season_slug}-tournament?round={ROUNDS[meet_type]}"
+    )
+
+
+def fetch_tournament_html(year: int, gender: str, meet_type: str, base_url: str = IHSAA_BASE_URL, timeout: float = 20) -> str:
+    request = Request(
+        tournament_url(year, gender, meet_type, base_url),
+        headers={"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"},
+    )
+    with urlopen(request, timeout=timeout) as response:
+        return response.read().decode("utf-8", errors="ignore")
+
+
+def _numbered_host_blocks(html: str, marker: str):
+    """Yield (number, host) for each numbered tournament row containing ``marker``."""
+    paragraphs = re.findall(r"<p[^>]*>.*?</p>", html, flags=re.IGNORECASE | re.DOTALL)
+    for block in paragraphs:
+        lower_block = block.lower()
+        if "in.milesplit.com" not in lower_block or "/results" not in lower_block:
+            continue
+        if marker not in lower_block:
+            continue
+
+        text = re.sub(r"<[^>]+>", " ", block)
+        text = html_lib.unescape(re.sub(r"\s+", " ", text)).strip()
+
+        before_tickets = text.split("Tickets", 1)[0].strip()
+        match = re.match(r"^(\d{1,2})\.\s*(.+)$", before_tickets)
+        if not match:
+            continue
+
+        host = re.sub(
+            r"\s+\d{1,2}(?::\d{2})?\s*[ap]m(?:\s*[A-Z]{2})?$",
+            "",
+            match.group(2).strip(),
+            flags=re.IGNORECASE,
+        ).strip(" -")
+        host = re.sub(r"\s*\(\d+\)\s*$", "", host).strip()
+        yield int(match.group(1)), host
+
+
+def parse_regional_hosts(html: str) -> Dict[int, str]:
+    # The tournament page includes sectional and regional rows together.
+    # Regional rows include "Sectional Host:" in their text.
+    hosts = {}
+    for regional_num, host in _numbered_host_blocks(html, "sectional host:"):
+        if host and regional_num not in hosts:
+            hosts[regional_num] = host
+    return hosts
+
+
+def parse_sectional_hosts(html: str) -> Dict[int, str]:
+    hosts = {}
+    for sectional_num, host in _numbered_host_blocks(html, "schools:"):
+        if 1 <= sectional_num <= 32 and host and sectional_num not in hosts:
+            hosts[sectional_num] = host
+    return hosts
+
+
+PARSERS = {"Sectional": parse_sectional_hosts, "Regional": parse_regional_hosts}
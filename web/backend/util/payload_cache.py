@@ -0,0 +1,95 @@
+"""SQLite-backed JSON payload cache shared by every worker process."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+from typing import Any, Optional
+
+logger = logging.getLogger("trackinsights.payload_cache")
+
+_MISS = object()
+
+
+class PayloadCache:
+    """
+    Store JSON payloads under a key together with the fingerprint of the
+    data they were built from.
+
+    A lookup only hits when the stored fingerprint matches the caller's
+    current one, so entries invalidate themselves as soon as the underlying
+    data changes. The file lives on disk, so every gunicorn worker (and the
+    precompute scripts) share the same entries. Any SQLite/IO error is
+    logged and treated as a miss; the cache never breaks a request.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS payload_cache (
+                    cache_key   TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    payload     TEXT NOT NULL,
+                    created_at  TEXT DEFAULT (datetime('now'))
+                )
+                """
+            )
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def get(self, key: str, fingerprint: str, default: Any = None) -> Any:
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT fingerprint, payload FROM payload_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(f"Payload cache read failed for {key}: {exc}")
+            return default
+
+        if row is None or row[0] != fingerprint:
+            return default
+        return json.loads(row[1])
+
+    def set(self, key: str, fingerprint: str, payload: Any) -> None:
+        try:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO payload_cache (cache_key, fingerprint, payload) VALUES (?, ?, ?)",
+                    (key, fingerprint, json.dumps(payload)),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.warning(f"Payload cache write failed for {key}: {exc}")
+
+    def clear(self, prefix: Optional[str] = None) -> None:
+        try:
+            conn = self._connect()
+            try:
+                if prefix is None:
+                    conn.execute("DELETE FROM payload_cache")
+                else:
+                    conn.execute("DELETE FROM payload_cache WHERE cache_key LIKE ?", (f"{prefix}%",))
+                conn.commit()
+            finally:
+                conn.close()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning(f"Payload cache clear failed: {exc}")
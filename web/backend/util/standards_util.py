@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
 from .conversion_util import Conversion
 
 
@@ -180,21 +184,34 @@ def _resolve_standard_year(year: int | None) -> int:
     return parsed_year
 
 
-def get_state_standard(gender: str, event_name: str, year: int | None = None) -> float | None:
-    resolved_year = _resolve_standard_year(year)
-    clean_gender = (gender or "").strip().title()
-    year_values = _STATE_STANDARD_VALUES.get(resolved_year, {})
-    if clean_gender not in year_values:
-        return None
+def _compile_state_standards() -> Dict[Tuple[int, str, str], Tuple[float, bool]]:
+    """Parse every standard once into (year, gender, event) -> (threshold, lower_is_better)."""
+    table = {}
+    for year, genders in _STATE_STANDARD_VALUES.items():
+        for gender, events in genders.items():
+            for event_name, raw_value in events.items():
+                if _is_field_event(event_name):
+                    threshold = CONVERSION.distance_to_inches(raw_value)
+                else:
+                    threshold = CONVERSION.time_to_seconds(raw_value)
+                if threshold is None:
+                    continue
+                table[(year, gender, event_name)] = (float(threshold), not _is_field_event(event_name))
+    return table
 
-    raw_value = year_values[clean_gender].get(event_name)
-    if raw_value is None:
-        return None
 
-    if _is_field_event(event_name):
-        return CONVERSION.distance_to_inches(raw_value)
+_STATE_STANDARD_TABLE = _compile_state_standards()
 
-    return CONVERSION.time_to_seconds(raw_value)
+
+def get_state_standard_entry(gender: str, event_name: str, year: int | None = None) -> Tuple[float, bool] | None:
+    """Return (threshold, lower_is_better) for an event, or None when there is no standard."""
+    clean_gender = (gender or "").strip().title()
+    return _STATE_STANDARD_TABLE.get((_resolve_standard_year(year), clean_gender, event_name))
+
+
+def get_state_standard(gender: str, event_name: str, year: int | None = None) -> float | None:
+    entry = get_state_standard_entry(gender, event_name, year=year)
+    return entry[0] if entry else None
 
 
 def get_state_standard_display(gender: str, event_name: str, year: int | None = None) -> str | None:
@@ -214,3 +231,31 @@ def meets_state_standard(result2: float, gender: str, event_name: str, event_typ
     if event_type == "Field":
         return result2 >= standard
     return result2 <= standard
+
+
+def meets_state_standard_many(
+    marks: Iterable[float],
+    gender: str,
+    event_name: str,
+    event_type: str | None = None,
+    year: int | None = None,
+) -> np.ndarray:
+    """
+    Vectorized ``meets_state_standard`` for many marks in one event.
+
+    Returns a boolean array aligned with ``marks``; missing marks never meet
+    the standard. ``event_type`` picks the comparison direction like the
+    scalar version; without it the compiled lower-is-better flag is used.
+    """
+    values = np.asarray(list(marks) if not isinstance(marks, np.ndarray) else marks, dtype=float)
+    entry = get_state_standard_entry(gender, event_name, year=year)
+    if entry is None:
+        return np.zeros(values.shape, dtype=bool)
+
+    threshold, lower_is_better = entry
+    if event_type is not None:
+        lower_is_better = event_type != "Field"
+    with np.errstate(invalid="ignore"):
+        if lower_is_better:
+            return values <= threshold
+        return values >= threshold
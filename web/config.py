@@ -2,9 +2,18 @@ import os
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 DATABASE_PATH = os.path.join(BASE_DIR, 'data', 'Track.db')
+QUALIFIER_CACHE_PATH = os.path.join(BASE_DIR, 'data', 'qualifier_cache.db')
+ARTIFACT_STORE_PATH = os.path.join(BASE_DIR, 'data', 'artifact_store')
 
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'change-me')
     SQLALCHEMY_DATABASE_URI = f"sqlite:///{DATABASE_PATH}"
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Shared by all workers; set to '' to disable the qualifier payload cache.
+    QUALIFIER_CACHE_PATH = os.environ.get('QUALIFIER_CACHE_PATH', QUALIFIER_CACHE_PATH)
+    # Published versions of the precomputed JSON; '' serves frontend/static/data directly.
+    ARTIFACT_STORE_PATH = os.environ.get('ARTIFACT_STORE_PATH', ARTIFACT_STORE_PATH)
+    # Open status SSE streams per process; each holds a sync worker thread.
+    # Clients past the cap poll /status with If-None-Match instead.
+    STATUS_STREAM_MAX = int(os.environ.get('STATUS_STREAM_MAX', 8))
     DEBUG = True